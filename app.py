@@ -1,41 +1,33 @@
-import json
+import os
 
 from flask import Flask, render_template, url_for, redirect, flash
 from flask_login import LoginManager, logout_user
-from flask_migrate import Migrate
 from flask_restx import Api
 
 from config.DatabaseInfo import DatabaseInfo
-from config.flask_sqlalchemy_init import db, init_db
+from config.database_engines import make_database_url
+from config.flask_sqlalchemy_init import db, init_db, registry_engine_options
 from controller.api_controller import dummy_api
 from controller.homepage_controller import homepage_blp
 from controller.oauth_controller import oauth_blp
 from models.UserModel import UserModel
 from util.CustomJSONEncoder import CustomJSONEncoder
+from util.metrics import install_request_metrics, metrics_response
 
 app = Flask(__name__)
 db_connection_info = DatabaseInfo()
 
-with open("./config/GoogleAPIKey.json", "r") as f:
-    data = json.load(f)
-    CLIENT_KEY = data["CLIENT_KEY"]
-    SECRET_KEY = data["SECRET_KEY"]
-
 app.json_encoder = CustomJSONEncoder
 app.config.from_mapping(
     SECRET_KEY='test',
-    SQLALCHEMY_DATABASE_URI=(
-        f"{db_connection_info.database}://"
-        f"{db_connection_info.username}:"
-        f"{db_connection_info.password}@"
-        f"{db_connection_info.address}:"
-        f"{db_connection_info.port}/"
-        f"{db_connection_info.database_name}"),
+    SQLALCHEMY_DATABASE_URI=make_database_url(db_connection_info),
+    # db.engine은 이 DatabaseInfo의 공유 engine pool에서 connection을 빌린다 (config/flask_sqlalchemy_init.py)
+    SQLALCHEMY_ENGINE_OPTIONS=registry_engine_options(db_connection_info),
     SQLALCHEMY_TRACK_MODIFICATIONS=False,
     OAUTH2_PROVIDERS={
         'google': {
-            'client_id': CLIENT_KEY,
-            'client_secret': SECRET_KEY,
+            # client_id / client_secret은 처음 로그인할 때 이 파일에서 읽는다 (controller/oauth_controller.py)
+            'credentials_file': './config/GoogleAPIKey.json',
             'authorize_url': 'https://accounts.google.com/o/oauth2/auth',
             'token_url': 'https://accounts.google.com/o/oauth2/token',
             'userinfo': {
@@ -48,7 +40,11 @@ app.config.from_mapping(
 )
 
 init_db(app)
-migrate = Migrate(app, db)
+
+# `flask db ...` (Flask-Migrate) 명령은 flask CLI에서만 쓰므로, alembic import는 그때만 한다
+if os.environ.get("FLASK_RUN_FROM_CLI") == "true":
+    from flask_migrate import Migrate
+    migrate = Migrate(app, db)
 
 login = LoginManager(app)
 login.login_view = 'index'
@@ -71,11 +67,17 @@ def index():
     return render_template('index.html')
 
 
+@app.route('/metrics')
+def metrics():
+    return metrics_response()
+
+
 app.register_blueprint(oauth_blp)
 app.register_blueprint(homepage_blp)
 
 api = Api(app, title='SQLAlchemy API', version='1.0', description='SQLAlchemy API', doc='/docs')
 api.add_namespace(dummy_api)
+install_request_metrics(app, dummy_api.path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,212 @@
+"""
+Benchmark: throughput and peak memory of every table_mapper() generator and of the generic
+create_all_dummy_helper() path, with JSON baselines to catch regressions.
+
+Runs fully offline: the generators only need Faker, and the generic path runs on the Table objects
+declared in models/ (no database connection needed). Every case is timed without tracemalloc,
+then run once more under tracemalloc for its peak Python heap usage. The value pools (util.value_pool)
+are built before the first case, a one-time cost per process that is printed but not part of any case.
+
+usage: python -m benchmark.bench_generators [--sizes 1000,100000,1000000] [--tables booking,flight]
+                                            [--save-baseline benchmark/baselines/generators.json]
+                                            [--baseline benchmark/baselines/generators.json] [--threshold 10]
+
+With --baseline the exit status is 1 if the rows/s of a case dropped more than --threshold percent.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from faker import VERSION as FAKER_VERSION
+from faker import Faker
+from faker_airtravel import AirTravelProvider
+
+from config.flask_sqlalchemy_init import db
+import models  # noqa: F401  (models 등록)
+from util.database_utils import INTERNAL_TABLES, create_all_dummy_helper
+from util.utils import check_generate_num, table_mapper
+from util.value_pool import warm_value_pools
+
+DEFAULT_SIZES = (1000, 100000, 1000000)
+DEFAULT_THRESHOLD = 10.0
+BENCHMARK_SEED = 0
+
+GENERATOR_PATH = 'table_mapper'
+GENERIC_PATH = 'create_all_dummy_helper'
+
+
+def make_fake() -> Faker:
+    fake = Faker()
+    fake.add_provider(AirTravelProvider)
+    fake.seed_instance(BENCHMARK_SEED)
+    return fake
+
+
+def make_cases(tables: Optional[List[str]] = None) -> List[Tuple[str, str, Callable[[Faker, int], Iterator[Dict]]]]:
+    """
+    Builds the (path, table name, row function) cases: one per table_mapper() generator, one per model table.
+    """
+    cases = []
+    for table_name, generator in table_mapper().items():
+        if tables is None or table_name in tables:
+            cases.append((GENERATOR_PATH, table_name, generator))
+    for table in db.metadata.sorted_tables:
+        if table.name not in INTERNAL_TABLES and (tables is None or table.name in tables):
+            cases.append((GENERIC_PATH, table.name,
+                          lambda fake, n, table=table: create_all_dummy_helper(fake, table, n)))
+    return cases
+
+
+def consume(rows: Iterable[Dict]) -> int:
+    count = 0
+    for _ in rows:
+        count += 1
+    return count
+
+
+def check_case(path: str, table_name: str, n: int) -> Optional[str]:
+    """
+    Returns why a generator can not produce n rows (a unique column domain smaller than n), or None.
+    RowPlan finds this out only while generating, run_case() raises it then.
+    """
+    if path == GENERATOR_PATH:
+        try:
+            check_generate_num(table_name, n)
+        except ValueError as e:
+            return str(e)
+    return None
+
+
+def run_case(rows: Callable[[Faker, int], Iterator[Dict]], n: int, repeat: int, memory: bool) -> Dict:
+    """
+    Times a case (best of repeat runs) and measures its peak traced memory in a separate run.
+
+    @raise ValueError: If a unique column domain is smaller than n
+    """
+    best = None
+    for _ in range(repeat):
+        fake = make_fake()
+        gc.collect()
+        start = time.perf_counter()
+        generated = consume(rows(fake, n))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    result = {'rows': generated, 'seconds': round(best, 6), 'rows_per_sec': round(generated / best, 1)}
+    if memory:
+        fake = make_fake()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            consume(rows(fake, n))
+            result['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def case_key(path: str, table_name: str, n: int) -> str:
+    return f"{path}:{table_name}:{n}"
+
+
+def make_environment() -> Dict[str, str]:
+    """
+    Describes the machine and library versions; rows/s are only comparable between similar environments.
+    """
+    return {
+        'python': platform.python_version(),
+        'faker': FAKER_VERSION,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': str(os.cpu_count())
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """
+    Lists the cases whose rows/s dropped more than threshold percent below the baseline.
+    Cases missing from either side, or skipped on either side, are not compared.
+    """
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None or 'rows_per_sec' not in base or 'rows_per_sec' not in result:
+            continue
+        change = (result['rows_per_sec'] / base['rows_per_sec'] - 1) * 100
+        if change < -threshold:
+            regressions.append(f"{key}: {base['rows_per_sec']:.0f} -> {result['rows_per_sec']:.0f} rows/s "
+                               f"({change:+.1f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='comma separated row counts per case')
+    parser.add_argument('--tables', default=None, help='comma separated table names (default: every table)')
+    parser.add_argument('--repeat', type=int, default=1, help='timed runs per case, the best one is kept')
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc peak memory run')
+    parser.add_argument('--save-baseline', default=None, help='write the results to this JSON file')
+    parser.add_argument('--baseline', default=None, help='compare the results to this JSON file')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed rows/s drop against the baseline, in percent')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    tables = args.tables.split(',') if args.tables else None
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+
+    start = time.perf_counter()
+    warm_value_pools()
+    print(f"value pools built in {time.perf_counter() - start:.2f}s\n")
+
+    results = {}
+    print(f"{'case':<50}{'rows/s':>12}{'peak MiB':>10}")
+    for path, table_name, rows in make_cases(tables):
+        for n in sizes:
+            key = case_key(path, table_name, n)
+            reason = check_case(path, table_name, n)
+            if reason is None:
+                try:
+                    result = run_case(rows, n, args.repeat, not args.no_memory)
+                except ValueError as e:
+                    reason = str(e)
+            if reason is not None:
+                results[key] = {'skipped': reason}
+                print(f"{key:<50}{'skipped':>12}")
+                continue
+            results[key] = result
+            peak = f"{result['peak_memory_bytes'] / 2 ** 20:.1f}" if 'peak_memory_bytes' in result else '-'
+            print(f"{key:<50}{result['rows_per_sec']:>12.0f}{peak:>10}")
+
+    if args.save_baseline:
+        directory = os.path.dirname(args.save_baseline)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.save_baseline, 'w', encoding='utf-8') as file:
+            json.dump({'created_at': datetime.now().isoformat(timespec='seconds'),
+                       'environment': make_environment(), 'results': results}, file, indent=2, sort_keys=True)
+            file.write('\n')
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed more than {args.threshold}%:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"\nno case regressed more than {args.threshold}%")
+
+
+if __name__ == '__main__':
+    main()
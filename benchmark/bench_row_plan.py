@@ -0,0 +1,109 @@
+"""
+Benchmark: per-row cost of the generic /generate/all path, before and after compiling a RowPlan.
+
+Runs fully offline on the Table objects declared in models/ (no database connection needed).
+
+usage: python -m benchmark.bench_row_plan [--rows 5000]
+"""
+import argparse
+import random
+import string
+import time
+from typing import Any, Dict, Set
+
+from faker import Faker
+
+from config.flask_sqlalchemy_init import db
+import models  # noqa: F401  (models 등록)
+from util.dummy_generators import make_column_generator
+from util.row_plan import compile_row_plan, get_column_type_detail
+
+LEGACY_CHARSET = string.ascii_letters + string.digits + string.punctuation
+
+
+def legacy_distinct_integer(data_type: str, check_num_duplicate: Set[int]) -> int:
+    """
+    Unique integers as they were drawn before UniqueSampler: random draws retried until unseen.
+    """
+    low, high = (1, 20001) if data_type != "TINYINT" else (0, 2)
+    if len(check_num_duplicate) >= high - low + 1:
+        raise ValueError(f"Cannot generate more than {high - low + 1} unique {data_type} values")
+    generated_int = random.randint(low, high)
+    while generated_int in check_num_duplicate:
+        generated_int = random.randint(low, high)
+    check_num_duplicate.add(generated_int)
+    return generated_int
+
+
+def legacy_distinct_characters(fake: Faker, size: int, check_str_duplicate: Set[str]) -> str:
+    """
+    Unique strings as they were drawn before UniqueSampler: lexify() retried until unseen.
+    """
+    if len(check_str_duplicate) >= len(LEGACY_CHARSET) ** size:
+        raise ValueError(f"Cannot generate more than {len(LEGACY_CHARSET) ** size} unique strings of length {size}")
+    generated_char = fake.lexify('?' * size, letters=LEGACY_CHARSET)
+    while generated_char in check_str_duplicate:
+        generated_char = fake.lexify('?' * size, letters=LEGACY_CHARSET)
+    check_str_duplicate.add(generated_char)
+    return generated_char
+
+
+def legacy_value(fake: Faker, type_detail: Dict[str, Any], check_str_duplicate: Set[str],
+                 check_num_duplicate: Set[int]) -> Any:
+    """
+    One value as it was generated before RowPlan: the type dispatch is resolved again for every value.
+    """
+    data_type = type_detail['type']
+    size = type_detail['size']
+    if type_detail.get('primary') == 'True' or type_detail.get('unique') == 'True':
+        if data_type in ["INTEGER", "SMALLINT", "MEDIUMINT", "TINYINT"]:
+            return legacy_distinct_integer(data_type, check_num_duplicate)
+        if data_type in ["CHAR", "VARCHAR"] and size:
+            return legacy_distinct_characters(fake, size, check_str_duplicate)
+    return make_column_generator(fake, type_detail)()
+
+
+def legacy_rows(fake, table, n):
+    """
+    Row generation as it was done before RowPlan: type detail parsing and dispatch for every column of every row.
+    """
+    check_str_duplicate = set()
+    check_num_duplicate = set()
+    for _ in range(n):
+        data_row = {}
+        for column in table.columns:
+            if str(column.autoincrement) == "True":
+                continue
+            type_detail = get_column_type_detail(table, column)
+            data_row[column.name] = legacy_value(fake, type_detail, check_str_duplicate, check_num_duplicate)
+        yield data_row
+
+
+def time_rows(rows) -> float:
+    start = time.perf_counter()
+    for _ in rows:
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=5000, help='rows generated per table')
+    args = parser.parse_args()
+
+    fake = Faker()
+    print(f"{'table':<20}{'legacy us/row':>15}{'plan us/row':>15}{'speedup':>10}")
+    total_legacy = total_plan = 0.0
+    for table in db.metadata.sorted_tables:
+        Faker.seed(0)
+        legacy = time_rows(legacy_rows(fake, table, args.rows))
+        Faker.seed(0)
+        plan = time_rows(compile_row_plan(fake, table).generate_rows(args.rows))
+        total_legacy += legacy
+        total_plan += plan
+        print(f"{table.name:<20}{legacy / args.rows * 1e6:>15.1f}{plan / args.rows * 1e6:>15.1f}{legacy / plan:>9.2f}x")
+    print(f"{'total':<20}{total_legacy:>14.2f}s{total_plan:>14.2f}s{total_legacy / total_plan:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: serialization of a /show/table/data response, before and after util.serializer.
+
+The legacy path is json.dumps(cls=CustomJSONEncoder) -> json.loads -> jsonify (a third json.dumps).
+Rows are generated offline with the flight_log generator, so no database connection is needed.
+
+usage: python -m benchmark.bench_serializer [--rows 100000]
+"""
+import argparse
+import json
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from faker import Faker
+from faker_airtravel import AirTravelProvider
+
+from util.CustomJSONEncoder import CustomJSONEncoder
+from util.dummy_generators import generate_flight_log_data
+from util.serializer import SERIALIZER_BACKEND, dumps, iter_json_array, iter_ndjson
+
+
+def make_rows(n):
+    """
+    flight_log rows plus the types the DB driver returns that the generator does not produce (TIME, DECIMAL).
+    """
+    fake = Faker()
+    fake.add_provider(AirTravelProvider)
+    fake.seed_instance(0)
+    rows = []
+    for i, row in enumerate(generate_flight_log_data(fake, n)):
+        row['flight_log_id'] = i + 1
+        row['duration'] = timedelta(seconds=i % 86400)
+        row['price'] = Decimal(i) / 100
+        rows.append(row)
+    return rows
+
+
+def legacy_dumps(page):
+    """
+    The pre-serializer path; jsonify uses compact separators and sorted keys outside of debug mode.
+    """
+    serialized_data = json.loads(json.dumps(page, cls=CustomJSONEncoder))
+    return json.dumps(serialized_data, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+def measure(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000, help='rows in the serialized table')
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    page = {'rows': rows, 'next_after': None}
+
+    # 새 경로도 같은 JSON 값을 만들어야 한다 (key 순서만 다름)
+    assert json.loads(dumps(page)) == json.loads(legacy_dumps(page))
+
+    results = [
+        ('legacy dumps/loads/jsonify', measure(lambda: legacy_dumps(page))),
+        (f'dumps ({SERIALIZER_BACKEND})', measure(lambda: dumps(page))),
+        (f'iter_json_array ({SERIALIZER_BACKEND})', measure(lambda: b''.join(iter_json_array(rows)))),
+        (f'iter_ndjson ({SERIALIZER_BACKEND})', measure(lambda: b''.join(iter_ndjson(rows)))),
+    ]
+    legacy = results[0][1]
+    print(f"{'path':<34}{'seconds':>10}{'rows/s':>12}{'speedup':>10}")
+    for name, elapsed in results:
+        print(f"{name:<34}{elapsed:>10.3f}{args.rows / elapsed:>12.0f}{legacy / elapsed:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Startup budget: imports the Flask app in fresh interpreters with the network disabled and fails if the import
+is slower than the budget or touches the database.
+
+Importing the app must not connect anywhere (engines, the inspector, create_all() and the OAuth key file are
+all deferred to the first request), so every socket connect raises during the import. The slowest modules of
+the best run are listed from `python -X importtime`.
+
+usage: python -m benchmark.bench_startup [--module app] [--budget 2.0] [--repeat 3] [--top 15]
+
+tests/test_startup.py runs the same check on every test run; this script adds the per-module breakdown.
+
+The exit status is 1 if the import failed (e.g. it tried to connect) or the best run exceeded --budget seconds.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_MODULE = 'app'
+DEFAULT_BUDGET = 2.0
+DEFAULT_REPEAT = 3
+DEFAULT_TOP = 15
+
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 자식 프로세스에서 실행: 모든 socket 연결을 막고 module을 import한 시간을 JSON으로 출력한다
+IMPORT_SCRIPT = """
+import json, socket, sys, time
+
+def refuse(self, address):
+    raise ConnectionRefusedError(f"network access during import: {address}")
+
+socket.socket.connect = refuse
+socket.socket.connect_ex = refuse
+start = time.perf_counter()
+__import__(sys.argv[1])
+print(json.dumps({'seconds': time.perf_counter() - start}))
+"""
+
+
+def run_import(module: str, importtime: bool = True) -> Tuple[Optional[float], str, str]:
+    """
+    Imports the module once in a new interpreter with every socket connect refused.
+
+    @param module: Module to import
+    @param importtime: If True, run with -X importtime (see slowest_imports())
+    @return: (import seconds or None if the import failed, importtime report, error output)
+    """
+    options = ['-X', 'importtime'] if importtime else []
+    process = subprocess.run(
+        [sys.executable, *options, '-c', IMPORT_SCRIPT, module],
+        cwd=REPOSITORY_ROOT, capture_output=True, text=True
+    )
+    if process.returncode != 0:
+        return None, process.stderr, process.stderr
+    return json.loads(process.stdout.strip().splitlines()[-1])['seconds'], process.stderr, ''
+
+
+def slowest_imports(report: str, top: int) -> List[Tuple[int, str]]:
+    """
+    Parses an -X importtime report into its top modules by cumulative microseconds.
+    """
+    imports: Dict[str, int] = {}
+    for line in report.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit():
+            imports[name.strip()] = int(cumulative)
+    return sorted(((us, name) for name, us in imports.items()), reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--module', default=DEFAULT_MODULE, help='module to import (default: the Flask app)')
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET, help='allowed import seconds')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='imports, the fastest one is kept')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help='number of slowest modules to list')
+    args = parser.parse_args()
+
+    best, best_report = None, ''
+    for _ in range(args.repeat):
+        seconds, report, error = run_import(args.module)
+        if seconds is None:
+            print(f"import {args.module} failed:\n{error}", file=sys.stderr)
+            sys.exit(1)
+        if best is None or seconds < best:
+            best, best_report = seconds, report
+
+    print(f"{'module':<60}{'cumulative ms':>14}")
+    for us, name in slowest_imports(best_report, args.top):
+        print(f"{name:<60}{us / 1000:>14.1f}")
+    print(f"\nimport {args.module}: {best:.3f}s (best of {args.repeat}, budget {args.budget:.3f}s)")
+    if best > args.budget:
+        print(f"import {args.module} is over budget by {best - args.budget:.3f}s", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
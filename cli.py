@@ -0,0 +1,233 @@
+"""
+Headless bulk generation: generates dummy data and inserts it straight into the database with the same
+generators and insert path as the generation worker, without the Flask app, the login or the job queue.
+
+usage: python cli.py generate --table flight --rows 10000000 [--workers 16] [--batch 5000] [--seed 42]
+                              [--load-strategy insert|load_data] [--truncate] [--no-stream]
+       python cli.py generate-all --rows 100000 [--relational] [--table-counts airport=300,booking=100000]
+                                  [--batch 5000] [--seed 42] [--truncate] [--no-stream]
+
+Connection options (--host, --port, --user, --password, --database) override config/DatabaseInfo.py.
+Progress (rows, rows/s, ETA) is written to stderr, the JSON summary to stdout:
+
+    python cli.py generate --table flight --rows 10000000 --workers 16 > summary.json
+
+The exit status is 0 if the rows were inserted, 1 if the generation failed and 2 for invalid arguments.
+"""
+import argparse
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional, TextIO
+
+from config.DatabaseInfo import DatabaseInfo
+from config.database_engines import dispose_engines, get_engine
+from util.database_utils import DEFAULT_CHUNK_SIZE
+from util.job_queue import count_job_rows, run_job
+from util.profiling import profiled
+from util.relational_generator import check_relational_generate_num
+from util.serializer import default
+from util.utils import check_generate_num, table_mapper
+
+# terminal이면 한 줄을 덮어쓰고, 파일/pipe면 (cron, CI 로그) 가끔 한 줄씩 쓴다
+TTY_PROGRESS_INTERVAL = 0.5
+LOG_PROGRESS_INTERVAL = 10.0
+
+
+class ProgressDisplay:
+    def __init__(self, total: int, stream: TextIO = sys.stderr, interval: Optional[float] = None):
+        """
+        Progress callback for run_job() that shows rows done, percentage, rows/s and ETA.
+
+        @param total: Number of rows that will be inserted (see util.job_queue.count_job_rows())
+        @param stream: Output stream of the display
+        @param interval: Seconds between two updates (default: depends on whether stream is a terminal)
+        """
+        self.total = total
+        self.stream = stream
+        self.is_tty = stream.isatty()
+        if interval is None:
+            interval = TTY_PROGRESS_INTERVAL if self.is_tty else LOG_PROGRESS_INTERVAL
+        self.interval = interval
+        self.start = time.perf_counter()
+        self.last_update = 0.0
+        self.rows_done = 0
+
+    def __call__(self, rows_done: int) -> None:
+        self.rows_done = rows_done
+        now = time.perf_counter()
+        if now - self.last_update < self.interval:
+            return
+        self.last_update = now
+        self.show(now)
+
+    def show(self, now: float) -> None:
+        elapsed = now - self.start
+        rows_per_sec = self.rows_done / elapsed if elapsed > 0 else 0.0
+        line = f"{self.rows_done:,}/{self.total:,} rows"
+        if self.total:
+            line += f" ({self.rows_done / self.total:.1%})"
+        line += f"  {rows_per_sec:,.0f} rows/s  {format_seconds(elapsed)} elapsed"
+        if rows_per_sec > 0 and self.rows_done < self.total:
+            line += f"  ETA {format_seconds((self.total - self.rows_done) / rows_per_sec)}"
+        if self.is_tty:
+            self.stream.write(f"\r\033[K{line}")
+        else:
+            self.stream.write(f"{line}\n")
+        self.stream.flush()
+
+    def finish(self, rows_done: int) -> None:
+        """
+        Shows the final state and ends the progress line.
+
+        @param rows_done: Number of rows inserted in total
+        """
+        self.rows_done = rows_done
+        self.show(time.perf_counter())
+        if self.is_tty:
+            self.stream.write("\n")
+            self.stream.flush()
+
+
+def format_seconds(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:d}:{minutes:02d}:{seconds:02d}"
+
+
+def parse_table_counts(value: str) -> Dict[str, int]:
+    """
+    Parses --table-counts: comma separated table=count pairs (e.g. 'airport=300,booking=100000').
+    """
+    table_counts = {}
+    for pair in filter(None, value.split(',')):
+        table_name, _, count = pair.partition('=')
+        if table_name not in table_mapper() or not count.isdigit():
+            raise argparse.ArgumentTypeError(f"invalid table count: {pair}")
+        table_counts[table_name] = int(count)
+    return table_counts
+
+
+def positive_int(value: str) -> int:
+    if not value.isdigit() or int(value) < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return int(value)
+
+
+def non_negative_int(value: str) -> int:
+    if not value.isdigit():
+        raise argparse.ArgumentTypeError(f"must be a non-negative integer: {value}")
+    return int(value)
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--rows', type=non_negative_int, required=True, help='number of rows (per table)')
+    common.add_argument('--batch', type=positive_int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'rows per INSERT statement (default {DEFAULT_CHUNK_SIZE})')
+    common.add_argument('--seed', type=non_negative_int, default=None,
+                        help='the same arguments and seed always generate the same rows')
+    common.add_argument('--truncate', action='store_true', help='delete the existing rows first (mode y)')
+    common.add_argument('--no-stream', action='store_true',
+                        help='generate every row before inserting instead of overlapping both')
+    common.add_argument('--profile', action='store_true',
+                        help='profile the run into the profile ring (see util/profiling.py)')
+    database_info = DatabaseInfo()
+    common.add_argument('--host', default=database_info.address)
+    common.add_argument('--port', type=positive_int, default=database_info.port)
+    common.add_argument('--user', default=database_info.username)
+    common.add_argument('--password', default=database_info.password)
+    common.add_argument('--database', default=database_info.database_name)
+
+    commands = parser.add_subparsers(dest='command', required=True)
+    generate = commands.add_parser('generate', parents=[common], help='generate one table (like /generate/table)')
+    generate.add_argument('--table', required=True, choices=sorted(table_mapper()), help='table name')
+    generate.add_argument('--workers', type=positive_int, default=1, help='number of generator processes')
+    generate.add_argument('--load-strategy', choices=('insert', 'load_data'), default='insert',
+                          help='load_data uses MySQL LOAD DATA LOCAL INFILE and falls back to insert')
+
+    generate_all = commands.add_parser('generate-all', parents=[common],
+                                       help='generate every table (like /generate/all)')
+    generate_all.add_argument('--relational', action='store_true',
+                              help='generate in foreign key order, drawing foreign keys from the parent tables')
+    generate_all.add_argument('--table-counts', type=parse_table_counts, default={},
+                              help='table=count pairs overriding --rows (relational only)')
+    return parser
+
+
+def make_job(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Builds the job run_job() executes from the parsed arguments, with the same parameters the /generate
+    endpoints would queue.
+
+    @param args: Parsed command line arguments
+    @return: Dictionary with 'kind' and 'params' (see util.job_queue.enqueue_job())
+    @raise ValueError: If the table can not get that many rows
+    """
+    params = {
+        'generate_num': args.rows,
+        'mode': 'y' if args.truncate else 'n',
+        'chunk_size': args.batch,
+        'stream': not args.no_stream,
+        'seed': args.seed
+    }
+    if args.command == 'generate':
+        check_generate_num(args.table, args.rows)
+        params.update(table_name=args.table, workers=args.workers, load_strategy=args.load_strategy)
+        return {'kind': 'table', 'params': params}
+
+    if args.table_counts and not args.relational:
+        raise ValueError("--table-counts requires --relational")
+    if args.relational:
+        check_relational_generate_num({table_name: args.table_counts.get(table_name, args.rows)
+                                       for table_name in table_mapper()})
+    params.update(relational=args.relational, table_counts=args.table_counts)
+    return {'kind': 'all', 'params': params}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = make_parser()
+    args = parser.parse_args(argv)
+    try:
+        job = make_job(args)
+    except ValueError as e:
+        parser.error(str(e))
+
+    database_info = DatabaseInfo()
+    database_info.address = args.host
+    database_info.port = args.port
+    database_info.username = args.user
+    database_info.password = args.password
+    database_info.database_name = args.database
+
+    summary = {'command': args.command, 'params': job['params']}
+    start = time.perf_counter()
+    try:
+        engine = get_engine(database_info)
+        display = ProgressDisplay(count_job_rows(engine, job['kind'], job['params']))
+        with profiled(f"cli-{args.command}", enabled=args.profile) as profile:
+            report = run_job(engine, job, display)
+        rows = sum(r['rows'] for r in report) if isinstance(report, list) else report['rows']
+        display.finish(rows)
+        elapsed = time.perf_counter() - start
+        summary.update(
+            status='done',
+            rows=rows,
+            elapsed=round(elapsed, 4),
+            rows_per_sec=round(rows / elapsed, 2) if elapsed > 0 else None,
+            report=report,
+            profile=profile['name']
+        )
+    except Exception as e:
+        summary.update(status='failed', error=f"{type(e).__name__}: {e}",
+                       elapsed=round(time.perf_counter() - start, 4))
+    finally:
+        dispose_engines()
+
+    print(json.dumps(summary, default=default))
+    return 0 if summary['status'] == 'done' else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
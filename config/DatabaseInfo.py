@@ -11,6 +11,16 @@ class DatabaseInfo:
         self._PORT = 3306
         self._DATABASE_NAME = 'airportdb'
         self._CHARSET = 'utf8mb4'
+        # Allow LOAD DATA LOCAL INFILE on every client connection (the server must allow it too).
+        # Off: load_dummy_data() opens its own connection with it (see util/load_data.local_infile_connection())
+        self._LOCAL_INFILE = False
+        # Connection pool of the shared engine (see config/database_engines.get_engine())
+        self._POOL_SIZE = 5
+        self._MAX_OVERFLOW = 10
+        self._POOL_RECYCLE = 3600
+        self._POOL_PRE_PING = True
+        # Connections opened up front in a new server worker (see config/database_engines.warm_pool())
+        self._POOL_WARM_SIZE = 2
 
     @property
     def database(self) -> str:
@@ -123,3 +133,99 @@ class DatabaseInfo:
         @param new_charset: New character set as a string.
         """
         self._CHARSET = new_charset
+
+    @property
+    def local_infile(self) -> bool:
+        """
+        Gets whether the client allows LOAD DATA LOCAL INFILE.
+        :return: True if LOCAL INFILE is enabled on the client side.
+        """
+        return self._LOCAL_INFILE
+
+    @local_infile.setter
+    def local_infile(self, enabled: bool) -> None:
+        """
+        Enables or disables LOAD DATA LOCAL INFILE on the client side.
+        @param enabled: True to allow LOCAL INFILE.
+        """
+        self._LOCAL_INFILE = enabled
+
+    @property
+    def pool_size(self) -> int:
+        """
+        Gets the number of connections kept open in the pool.
+        :return: Pool size as an integer.
+        """
+        return self._POOL_SIZE
+
+    @pool_size.setter
+    def pool_size(self, new_pool_size: int) -> None:
+        """
+        Sets the number of connections kept open in the pool.
+        @param new_pool_size: New pool size as an integer.
+        """
+        self._POOL_SIZE = new_pool_size
+
+    @property
+    def max_overflow(self) -> int:
+        """
+        Gets the number of connections allowed above pool_size.
+        :return: Max overflow as an integer.
+        """
+        return self._MAX_OVERFLOW
+
+    @max_overflow.setter
+    def max_overflow(self, new_max_overflow: int) -> None:
+        """
+        Sets the number of connections allowed above pool_size.
+        @param new_max_overflow: New max overflow as an integer.
+        """
+        self._MAX_OVERFLOW = new_max_overflow
+
+    @property
+    def pool_recycle(self) -> int:
+        """
+        Gets the number of seconds after which a pooled connection is replaced.
+        :return: Pool recycle time in seconds (-1 disables recycling).
+        """
+        return self._POOL_RECYCLE
+
+    @pool_recycle.setter
+    def pool_recycle(self, new_pool_recycle: int) -> None:
+        """
+        Sets the number of seconds after which a pooled connection is replaced.
+        @param new_pool_recycle: New pool recycle time in seconds (-1 disables recycling).
+        """
+        self._POOL_RECYCLE = new_pool_recycle
+
+    @property
+    def pool_pre_ping(self) -> bool:
+        """
+        Gets whether pooled connections are tested before they are handed out.
+        :return: True if pre-ping is enabled.
+        """
+        return self._POOL_PRE_PING
+
+    @pool_pre_ping.setter
+    def pool_pre_ping(self, enabled: bool) -> None:
+        """
+        Enables or disables testing pooled connections before they are handed out.
+        @param enabled: True to enable pre-ping.
+        """
+        self._POOL_PRE_PING = enabled
+
+    @property
+    def pool_warm_size(self) -> int:
+        """
+        Gets the number of connections opened up front when a server worker starts.
+        :return: Pool warm size as an integer (0 disables pre-warming).
+        """
+        return self._POOL_WARM_SIZE
+
+    @pool_warm_size.setter
+    def pool_warm_size(self, new_pool_warm_size: int) -> None:
+        """
+        Sets the number of connections opened up front when a server worker starts.
+        @param new_pool_warm_size: New pool warm size as an integer (0 disables pre-warming).
+        """
+        self._POOL_WARM_SIZE = new_pool_warm_size
@@ -1,14 +1,63 @@
-from typing import Tuple
+import os
+import threading
+from typing import Dict, List, Tuple, Optional
+
+from sqlalchemy import create_engine, Engine, event, text
+from sqlalchemy.pool import NullPool
 
-from sqlalchemy import create_engine, Engine, text, inspect, Inspector
 from util.error.error_handler import exception_handler
+from util.inspector_cache import (
+    CachedInspector,
+    clear_cached_inspectors,
+    get_cached_inspector,
+    install_ddl_invalidation
+)
+from util.metrics import InstrumentedQueuePool, install_pool_metrics
 from .DatabaseInfo import DatabaseInfo
 
+# 프로세스 전체에서 DatabaseInfo 하나당 engine 하나만 만든다 (Flask-SQLAlchemy, controller, worker 공용)
+_engines: Dict[Tuple, Engine] = {}
+_bootstrapped = set()
+_registry_lock = threading.Lock()
+_bootstrap_lock = threading.Lock()
+
+
+def make_engine_key(db_info: DatabaseInfo) -> Tuple:
+    """
+    Builds the registry key of a DatabaseInfo: every setting that changes the engine it creates.
+
+    @param db_info: DatabaseInfo object containing the database connection information
+    @return: Tuple of connection and pool settings
+    """
+    return (
+        db_info.database, db_info.username, db_info.password, db_info.address, db_info.port,
+        db_info.database_name, db_info.charset, db_info.local_infile,
+        db_info.pool_size, db_info.max_overflow, db_info.pool_recycle, db_info.pool_pre_ping
+    )
+
+
+def make_database_url(db_info: DatabaseInfo) -> str:
+    """
+    Builds the SQLAlchemy URL of the application database.
+
+    @param db_info: DatabaseInfo object containing the database connection information
+    @return: Database URL as a string
+    """
+    database_connection_string = (
+        f'{db_info.database}://{db_info.username}:{db_info.password}@'
+        f'{db_info.address}:{db_info.port}/{db_info.database_name}?'
+        f'charset={db_info.charset}'
+    )
+    if db_info.local_infile:
+        database_connection_string += '&local_infile=1'
+    return database_connection_string
+
 
 @exception_handler
 def create_engine_connection(db_info: DatabaseInfo) -> Engine:
     """
     Creates a connection engine for MySQL initialization.
+    The engine does not pool connections; dispose it right after use (see bootstrap_database()).
 
     @param db_info: DatabaseInfo object containing the database connection information
     @return: Successfully created SQLAlchemy engine object
@@ -21,7 +70,8 @@ def create_engine_connection(db_info: DatabaseInfo) -> Engine:
     )
     engine = create_engine(
         engine_connection_string,
-        echo=False
+        echo=False,
+        poolclass=NullPool
     )
     return engine
 
@@ -33,42 +83,171 @@ def create_database_connection(db_info: DatabaseInfo) -> Engine:
 
     This function uses SQLAlchemy's create_engine function to create an engine
     for connecting to a MySQL database. If the connection fails, it prints an error message.
+    Use get_engine() instead to share one engine (and one pool) per DatabaseInfo.
 
     @param db_info: DatabaseInfo object containing the database connection information
     @return: Successfully created SQLAlchemy engine object
     @raise Exception: Raises an exception if there is an error in creating the connection
     """
-    database_connection_string = (
-        f'{db_info.database}://{db_info.username}:{db_info.password}@'
-        f'{db_info.address}:{db_info.port}/{db_info.database_name}?'
-        f'charset={db_info.charset}'
-    )
-
     engine = create_engine(
-        database_connection_string,
-        echo=False
+        make_database_url(db_info),
+        echo=False,
+        poolclass=InstrumentedQueuePool,
+        pool_size=db_info.pool_size,
+        max_overflow=db_info.max_overflow,
+        pool_recycle=db_info.pool_recycle,
+        pool_pre_ping=db_info.pool_pre_ping
     )
     return engine
 
 
-def initialize_engine(db_info: DatabaseInfo) -> Tuple[Engine, Inspector]:
+def bootstrap_database(db_info: DatabaseInfo) -> None:
     """
-    Initializes the SQLAlchemy engine and inspector
+    Creates the application database with the root account if it does not exist,
+    then disposes the root engine so no root connection stays open.
 
     @param db_info: DatabaseInfo object containing the database connection information
-    @return: Tuple containing the SQLAlchemy engine and inspector objects
     """
-
     # DDL Setting
     engine = create_engine_connection(db_info)
-    # Change MySQL DDL to flask-SQLAlchemy, flask-Migrate
-    # execute_sql_file(engine, "models/airport-ddl.sql")
-    with engine.connect() as connection:
-        stmt = text("CREATE DATABASE IF NOT EXISTS airportdb;")
-        connection.execute(stmt)
-        connection.commit()
-
-    # DB Connection Setting
-    db_connection_engine = create_database_connection(db_info)
-    inspector = inspect(db_connection_engine)
-    return db_connection_engine, inspector
\ No newline at end of file
+    try:
+        # Change MySQL DDL to flask-SQLAlchemy, flask-Migrate
+        # execute_sql_file(engine, "models/airport-ddl.sql")
+        with engine.connect() as connection:
+            stmt = text(f"CREATE DATABASE IF NOT EXISTS `{db_info.database_name}`;")
+            connection.execute(stmt)
+            connection.commit()
+    finally:
+        engine.dispose()
+
+
+def install_lazy_bootstrap(engine: Engine, db_info: DatabaseInfo) -> None:
+    """
+    Runs bootstrap_database() right before the engine opens its first DBAPI connection (once per database),
+    so creating an engine never touches the server.
+
+    @param engine: Engine created by create_database_connection()
+    @param db_info: DatabaseInfo object the engine was created from
+    """
+    bootstrap_key = make_engine_key(db_info)[:6]
+
+    @event.listens_for(engine, 'do_connect')
+    def bootstrap_before_connect(dialect, conn_rec, cargs, cparams):
+        if bootstrap_key in _bootstrapped:
+            return None
+        with _bootstrap_lock:
+            if bootstrap_key not in _bootstrapped:
+                bootstrap_database(db_info)
+                _bootstrapped.add(bootstrap_key)
+        # None: SQLAlchemy가 평소처럼 연결한다
+        return None
+
+
+def get_engine(db_info: Optional[DatabaseInfo] = None) -> Engine:
+    """
+    Returns the shared engine of a DatabaseInfo, creating the engine on the first call.
+    Nothing connects until the engine is used: the database is created on its first connection
+    (see install_lazy_bootstrap()).
+
+    @param db_info: DatabaseInfo object containing the database connection information (default: DatabaseInfo())
+    @return: SQLAlchemy engine object shared by every caller with the same settings
+    """
+    db_info = db_info or DatabaseInfo()
+    key = make_engine_key(db_info)
+    with _registry_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = create_database_connection(db_info)
+            install_lazy_bootstrap(engine, db_info)
+            install_ddl_invalidation(engine)
+            _engines[key] = engine
+        return engine
+
+
+def registered_engines() -> List[Engine]:
+    """
+    Returns the engines currently in the registry (e.g. for the pool gauges of util.metrics).
+
+    @return: List of shared engines
+    """
+    with _registry_lock:
+        return list(_engines.values())
+
+
+def get_inspector(db_info: Optional[DatabaseInfo] = None) -> CachedInspector:
+    """
+    Returns the shared, TTL-bounded inspector cache of the engine of a DatabaseInfo (see util/inspector_cache.py).
+
+    @param db_info: DatabaseInfo object containing the database connection information (default: DatabaseInfo())
+    @return: CachedInspector with the Inspector methods used by the application
+    """
+    return get_cached_inspector(get_engine(db_info))
+
+
+@exception_handler
+def warm_pool(db_info: Optional[DatabaseInfo] = None, size: Optional[int] = None) -> int:
+    """
+    Opens connections up front and leaves them idle in the shared engine's pool, so the first requests
+    of a new server worker do not pay for the connection setup. Call it after the fork (see gunicorn.conf.py),
+    never at import time.
+
+    @param db_info: DatabaseInfo object containing the database connection information (default: DatabaseInfo())
+    @param size: Number of idle connections to have (default: db_info.pool_warm_size, at most db_info.pool_size)
+    @return: Number of idle connections in the pool afterwards (None if connecting failed)
+    """
+    db_info = db_info or DatabaseInfo()
+    size = min(db_info.pool_warm_size if size is None else size, db_info.pool_size)
+    engine = get_engine(db_info)
+    # 동시에 빌려야 pool이 서로 다른 connection을 size개 연다
+    connections = []
+    try:
+        for _ in range(size):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+    return engine.pool.checkedin()
+
+
+def dispose_inherited_engines() -> None:
+    """
+    Drops the pooled connections a forked child inherited from its parent, without closing them:
+    the sockets still belong to the parent. The engines stay registered and open new connections
+    in the child on first use.
+
+    Runs automatically in every forked child (os.register_at_fork), e.g. gunicorn --preload workers.
+    """
+    global _registry_lock, _bootstrap_lock
+    # fork 시점에 다른 thread가 잡고 있던 lock은 child에서 풀리지 않으므로 새로 만든다
+    # (fork 직후 child에는 이 thread 하나뿐이라 lock 없이 registry를 읽어도 된다)
+    _registry_lock = threading.Lock()
+    _bootstrap_lock = threading.Lock()
+    for engine in _engines.values():
+        engine.dispose(close=False)
+
+
+def dispose_engines() -> None:
+    """
+    Disposes every registered engine and empties the registry.
+    """
+    with _registry_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+    clear_cached_inspectors()
+
+
+def initialize_engine(db_info: DatabaseInfo) -> Tuple[Engine, CachedInspector]:
+    """
+    Initializes the SQLAlchemy engine and inspector
+
+    @param db_info: DatabaseInfo object containing the database connection information
+    @return: Tuple containing the shared SQLAlchemy engine and inspector objects (see get_engine())
+    """
+    return get_engine(db_info), get_inspector(db_info)
+
+
+install_pool_metrics(registered_engines)
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=dispose_inherited_engines)
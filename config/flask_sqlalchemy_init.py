@@ -1,9 +1,65 @@
+import threading
+from typing import Any, Dict
+
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.pool import NullPool
+
+from config.DatabaseInfo import DatabaseInfo
+from config.database_engines import get_engine
+from util.error.error_handler import exception_handler
+from util.inspector_cache import invalidate_metadata_caches
 
 db = SQLAlchemy()
 
 
-def init_db(app):
+def registry_engine_options(db_info: DatabaseInfo) -> Dict[str, Any]:
+    """
+    Builds SQLALCHEMY_ENGINE_OPTIONS that make db.engine borrow its connections from the shared engine of db_info
+    (see config/database_engines.get_engine()), so Flask-SQLAlchemy does not open a pool of its own.
+
+    The creator hook checks a connection out of the shared pool and NullPool hands it back there when the session
+    releases it. get_engine() is looked up on every checkout, so a forked worker uses the pool it recreated.
+
+    @param db_info: DatabaseInfo object of SQLALCHEMY_DATABASE_URI
+    @return: Engine options for app.config['SQLALCHEMY_ENGINE_OPTIONS']
+    """
+    return {
+        'creator': lambda: get_engine(db_info).raw_connection(),
+        'poolclass': NullPool
+    }
+
+
+@exception_handler
+def create_tables(app):
+    """
+    Creates the missing tables of the models (db.create_all()).
+
+    @param app: Flask app initialized with init_db()
+    @return: True if the tables exist now (None if it failed, the traceback is printed by exception_handler)
+    """
     with app.app_context():
-        db.init_app(app)
-        db.create_all()
\ No newline at end of file
+        db.create_all()
+    # create_all() 로 테이블이 새로 생겼을 수 있으므로 reflection / inspector cache를 비운다
+    invalidate_metadata_caches()
+    return True
+
+
+def init_db(app):
+    """
+    Binds db to the app without connecting: the tables are created before the first request is handled,
+    so importing the app (tests, workers, `flask db` commands) needs no database.
+
+    @param app: Flask app
+    """
+    db.init_app(app)
+    tables_created = threading.Event()
+    lock = threading.Lock()
+
+    @app.before_request
+    def create_tables_once():
+        if tables_created.is_set():
+            return
+        with lock:
+            # 실패하면 (DB가 꺼져있으면) 요청은 그대로 처리하고 다음 요청에서 다시 시도한다
+            if not tables_created.is_set() and create_tables(app):
+                tables_created.set()
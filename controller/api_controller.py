@@ -1,41 +1,57 @@
-import json
-
-from faker import Faker
-from faker_airtravel import AirTravelProvider
-from flask import jsonify, request, send_file
+from flask import Response, jsonify, request, stream_with_context
 from flask_login import current_user
 from flask_restx import Namespace, Resource
 
 from config.DatabaseInfo import DatabaseInfo
-from config.database_engines import initialize_engine
-from util.CustomJSONEncoder import CustomJSONEncoder
+from config.database_engines import get_engine, get_inspector
 from util.database_utils import (
-    insert_dummy_data,
-    print_table,
+    parse_keyset,
+    read_table_page,
+    stream_table_rows,
+    get_schema_column_details,
     get_view_list_details,
     make_column_details_dictionary,
     get_ddl_script,
-    create_all_dummy
+    get_table_metadata,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE
+)
+from util.ddl_export import DDL_BUNDLE_FORMATS, ddl_bundle_cache
+from util.faker_pool import pooled_faker
+from util.job_queue import enqueue_job, get_job
+from util.profiling import (
+    PROFILE_SORT_KEYS,
+    get_profile_path,
+    is_profile_requested,
+    list_profiles,
+    profile_request,
+    render_profile
 )
-from util.utils import table_mapper
+from util.relational_generator import check_relational_generate_num
+from util.row_plan import compile_row_plan
+from util.serializer import dumps, iter_ndjson
+from util.utils import check_generate_num, table_mapper
 
-dummy_api = Namespace(name='dummy', path='/home/api', description='Dummy API')
-db_connection_engine, inspector = initialize_engine(db_info=DatabaseInfo())
+# engine과 inspector는 import 시점이 아니라 요청을 처리할 때 가져온다 (registry가 DatabaseInfo마다 하나씩 만든다)
+dummy_api = Namespace(name='dummy', path='/home/api', description='Dummy API', decorators=[profile_request])
 
 
 @dummy_api.route("/generate/table", methods=["GET"])
-@dummy_api.doc(params={'generate_num': 'Number of dummy data to generate', 'table_name': 'Table name', 'mode': 'y or n. If y, initialize the database before insert'}, responses={200: 'success', 401: 'unauthorized'})
+@dummy_api.doc(params={'generate_num': 'Number of dummy data to generate', 'table_name': 'Table name', 'mode': 'y or n. If y, initialize the database before insert', 'chunk_size': f'Rows per INSERT statement (default {DEFAULT_CHUNK_SIZE})', 'stream': 'y or n. If y (default), generate and insert concurrently with bounded memory', 'workers': 'Number of generator processes (default 1)', 'load_strategy': "insert (default) or load_data. load_data uses MySQL LOAD DATA LOCAL INFILE and falls back to insert if it is disabled", 'seed': 'Optional non-negative integer. The same table_name, generate_num and seed always generate the same rows, cached on disk after the first run'}, responses={200: 'success', 401: 'unauthorized'})
 @dummy_api.header('content-type', 'application/json')
 class GenerateDummy(Resource):
-    @dummy_api.response(200, description="Inserts the specified number of dummy data into the table and returns a success message.")
+    @dummy_api.response(200, description="Queues a job that inserts the specified number of dummy data into the table and returns its job_id.")
     def get(self):
-        fake = Faker()
-        fake.add_provider(AirTravelProvider)
-
         if current_user.is_authenticated:
             generate_num = request.get_json().get('generate_num')
             table_name = request.get_json().get('table_name')
             mode = request.get_json().get('mode')
+            chunk_size = str(request.get_json().get('chunk_size', DEFAULT_CHUNK_SIZE))
+            stream = request.get_json().get('stream', 'y') in ('y', 'Y')
+            workers = str(request.get_json().get('workers', 1))
+            load_strategy = request.get_json().get('load_strategy', 'insert')
+            seed = request.get_json().get('seed')
 
             if not generate_num or not generate_num.isdigit():
                 return jsonify({"error": "Invalid generate_num parameter"})
@@ -43,10 +59,34 @@ class GenerateDummy(Resource):
             if table_name not in table_mapper():
                 return jsonify({"error": "Invalid table_name parameter"})
 
+            if not chunk_size.isdigit() or int(chunk_size) < 1:
+                return jsonify({"error": "Invalid chunk_size parameter"})
+
+            if not workers.isdigit() or int(workers) < 1:
+                return jsonify({"error": "Invalid workers parameter"})
+
+            if load_strategy not in ('insert', 'load_data'):
+                return jsonify({"error": "Invalid load_strategy parameter"})
+
+            if seed is not None and not str(seed).isdigit():
+                return jsonify({"error": "Invalid seed parameter"})
+
+            params = {
+                'generate_num': int(generate_num),
+                'table_name': table_name,
+                'mode': mode,
+                'chunk_size': int(chunk_size),
+                'stream': stream,
+                'workers': int(workers),
+                'load_strategy': load_strategy,
+                'seed': int(seed) if seed is not None else None,
+                'profile': is_profile_requested()
+            }
             try:
-                dummy_data = table_mapper()[table_name](fake, int(generate_num))
-                insert_dummy_data(db_connection_engine, table_name, dummy_data, mode)
-                return jsonify({"success": "Dummy data inserted successfully"})
+                check_generate_num(table_name, int(generate_num))
+                job_id = enqueue_job(get_engine(), 'table', params)
+                return jsonify({"success": "Dummy data generation job queued", "job_id": job_id,
+                                "status_url": f"{dummy_api.path}/jobs/{job_id}"})
             except Exception as e:
                 return jsonify({"error": str(e)})
         else:
@@ -54,32 +94,75 @@ class GenerateDummy(Resource):
 
 
 @dummy_api.route("/generate/all", methods=["GET"])
-@dummy_api.doc(params={'generate_num': 'Number of dummy data to generate', 'table_name': 'Table name', 'mode': 'y or n. If y, initialize the database before insert'}, responses={200: 'success', 401: 'unauthorized'})
+@dummy_api.doc(params={'generate_num': 'Number of dummy data to generate', 'mode': 'y or n. If y, initialize the database before insert', 'chunk_size': f'Rows per INSERT statement (default {DEFAULT_CHUNK_SIZE})', 'stream': 'y or n. If y (default), generate and insert concurrently with bounded memory', 'seed': 'Optional non-negative integer. The same generate_num and seed always generate the same rows', 'relational': 'y or n (default). If y, generate the tables in foreign key order and draw every foreign key from the keys inserted into its parent table', 'table_counts': 'Optional object of table name -> number of rows overriding generate_num (relational only)'}, responses={200: 'success', 401: 'unauthorized'})
 @dummy_api.header('content-type', 'application/json')
 class GenerateDummyAtOnce(Resource):
-    @dummy_api.response(200, description="Inserts the specified number of dummy data into the table and returns a success message.")
+    @dummy_api.response(200, description="Queues a job that inserts the specified number of dummy data into the table and returns its job_id.")
     def get(self):
-        fake = Faker()
-        fake.add_provider(AirTravelProvider)
-
         if current_user.is_authenticated:
             generate_num = request.get_json().get('generate_num')
             mode = request.get_json().get('mode')
+            chunk_size = str(request.get_json().get('chunk_size', DEFAULT_CHUNK_SIZE))
+            stream = request.get_json().get('stream', 'y') in ('y', 'Y')
+            seed = request.get_json().get('seed')
+            relational = request.get_json().get('relational', 'n') in ('y', 'Y')
+            table_counts = request.get_json().get('table_counts') or {}
 
             if not generate_num or not generate_num.isdigit():
                 return jsonify({"error": "Invalid generate_num parameter"})
 
+            if not chunk_size.isdigit() or int(chunk_size) < 1:
+                return jsonify({"error": "Invalid chunk_size parameter"})
+
+            if seed is not None and not str(seed).isdigit():
+                return jsonify({"error": "Invalid seed parameter"})
+
+            if not isinstance(table_counts, dict) or (table_counts and not relational) or \
+                    any(table_name not in table_mapper() or not str(count).isdigit()
+                        for table_name, count in table_counts.items()):
+                return jsonify({"error": "Invalid table_counts parameter"})
+
+            params = {
+                'generate_num': int(generate_num),
+                'mode': mode,
+                'chunk_size': int(chunk_size),
+                'stream': stream,
+                'seed': int(seed) if seed is not None else None,
+                'relational': relational,
+                'table_counts': {table_name: int(count) for table_name, count in table_counts.items()},
+                'profile': is_profile_requested()
+            }
             try:
-                create_all_dummy(engine=db_connection_engine, fake=fake, n=int(generate_num), mode=mode)
-                return jsonify({"success": "Dummy data inserted successfully"})
+                if relational:
+                    counts = {table_name: params['table_counts'].get(table_name, params['generate_num'])
+                              for table_name in table_mapper()}
+                    check_relational_generate_num(counts)
+                job_id = enqueue_job(get_engine(), 'all', params)
+                return jsonify({"success": "Dummy data generation job queued", "job_id": job_id,
+                                "status_url": f"{dummy_api.path}/jobs/{job_id}"})
             except Exception as e:
                 return jsonify({"error": str(e)})
         else:
             return jsonify({"error": "Unauthorized"})
 
 
+@dummy_api.route("/jobs/<int:job_id>", methods=["GET"])
+@dummy_api.doc(params={'job_id': 'ID returned by /generate/table or /generate/all'}, responses={200: 'success', 401: 'unauthorized'})
+@dummy_api.header('content-type', 'application/json')
+class GetGenerationJob(Resource):
+    @dummy_api.response(200, description="Show the state, progress (rows_done / rows_total, rows_per_sec), report and error of a generation job")
+    def get(self, job_id):
+        if not current_user.is_authenticated:
+            return jsonify({"error": "Unauthorized"})
+
+        job = get_job(get_engine(), job_id)
+        if job is None:
+            return jsonify({"error": "Invalid job_id"})
+        return Response(dumps(job), mimetype='application/json')
+
+
 @dummy_api.route("/show/table/data", methods=["GET"])
-@dummy_api.doc(params={'table_name': 'Table name'}, responses={200: 'success', 401: 'unauthorized'})
+@dummy_api.doc(params={'table_name': 'Table name', 'after': 'Opaque cursor: the next_after value of the previous page', 'limit': f'Rows per page (default {DEFAULT_PAGE_SIZE}, max {MAX_PAGE_SIZE}). With format=ndjson the default is the whole table', 'format': 'json (default, one page) or ndjson (streamed, one row per line)'}, responses={200: 'success', 401: 'unauthorized'})
 @dummy_api.header('content-type', 'application/json')
 class GetDummy(Resource):
     @dummy_api.response(200, description="Show specific table's row data")
@@ -88,9 +171,30 @@ class GetDummy(Resource):
             return jsonify({"error": "Unauthorized"})
         else:
             table_name = request.args.get('table_name')
-            data = print_table(engine=db_connection_engine, table_name=table_name)
-            serialized_data = json.loads(json.dumps(data, cls=CustomJSONEncoder))
-            return jsonify(serialized_data)
+            limit = request.args.get('limit')
+            response_format = request.args.get('format', 'json')
+
+            table = get_table_metadata(get_engine(), table_name) if table_name else None
+            if table is None:
+                return jsonify({"error": "Invalid table_name parameter"})
+
+            if response_format not in ('json', 'ndjson'):
+                return jsonify({"error": "Invalid format parameter"})
+
+            if limit is not None and (not limit.isdigit() or not 1 <= int(limit) <= MAX_PAGE_SIZE):
+                return jsonify({"error": "Invalid limit parameter"})
+
+            try:
+                after = parse_keyset(table, request.args.get('after'))
+            except ValueError as e:
+                return jsonify({"error": str(e)})
+
+            if response_format == 'ndjson':
+                rows = stream_table_rows(get_engine(), table, after, int(limit) if limit else None)
+                return Response(stream_with_context(iter_ndjson(rows)), mimetype='application/x-ndjson')
+
+            page = read_table_page(get_engine(), table, after, int(limit) if limit else DEFAULT_PAGE_SIZE)
+            return Response(dumps(page), mimetype='application/json')
 
 
 @dummy_api.route("/show/schema/list", methods=["GET"])
@@ -102,7 +206,7 @@ class GetSchemaList(Resource):
         if not current_user.is_authenticated:
             return jsonify({"error": "Unauthorized"})
         else:
-            return jsonify({"schema_list": inspector.get_schema_names()})
+            return jsonify({"schema_list": get_inspector().get_schema_names()})
 
 
 @dummy_api.route("/show/table/list", methods=["GET"])
@@ -118,10 +222,10 @@ class GetTableList(Resource):
         if not schema_name:
             return jsonify({"error": "Schema name is required"})
 
-        if schema_name not in inspector.get_schema_names():
+        if schema_name not in get_inspector().get_schema_names():
             return jsonify({"error": "Invalid schema name"})
 
-        table_list = inspector.get_table_names(schema_name)
+        table_list = get_inspector().get_table_names(schema_name)
         return jsonify({schema_name: table_list})
 
 
@@ -138,13 +242,11 @@ class GetTableListDetail(Resource):
         if not schema_name:
             return jsonify({"error": "Schema name is required"})
 
-        if schema_name not in inspector.get_schema_names():
+        if schema_name not in get_inspector().get_schema_names():
             return jsonify({"error": "Invalid schema name"})
 
-        result = []
-        tables = inspector.get_table_names(schema_name)
-        for table in tables:
-            result.append(make_column_details_dictionary(db_connection_engine, inspector, table, DatabaseInfo()))
+        column_details = get_schema_column_details(get_engine(), get_inspector(), schema_name)
+        result = [{table: columns} for table, columns in column_details.items()]
 
         return jsonify(
             {
@@ -166,10 +268,10 @@ class GetViewListDetail(Resource):
         if not schema_name:
             return jsonify({"error": "Schema name is required"})
 
-        if schema_name not in inspector.get_schema_names():
+        if schema_name not in get_inspector().get_schema_names():
             return jsonify({"error": "Invalid schema name"})
 
-        view_list = inspector.get_view_names(schema_name)
+        view_list = get_inspector().get_view_names(schema_name)
         return jsonify({schema_name: view_list})
 
 
@@ -186,10 +288,10 @@ class GetViewListDetail(Resource):
         if not schema_name:
             return jsonify({"error": "Schema name is required"})
 
-        if schema_name not in inspector.get_schema_names():
+        if schema_name not in get_inspector().get_schema_names():
             return jsonify({"error": "Invalid schema name"})
 
-        result = get_view_list_details(db_connection_engine, inspector, DatabaseInfo())
+        result = get_view_list_details(get_engine(), get_inspector(), DatabaseInfo())
         return jsonify(
             {
                 schema_name: result
@@ -214,7 +316,7 @@ class GetTableInformation(Resource):
         if table_name not in table_mapper().keys():
             return jsonify({"error": "Invalid schema name"})
 
-        result = [make_column_details_dictionary(db_connection_engine, inspector, table_name, DatabaseInfo())]
+        result = [make_column_details_dictionary(get_engine(), get_inspector(), table_name, DatabaseInfo())]
         return jsonify(
             {
                 table_name: result
@@ -240,11 +342,98 @@ class GetTableDDL(Resource):
         if table_name not in table_mapper().keys():
             return jsonify({"error": "Invalid schema name"})
 
-        ddl = get_ddl_script(db_connection_engine, table_name)
+        ddl = get_ddl_script(get_engine(), table_name)
+
+        return Response(
+            str(ddl),
+            mimetype='application/sql',
+            headers={'Content-Disposition': f'attachment; filename={table_name}.sql'}
+        )
+
+
+@dummy_api.route("/show/schema/ddl", methods=['GET'])
+@dummy_api.doc(params={'format': f"{' or '.join(DDL_BUNDLE_FORMATS)} (default sql). sql returns one script, zip one <table>.sql per table"}, responses={200: 'success', 304: 'not modified', 401: 'unauthorized', 400: 'bad request'})
+@dummy_api.header('content-type', 'application/json')
+class GetSchemaDDL(Resource):
+    @dummy_api.response(200, description="Download the DDL of every table of the schema")
+    def get(self):
+        if not current_user.is_authenticated:
+            return jsonify({"error": "Unauthorized"})
 
-        file_path = f"./ddl_tmp/{table_name}.sql"
-        with open(file_path, "w") as ddl_file:
-            ddl_file.write(str(ddl))
+        bundle_format = request.args.get('format', 'sql')
+        if bundle_format not in DDL_BUNDLE_FORMATS:
+            return jsonify({"error": f"format must be one of {', '.join(DDL_BUNDLE_FORMATS)}"})
 
-        return send_file(file_path, as_attachment=True, download_name=f"{table_name}.sql")
+        content, etag = ddl_bundle_cache.get_bundle(get_engine(), bundle_format)
+        database_name = DatabaseInfo().database_name
+        response = Response(
+            content,
+            mimetype='application/zip' if bundle_format == 'zip' else 'application/sql',
+            headers={'Content-Disposition': f'attachment; filename={database_name}.{bundle_format}'}
+        )
+        response.set_etag(etag)
+        return response.make_conditional(request)
+
+
+@dummy_api.route("/show/table/plan", methods=['GET'])
+@dummy_api.doc(params={'table_name': 'Table name'}, responses={200: 'success', 401: 'unauthorized', 400: 'bad request'})
+@dummy_api.header('content-type', 'application/json')
+class GetTableRowPlan(Resource):
+    @dummy_api.response(200, description="Show the compiled row generation plan used by /generate/all for a table")
+    def get(self):
+        if not current_user.is_authenticated:
+            return jsonify({"error": "Unauthorized"})
+
+        table_name = request.args.get('table_name')
+
+        if not table_name:
+            return jsonify({"error": "Table name is required"})
+
+        table = get_table_metadata(get_engine(), table_name)
+        if table is None:
+            return jsonify({"error": "Invalid table name"})
+
+        with pooled_faker() as fake:
+            plan = compile_row_plan(fake, table)
+            return jsonify({table_name: plan.describe()})
+
+
+@dummy_api.route("/profiles", methods=['GET'])
+@dummy_api.doc(responses={200: 'success', 401: 'unauthorized'})
+@dummy_api.header('content-type', 'application/json')
+class GetProfileList(Resource):
+    @dummy_api.response(200, description="List the saved profiles of requests and jobs sent with the X-Profile header, newest first")
+    def get(self):
+        if not current_user.is_authenticated:
+            return jsonify({"error": "Unauthorized"})
+        return jsonify({"profiles": list_profiles()})
+
+
+@dummy_api.route("/profiles/<string:name>", methods=['GET'])
+@dummy_api.doc(params={'name': 'Profile name from /profiles', 'format': 'text (default, pstats report) or pstats (raw file for snakeviz, gprof2dot, ...)', 'sort': f"{' or '.join(PROFILE_SORT_KEYS)} (default cumulative, text only)", 'limit': 'Number of functions in the text report (default 50)'}, responses={200: 'success', 401: 'unauthorized', 400: 'bad request'})
+@dummy_api.header('content-type', 'application/json')
+class GetProfile(Resource):
+    @dummy_api.response(200, description="Show or download a saved profile")
+    def get(self, name):
+        if not current_user.is_authenticated:
+            return jsonify({"error": "Unauthorized"})
 
+        response_format = request.args.get('format', 'text')
+        sort = request.args.get('sort', 'cumulative')
+        limit = request.args.get('limit', '50')
+
+        if response_format not in ('text', 'pstats'):
+            return jsonify({"error": "Invalid format parameter"})
+
+        if not limit.isdigit() or int(limit) < 1:
+            return jsonify({"error": "Invalid limit parameter"})
+
+        try:
+            if response_format == 'pstats':
+                with open(get_profile_path(name), 'rb') as file:
+                    content = file.read()
+                return Response(content, mimetype='application/octet-stream',
+                                headers={'Content-Disposition': f'attachment; filename={name}'})
+            return Response(render_profile(name, sort, int(limit)), mimetype='text/plain')
+        except ValueError as e:
+            return jsonify({"error": str(e)})
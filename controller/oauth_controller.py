@@ -1,6 +1,8 @@
 from flask import Blueprint, redirect, url_for, abort, session, request, flash, current_app
 from urllib.parse import urlencode
 from flask_login import current_user, login_user, logout_user
+import functools
+import json
 import secrets
 import requests
 from models.UserModel import UserModel
@@ -9,12 +11,38 @@ from config.flask_sqlalchemy_init import db
 oauth_blp = Blueprint('OAUTHBLUEPRINT', __name__)
 
 
+@functools.lru_cache(maxsize=None)
+def read_client_credentials(path):
+    """
+    Reads the OAuth client key file once per process.
+
+    @param path: Path of the JSON file with CLIENT_KEY and SECRET_KEY
+    @return: Dictionary with 'client_id' and 'client_secret'
+    """
+    with open(path, "r") as f:
+        data = json.load(f)
+    return {'client_id': data["CLIENT_KEY"], 'client_secret': data["SECRET_KEY"]}
+
+
+def get_provider_data(provider):
+    """
+    Returns the OAUTH2_PROVIDERS entry of a provider, with the client credentials of its credentials_file.
+
+    @param provider: Provider name (e.g. 'google')
+    @return: Provider settings, or None if the provider is unknown
+    """
+    provider_data = current_app.config['OAUTH2_PROVIDERS'].get(provider)
+    if provider_data and 'credentials_file' in provider_data:
+        provider_data = {**provider_data, **read_client_credentials(provider_data['credentials_file'])}
+    return provider_data
+
+
 @oauth_blp.route("/authorize/<provider>")
 def oauth2_authorize(provider):
     if not current_user.is_anonymous:
         return redirect(url_for('index'))
 
-    provider_data = current_app.config['OAUTH2_PROVIDERS'].get(provider)
+    provider_data = get_provider_data(provider)
     if not provider_data:
         abort(404)
 
@@ -36,7 +64,7 @@ def oauth2_callback(provider):
     if not current_user.is_anonymous:
         return redirect(url_for('HOMEPAGEBLUEPRINT.home'))
 
-    provider_data = current_app.config['OAUTH2_PROVIDERS'].get(provider)
+    provider_data = get_provider_data(provider)
     if provider_data is None:
         abort(404)
 
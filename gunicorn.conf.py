@@ -0,0 +1,27 @@
+"""
+gunicorn settings for serving the Flask app with pre-forked workers.
+
+usage: gunicorn -c gunicorn.conf.py app:app
+
+The app is imported once in the master (preload_app) and the workers are forked from it. Importing the app
+opens no connection, and every forked worker drops the pooled connections it may have inherited
+(config/database_engines.dispose_inherited_engines()), then opens DatabaseInfo().pool_warm_size
+connections of its own before it takes requests.
+"""
+import os
+
+from config.database_engines import dispose_inherited_engines, warm_pool
+
+bind = os.environ.get('GUNICORN_BIND', '127.0.0.1:8000')
+workers = int(os.environ.get('GUNICORN_WORKERS', 4))
+preload_app = True
+
+
+def post_fork(server, worker):
+    # os.register_at_fork로도 실행되지만, gunicorn이 fork 방식을 바꿔도 worker마다 확실히 비운다
+    dispose_inherited_engines()
+    idle = warm_pool()
+    if idle is None:
+        server.log.warning(f"Worker {worker.pid}: could not warm the database pool, connecting on first use")
+    else:
+        server.log.info(f"Worker {worker.pid}: {idle} pooled database connections warmed")
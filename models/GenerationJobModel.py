@@ -0,0 +1,24 @@
+from config.flask_sqlalchemy_init import db
+
+
+class GenerationJobModel(db.Model):
+    __tablename__ = 'generation_job'
+
+    job_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    kind = db.Column(db.Enum('table', 'all'), nullable=False)
+    params = db.Column(db.JSON, nullable=False)
+    state = db.Column(db.Enum('queued', 'running', 'done', 'failed'), nullable=False, default='queued')
+    rows_total = db.Column(db.BigInteger, nullable=False)
+    rows_done = db.Column(db.BigInteger, nullable=False, default=0)
+    rows_per_sec = db.Column(db.Float)
+    report = db.Column(db.JSON)
+    error = db.Column(db.Text)
+    worker = db.Column(db.String(100))
+    created_at = db.Column(db.DateTime, nullable=False)
+    started_at = db.Column(db.DateTime)
+    heartbeat_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+    __table_args__ = (
+        db.Index('job_state_idx', 'state', 'job_id'),
+    )
@@ -10,6 +10,7 @@ from . import (
     FlightLogModel,
     FlightScheduleModel,
     FlightModel,
+    GenerationJobModel,
     PassengerDetailsModel,
     Passenger,
     UserModel,
@@ -0,0 +1,118 @@
+"""
+The typed JSON codec of util/serializer.py and the dataset cache built on it (util/dataset_cache.py).
+
+usage: python -m unittest tests.test_dataset_cache
+"""
+import json
+import os
+import stat
+import tempfile
+import unittest
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from util import dataset_cache
+from util.serializer import decode_typed_column, decode_typed_value, encode_typed_column, encode_typed_value
+
+COLUMNS = {
+    'bool': [True, False, None],
+    'int': [0, -1, 2 ** 63, None],
+    'float': [0.1, -2.5e300, None],
+    'str': ['', 'a,"b"', 'ü\n\t', None],
+    'decimal': [Decimal('12.30'), Decimal('-0.001'), None],
+    'date': [date(2024, 2, 29), None],
+    'datetime': [datetime(2024, 2, 29, 23, 59, 59, 999999), datetime(1970, 1, 1), None],
+    'time': [time(0, 0), time(7, 8, 9, 10), None],
+    'timedelta': [timedelta(days=2, seconds=3), timedelta(0), None],
+    # bool은 int, datetime은 date의 subclass이므로 섞여도 타입이 유지되어야 한다
+    'mixed': [1, True, 1.0, '1', Decimal('1'), date(2024, 1, 1), datetime(2024, 1, 1), None],
+    'empty': [None, None]
+}
+
+
+def through_json(value):
+    return json.loads(json.dumps(value))
+
+
+class TypedCodecTest(unittest.TestCase):
+    def assertSameValues(self, decoded, values):
+        self.assertEqual(decoded, values)
+        self.assertEqual([type(value) for value in decoded], [type(value) for value in values])
+
+    def test_columns_round_trip_losslessly(self):
+        for kind, values in COLUMNS.items():
+            with self.subTest(kind=kind):
+                self.assertSameValues(decode_typed_column(through_json(encode_typed_column(values))), values)
+
+    def test_values_round_trip_losslessly(self):
+        for kind, values in COLUMNS.items():
+            for value in filter(lambda value: value is not None, values):
+                with self.subTest(kind=kind, value=value):
+                    self.assertSameValues([decode_typed_value(through_json(encode_typed_value(value)))], [value])
+
+    def test_malformed_input_raises_value_error(self):
+        for pair in (['nope', 1], ['date', 'x'], ['decimal', 'x'], 'int', None):
+            with self.subTest(pair=pair):
+                with self.assertRaises(ValueError):
+                    decode_typed_value(pair)
+        with self.assertRaises(ValueError):
+            decode_typed_column(['mixed', [['int']]])
+        with self.assertRaises(ValueError):
+            encode_typed_value(object())
+
+
+class DatasetCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.directory.name, 'cache')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_cache_hit_returns_the_generated_rows(self):
+        for table_name in ('booking', 'weatherdata', 'employee'):
+            with self.subTest(table_name=table_name):
+                generated = list(dataset_cache.get_seeded_dataset(table_name, 300, 7, cache_dir=self.cache_dir))
+                self.assertTrue(dataset_cache.is_dataset_cached(table_name, 300, 7, self.cache_dir))
+                cached = list(dataset_cache.get_seeded_dataset(table_name, 300, 7, cache_dir=self.cache_dir))
+                self.assertEqual(cached, generated)
+                self.assertEqual([{key: type(value) for key, value in row.items()} for row in cached],
+                                 [{key: type(value) for key, value in row.items()} for row in generated])
+
+    def test_directory_is_private(self):
+        list(dataset_cache.get_seeded_dataset('airline', 10, 1, cache_dir=self.cache_dir))
+        self.assertEqual(stat.S_IMODE(os.stat(self.cache_dir).st_mode), 0o700)
+
+        os.chmod(self.cache_dir, 0o777)
+        with self.assertRaises(PermissionError):
+            dataset_cache.get_seeded_dataset('airline', 10, 1, cache_dir=self.cache_dir)
+
+        link = os.path.join(self.directory.name, 'link')
+        os.chmod(self.cache_dir, 0o700)
+        os.symlink(self.cache_dir, link)
+        with self.assertRaises(PermissionError):
+            dataset_cache.ensure_cache_dir(link)
+
+    def test_eviction_keeps_the_cache_under_its_size_limit(self):
+        for seed in range(4):
+            list(dataset_cache.get_seeded_dataset('airline', 50, seed, cache_dir=self.cache_dir))
+        sizes = [entry.stat().st_size for entry in os.scandir(self.cache_dir)]
+        # 가장 최근 파일 하나와 그 절반 정도만 남도록 제한한다
+        path = dataset_cache.dataset_cache_path('airline', 50, 99, self.cache_dir)
+        list(dataset_cache.write_dataset(path, dataset_cache.generate_seeded_rows('airline', 50, 99),
+                                         max_bytes=max(sizes) * 2))
+        remaining = os.listdir(self.cache_dir)
+        self.assertIn(os.path.basename(path), remaining)
+        self.assertLessEqual(len(remaining), 2)
+
+    def test_files_that_are_not_datasets_are_rejected(self):
+        os.makedirs(self.cache_dir, mode=0o700)
+        path = dataset_cache.dataset_cache_path('airline', 10, 1, self.cache_dir)
+        with open(path, 'wb') as file:
+            file.write(b'\x80\x04not a dataset')
+        with self.assertRaises(ValueError):
+            list(dataset_cache.get_seeded_dataset('airline', 10, 1, cache_dir=self.cache_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
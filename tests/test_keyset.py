@@ -0,0 +1,102 @@
+"""
+Keyset pagination (util/database_utils.py): cursors round-trip every primary key type and paging reads every row
+once, on an in-memory SQLite database.
+
+usage: python -m unittest tests.test_keyset
+"""
+import unittest
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from sqlalchemy import Column, Date, DateTime, Integer, MetaData, Numeric, String, Table, Time, create_engine, insert
+from sqlalchemy.pool import StaticPool
+
+from util.database_utils import encode_keyset, parse_keyset, read_table_page
+
+
+def page_through(engine, table, limit):
+    """
+    Reads a table page by page the way API clients do, passing next_after back as the cursor.
+    """
+    rows, after = [], None
+    while True:
+        page = read_table_page(engine, table, parse_keyset(table, after), limit)
+        rows.extend(page['rows'])
+        after = page['next_after']
+        if after is None:
+            return rows
+
+
+class KeysetTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine('sqlite://', poolclass=StaticPool, connect_args={'check_same_thread': False})
+        self.metadata = MetaData()
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def make_table(self, *columns, rows):
+        table = Table(f"t{len(self.metadata.tables)}", self.metadata, *columns)
+        table.create(self.engine)
+        with self.engine.begin() as connection:
+            connection.execute(insert(table), rows)
+        return table
+
+    def test_composite_int_datetime_key_pages_over_every_row(self):
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        rows = [
+            {'station': station, 'logged_at': start + timedelta(minutes=minute, microseconds=minute),
+             'temp': minute}
+            # 같은 station 안에서 datetime 순서가 페이지 경계를 넘도록
+            for station in (3, 1, 2) for minute in range(37)
+        ]
+        table = self.make_table(
+            Column('station', Integer, primary_key=True, autoincrement=False),
+            Column('logged_at', DateTime, primary_key=True),
+            Column('temp', Integer),
+            rows=rows
+        )
+        for limit in (1, 7, 37, 200):
+            with self.subTest(limit=limit):
+                paged = page_through(self.engine, table, limit)
+                keys = [(row['station'], row['logged_at']) for row in paged]
+                self.assertEqual(keys, sorted((row['station'], row['logged_at']) for row in rows))
+
+    def test_string_key_with_separators_pages_over_every_row(self):
+        rows = [{'code': code} for code in ('a,b', 'a', 'a b', 'z"', '[1]', 'ü', '%2C', '')]
+        table = self.make_table(Column('code', String(10), primary_key=True), rows=rows)
+        paged = page_through(self.engine, table, 3)
+        self.assertEqual([row['code'] for row in paged], sorted(row['code'] for row in rows))
+
+    def test_cursor_round_trips_every_key_type(self):
+        table = Table(
+            'keys', self.metadata,
+            Column('i', Integer, primary_key=True), Column('s', String(10), primary_key=True),
+            Column('n', Numeric(10, 2), primary_key=True), Column('d', Date, primary_key=True),
+            Column('dt', DateTime, primary_key=True), Column('t', Time, primary_key=True)
+        )
+        row = {'i': -5, 's': 'a,"b"', 'n': Decimal('12.30'), 'd': date(2024, 2, 29),
+               'dt': datetime(2024, 2, 29, 23, 59, 59, 999999), 't': time(7, 8, 9, 10)}
+        keyset = parse_keyset(table, encode_keyset(table, row))
+        self.assertEqual(keyset, tuple(row.values()))
+        self.assertEqual([type(value) for value in keyset], [type(value) for value in row.values()])
+
+    def test_mysql_time_timedelta_is_a_time_of_day(self):
+        table = Table('times', self.metadata, Column('t', Time, primary_key=True))
+        # pymysql는 TIME을 timedelta로 준다
+        self.assertEqual(parse_keyset(table, encode_keyset(table, {'t': timedelta(hours=7, seconds=9)})),
+                         (time(7, 0, 9),))
+
+    def test_invalid_cursors_raise_value_error(self):
+        table = Table('ints', self.metadata, Column('i', Integer, primary_key=True),
+                      Column('j', Integer, primary_key=True))
+        self.assertIsNone(parse_keyset(table, None))
+        for after in ('2000', '!!!', encode_keyset(Table('one', self.metadata, Column('i', Integer, primary_key=True)),
+                                                    {'i': 1})):
+            with self.subTest(after=after):
+                with self.assertRaises(ValueError):
+                    parse_keyset(table, after)
+
+
+if __name__ == '__main__':
+    unittest.main()
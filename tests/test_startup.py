@@ -0,0 +1,29 @@
+"""
+Startup budget: importing the Flask app must not connect anywhere and must stay under the import budget
+(see benchmark/bench_startup.py for the per-module breakdown).
+
+usage: python -m unittest tests.test_startup
+"""
+import os
+import unittest
+
+from benchmark.bench_startup import DEFAULT_BUDGET, DEFAULT_MODULE, DEFAULT_REPEAT, run_import
+
+# 느린 CI machine에서는 환경변수로 늘린다
+STARTUP_BUDGET = float(os.environ.get('STARTUP_BUDGET', DEFAULT_BUDGET))
+
+
+class StartupBudgetTest(unittest.TestCase):
+    def test_app_imports_without_network_within_budget(self):
+        timings = []
+        for _ in range(DEFAULT_REPEAT):
+            seconds, _, error = run_import(DEFAULT_MODULE, importtime=False)
+            # import 중 socket 연결을 시도하면 ConnectionRefusedError로 import가 실패한다
+            self.assertIsNotNone(seconds, f"import {DEFAULT_MODULE} failed:\n{error}")
+            timings.append(seconds)
+        self.assertLessEqual(min(timings), STARTUP_BUDGET,
+                             f"import {DEFAULT_MODULE} took {min(timings):.3f}s, budget {STARTUP_BUDGET:.3f}s")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Invariants of util/unique_sampler.py and the sharded generation built on it (util/parallel_generator.py).
+
+usage: python -m unittest tests.test_unique_sampler
+"""
+import unittest
+
+from util.dataset_cache import SEEDED_REFERENCE_TIME
+from util.parallel_generator import generate_parallel
+from util.unique_sampler import UniqueSampler
+
+# 아주 작은 도메인과 2의 거듭제곱 경계 전후 (cycle walking이 필요한 경우)
+CAPACITIES = (1, 2, 3, 4, 5, 17, 255, 256, 257, 20001, 32767)
+
+
+class UniqueSamplerTest(unittest.TestCase):
+    def test_draws_every_index_once(self):
+        for capacity in CAPACITIES:
+            with self.subTest(capacity=capacity):
+                self.assertEqual(sorted(UniqueSampler(capacity, seed=7).take(capacity)), list(range(capacity)))
+
+    def test_raises_once_exhausted(self):
+        sampler = UniqueSampler(5, seed=7)
+        sampler.take(5)
+        with self.assertRaises(ValueError):
+            sampler.next_index()
+        with self.assertRaises(ValueError):
+            UniqueSampler(5, seed=7).take(6)
+
+    def test_take_next_index_and_permute_agree(self):
+        for capacity in (3, 257, 20001, 2 ** 40 + 3):
+            with self.subTest(capacity=capacity):
+                n = min(capacity, 1000)
+                taken = UniqueSampler(capacity, seed=11).take(n)
+                one_by_one = UniqueSampler(capacity, seed=11)
+                mixed = UniqueSampler(capacity, seed=11)
+                interleaved = []
+                while len(interleaved) < n:
+                    if len(interleaved) % 2:
+                        interleaved.extend(mixed.take(min(20, n - len(interleaved))))
+                    else:
+                        interleaved.append(mixed.next_index())
+                self.assertEqual(taken, [one_by_one.next_index() for _ in range(n)])
+                self.assertEqual(taken, interleaved)
+                self.assertEqual(taken, [UniqueSampler(capacity, seed=11).permute(position) for position in range(n)])
+
+    def test_disjoint_offsets_never_collide(self):
+        capacity, shard_size = 20001, 700
+        shards = [UniqueSampler(capacity, seed=3, offset=offset).take(shard_size)
+                  for offset in range(0, capacity - shard_size, shard_size)]
+        drawn = [index for shard in shards for index in shard]
+        self.assertEqual(len(set(drawn)), len(drawn))
+        self.assertEqual(drawn, UniqueSampler(capacity, seed=3).take(len(drawn)))
+
+    def test_draws_are_not_an_arithmetic_progression(self):
+        indexes = UniqueSampler(20001, seed=5).take(1000)
+        steps = {(b - a) % 20001 for a, b in zip(indexes, indexes[1:])}
+        self.assertGreater(len(steps), 900)
+
+    def test_seed_chooses_the_permutation(self):
+        self.assertEqual(UniqueSampler(20001, seed=1).take(100), UniqueSampler(20001, seed=1).take(100))
+        self.assertNotEqual(UniqueSampler(20001, seed=1).take(100), UniqueSampler(20001, seed=2).take(100))
+
+
+class ShardedGenerationTest(unittest.TestCase):
+    def generate(self, table_name: str, n: int, workers: int):
+        return list(generate_parallel(table_name, n, workers=workers, seed=42, shard_size=300,
+                                      reference_time=SEEDED_REFERENCE_TIME))
+
+    def test_rows_do_not_depend_on_the_number_of_workers(self):
+        for table_name in ('booking', 'passenger', 'flight'):
+            with self.subTest(table_name=table_name):
+                self.assertEqual(self.generate(table_name, 1000, 1), self.generate(table_name, 1000, 3))
+
+    def test_unique_columns_stay_unique_across_shards(self):
+        unique_columns = (
+            ('passenger', ('passportno',)),
+            ('passengerdetails', ('passenger_id',)),
+            ('flight', ('flightno',)),
+            ('booking', ('flight_id',))
+        )
+        for table_name, columns in unique_columns:
+            rows = self.generate(table_name, 2000, 3)
+            for column in columns:
+                with self.subTest(table_name=table_name, column=column):
+                    values = [row[column] for row in rows]
+                    self.assertEqual(len(set(values)), len(values))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,42 +1,191 @@
+import base64
+import binascii
+import json
+import queue
 import re
-from typing import List, Dict, Any, Union
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Union, Iterable, Iterator, Callable, Optional, Tuple
 
 from faker import Faker
-from sqlalchemy import delete, text, Inspector
+from sqlalchemy import delete, select, text, tuple_, Inspector, Integer, Select
+from sqlalchemy.dialects.mysql import DATETIME, SET, TIME, TIMESTAMP
 from sqlalchemy.engine import Engine, Connection
-from sqlalchemy.schema import CreateTable, MetaData
-from sqlalchemy.schema import Table, Column
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.schema import Table
+from sqlalchemy.types import NullType
 
 from config.DatabaseInfo import DatabaseInfo
-from util.dummy_generators import generate_data_with_type
 from util.error.error_handler import exception_handler
+from util.metrics import Stopwatch, record_insert
+from util.row_plan import compile_row_plan
+from util.schema_cache import schema_cache
+from util.serializer import decode_typed_value, encode_typed_value
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_QUEUE_SIZE = 4
+DEFAULT_PAGE_SIZE = 1000
+MAX_PAGE_SIZE = 10000
+DEFAULT_STREAM_BATCH_SIZE = 1000
+
+# 더미 데이터를 만들지 않는 내부 테이블 (generation job queue)
+INTERNAL_TABLES = ('generation_job',)
 
 
 @exception_handler
 def print_table(engine: Engine, table_name: str) -> list[dict]:
     """
     Executes a SQL query using the SQLAlchemy engine to fetch and print all data from the specified table.
+    This materializes the whole table; use read_table_page() or stream_table_rows() for large tables.
 
     :param engine: SQLAlchemy engine object connected to the target database
     :param table_name: Name of the database table to query
     :raises Exception: Any exceptions raised during the execution are handled by the exception handler
     """
+    return list(stream_table_rows(engine, table_name))
+
+
+def encode_keyset_value(value: Any) -> List:
+    """
+    Converts one primary key value into a [kind, JSON value] pair of the cursor (see util.serializer).
+    MySQL TIME values arrive as timedelta (pymysql) and are stored as a time of day when they are one.
+
+    @raise ValueError: If the value has a type a primary key column can not have
+    """
+    if isinstance(value, timedelta) and timedelta(0) <= value < timedelta(days=1):
+        value = (datetime.min + value).time()
+    return encode_typed_value(value)
+
+
+def encode_keyset(table: Table, row: Dict[str, Any]) -> str:
+    """
+    Builds the opaque `after` cursor of the page ending with row: URL-safe base64 of a JSON list of
+    [kind, value] pairs, one per primary key column, so any value (commas in strings, dates, times) round-trips.
+
+    @param table: SQLAlchemy Table object being paged
+    @param row: Last row of the page
+    @return: Cursor string (see parse_keyset())
+    """
+    keyset = [encode_keyset_value(row[column.name]) for column in table.primary_key.columns]
+    return base64.urlsafe_b64encode(json.dumps(keyset, separators=(',', ':')).encode('utf-8')).decode('ascii')
+
+
+def parse_keyset(table: Table, after: Optional[str]) -> Optional[Tuple]:
+    """
+    Parses the `after` cursor of a keyset page into primary key values.
+
+    The cursor is the opaque next_after value of the previous page (see encode_keyset()).
+
+    @param table: SQLAlchemy Table object being paged
+    @param after: Cursor string, or None/empty for the first page
+    @return: Tuple of primary key values, or None
+    @raise ValueError: If the table has no primary key or the cursor does not match it
+    """
+    if not after:
+        return None
+
+    primary_key = list(table.primary_key.columns)
+    if not primary_key:
+        raise ValueError(f"Table {table.name} has no primary key, keyset pagination is not possible")
+
+    try:
+        values = json.loads(base64.urlsafe_b64decode(after.encode('ascii')))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError("Invalid after cursor, use the next_after value of the previous page")
+    if not isinstance(values, list) or len(values) != len(primary_key):
+        raise ValueError(f"after must hold {len(primary_key)} value(s): "
+                         f"{', '.join(column.name for column in primary_key)}")
+
+    keyset = []
+    for column, value in zip(primary_key, values):
+        try:
+            keyset.append(decode_typed_value(value))
+        except ValueError:
+            raise ValueError(f"Invalid after value for {column.name}: {value}")
+    return tuple(keyset)
+
+
+def build_keyset_select(table: Table, after: Optional[Tuple] = None, limit: Optional[int] = None) -> Select:
+    """
+    Builds `SELECT ... WHERE pk > :after ORDER BY pk LIMIT :limit` for a table.
+
+    Seeking on the primary key keeps every page an index range scan, unlike OFFSET which reads and
+    discards all previous rows. Tables without a primary key are read in storage order.
+
+    @param table: SQLAlchemy Table object to read
+    @param after: Primary key of the last row already read (see parse_keyset()), or None
+    @param limit: Maximum number of rows, or None for no limit
+    @return: SQLAlchemy Select object
+    """
+    primary_key = list(table.primary_key.columns)
+    statement = select(table)
+    if primary_key:
+        statement = statement.order_by(*primary_key)
+        if after is not None:
+            if len(primary_key) == 1:
+                statement = statement.where(primary_key[0] > after[0])
+            else:
+                statement = statement.where(tuple_(*primary_key) > tuple_(*after))
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+def stream_table_rows(engine: Engine, table_name: Union[str, Table], after: Optional[Tuple] = None,
+                      limit: Optional[int] = None,
+                      batch_size: int = DEFAULT_STREAM_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Reads rows of a table through a server-side cursor, in primary key order.
+
+    Rows are fetched batch_size at a time (stream_results / yield_per), so memory stays constant
+    regardless of the table size and the first row is available before the whole result is read.
+    The connection stays checked out until the generator is exhausted or closed.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param table_name: Name of the table as a string, or a Table object
+    @param after: Primary key of the last row already read (see parse_keyset()), or None
+    @param limit: Maximum number of rows, or None to read to the end of the table
+    @param batch_size: Number of rows fetched from the server per round trip
+    @return: Generator yielding one dictionary per row
+    """
+    table = get_table_metadata(engine, table_name)
     with engine.connect() as connection:
-        sql = text("SELECT * FROM " + table_name)
-        result = connection.execute(sql)
-        conv_result = [dict(row) for row in result.mappings()]
-        return conv_result
+        result = connection.execution_options(stream_results=True, yield_per=batch_size).execute(
+            build_keyset_select(table, after, limit)
+        )
+        for row in result.mappings():
+            yield dict(row)
 
 
+def read_table_page(engine: Engine, table_name: Union[str, Table], after: Optional[Tuple] = None,
+                    limit: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+    """
+    Reads one keyset page of a table.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param table_name: Name of the table as a string, or a Table object
+    @param after: Primary key of the last row of the previous page (see parse_keyset()), or None
+    @param limit: Maximum number of rows in the page
+    @return: Dictionary with 'rows' and 'next_after', the cursor of the next page
+             (opaque, see encode_keyset(); None on the last page)
+    """
+    table = get_table_metadata(engine, table_name)
+    rows = list(stream_table_rows(engine, table, after, limit))
+
+    next_after = None
+    if table.primary_key.columns and len(rows) == limit:
+        next_after = encode_keyset(table, rows[-1])
+    return {'rows': rows, 'next_after': next_after}
+
 
-@exception_handler
 def delete_current_data(connection: Connection, table: Table) -> None:
     """
     Deletes all data from the specified table using SQLAlchemy.
 
     @param connection: SQLAlchemy connection object (e.g., from with engine.connect() as connection:)
     @param table: SQLAlchemy Table object representing the table to delete data from
-    @raise Exception: Any exceptions raised during the execution are handled by the exception handler
+    @raise SQLAlchemyError: If the delete fails (the caller must not insert on top of the old rows)
     """
 
     connection.execute(delete(table))
@@ -50,12 +199,11 @@ def get_table_metadata(engine: Engine, table_name: Union[str, Table]) -> Table:
 
     @param engine: SQLAlchemy engine object connected to the target database
     @param table_name: Name of the table as a string
-    @return: SQLAlchemy Table object containing the table's metadata
+    @return: SQLAlchemy Table object containing the table's metadata (shared through the schema cache)
     """
-    metadata = MetaData()
-    metadata.reflect(bind=engine)
-    table = metadata.tables[table_name]
-    return table
+    if isinstance(table_name, Table):
+        return table_name
+    return schema_cache.get_table(engine, table_name)
 
 
 @exception_handler
@@ -64,143 +212,228 @@ def get_all_tables_from_database(engine: Engine) -> List[Table]:
     Retrieves all table metadata from the MySQL database schema specified in the engine.
 
     @param engine: SQLAlchemy engine object connected to the target database
-    @return: List of SQLAlchemy Table objects
+    @return: List of table names
     """
-    metadata = MetaData()
-    metadata.reflect(bind=engine)
+    metadata = schema_cache.get_metadata(engine)
     all_tables = list(metadata.tables)
     return all_tables
 
 
-@exception_handler
-def insert_into_all_tables(engine, dummy_data: Dict) -> None:
+def chunked(rows: Iterable[Dict], chunk_size: int) -> Iterator[List[Dict]]:
+    """
+    Splits an iterable of rows into lists of at most chunk_size rows.
+
+    @param rows: Iterable of dictionaries containing row data
+    @param chunk_size: Maximum number of rows per chunk
+    @return: Iterator over lists of rows
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def make_insert_report(table_name: str, rows: int, elapsed: float, strategy: str = 'insert') -> Dict[str, Any]:
+    """
+    Builds the insert statistics dictionary returned by the bulk insert functions.
+
+    @param table_name: Name of the table the rows were inserted into
+    @param rows: Number of inserted rows
+    @param elapsed: Elapsed time in seconds
+    @param strategy: Load strategy that inserted the rows ('insert' or 'load_data')
+    @return: Dictionary with 'table_name', 'rows', 'elapsed', 'rows_per_sec' and 'strategy' keys
+    """
+    return {
+        'table_name': table_name,
+        'rows': rows,
+        'elapsed': round(elapsed, 4),
+        'rows_per_sec': round(rows / elapsed, 2) if elapsed > 0 else float(rows),
+        'strategy': strategy
+    }
+
+
+def bulk_insert(connection: Connection, table: Table, rows: Iterable[Dict],
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Inserts rows into the table chunk by chunk and commits after each chunk.
+
+    One insert statement is compiled per table and executed with a list of parameter sets per chunk,
+    so the driver sends a single executemany (multi-row VALUES on pymysql) instead of one round trip per row.
+
+    @param connection: SQLAlchemy connection object
+    @param table: SQLAlchemy Table object to insert into
+    @param rows: Iterable of dictionaries containing the row data
+    @param chunk_size: Number of rows sent to the database per statement
+    @return: Insert statistics dictionary (see make_insert_report())
+    """
+    insert_statement = table.insert()
+    inserted = 0
+    generation = Stopwatch()
+    insertion = Stopwatch()
+    start = time.perf_counter()
+    for chunk in generation.iterate(chunked(rows, chunk_size)):
+        with insertion:
+            connection.execute(insert_statement, chunk)
+            connection.commit()
+        inserted += len(chunk)
+    record_insert(table.name, inserted, generation.elapsed, insertion.elapsed)
+    return make_insert_report(table.name, inserted, time.perf_counter() - start)
+
+
+def stream_insert(engine: Engine, table: Table, rows: Iterable[Dict], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  queue_size: int = DEFAULT_QUEUE_SIZE,
+                  progress: Optional[Callable[[int], None]] = None) -> Dict[str, Any]:
+    """
+    Inserts rows through a bounded producer/consumer pipeline.
+
+    The calling thread pulls rows from the generator and groups them into chunks, while a writer thread
+    inserts and commits each chunk on its own connection. The queue between them holds at most queue_size chunks,
+    so generation and insertion overlap and memory stays bounded by (queue_size + 2) * chunk_size rows.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param table: SQLAlchemy Table object to insert into
+    @param rows: Iterable (usually a generator) of dictionaries containing the row data
+    @param chunk_size: Number of rows sent to the database per statement
+    @param queue_size: Maximum number of chunks waiting for the writer thread
+    @param progress: Optional callback called with the total number of inserted rows after every chunk
+    @return: Insert statistics dictionary (see make_insert_report())
+    @raise Exception: Re-raises the first error raised by the writer thread
+    """
+    chunk_queue = queue.Queue(maxsize=queue_size)
+    writer_errors = []
+    inserted = [0]
+    generation = Stopwatch()
+    insertion = Stopwatch()
+
+    def writer():
+        insert_statement = table.insert()
+        try:
+            with engine.connect() as connection:
+                while True:
+                    chunk = chunk_queue.get()
+                    if chunk is None:
+                        break
+                    with insertion:
+                        connection.execute(insert_statement, chunk)
+                        connection.commit()
+                    inserted[0] += len(chunk)
+                    if progress is not None:
+                        progress(inserted[0])
+        except Exception as e:
+            writer_errors.append(e)
+            # producer가 put()에서 멈추지 않도록 남은 chunk를 비워준다
+            while chunk_queue.get() is not None:
+                pass
+
+    start = time.perf_counter()
+    writer_thread = threading.Thread(target=writer, name=f"stream-insert-{table.name}", daemon=True)
+    writer_thread.start()
+    try:
+        for chunk in generation.iterate(chunked(rows, chunk_size)):
+            if writer_errors:
+                break
+            chunk_queue.put(chunk)
+    finally:
+        chunk_queue.put(None)
+        writer_thread.join()
+
+    if writer_errors:
+        raise writer_errors[0]
+    record_insert(table.name, inserted[0], generation.elapsed, insertion.elapsed)
+    return make_insert_report(table.name, inserted[0], time.perf_counter() - start)
+
+
+def insert_into_all_tables(engine, dummy_data: Dict, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Dict[str, Any]]:
     """
     Inserts data into all specified tables using SQLAlchemy.
 
     @param engine: SQLAlchemy engine object connected to the target database
     @param dummy_data: Dictionary where keys are table names and values are lists of dictionaries containing dummy data
-    @param mode: Operation mode; 'y' to delete existing data before insertion, 'n' to keep existing data
+    @param chunk_size: Number of rows sent to the database per statement
+    @return: List of insert statistics dictionaries, one per table
+    @raise SQLAlchemyError: If an insert fails (jobs store the error, see util.job_queue.execute_job())
     """
+    reports = []
     with engine.connect() as connection:
         for table_name in dummy_data.keys():
             table_metadata = get_table_metadata(engine, table_name)
-            connection.execute(table_metadata.insert(), dummy_data[table_name])
-            connection.commit()
+            reports.append(bulk_insert(connection, table_metadata, dummy_data[table_name], chunk_size))
+    return reports
 
 
-@exception_handler
-def insert_dummy_data(engine, table_name: str, dummy_data: List[Dict], mode: str) -> None:
+def insert_dummy_data(engine, table_name: str, dummy_data: Iterable[Dict], mode: str,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE, stream: bool = False,
+                      progress: Optional[Callable[[int], None]] = None) -> Dict[str, Any]:
     """
     Inserts generated dummy data into the specified table.
 
     @param engine: SQLAlchemy engine object connected to the target database
     @param table_name: Name of the table as a string
-    @param dummy_data: List of dictionaries containing the dummy data to be inserted
+    @param dummy_data: Iterable of dictionaries containing the dummy data to be inserted
     @param mode: Operation mode; 'y' to delete existing data before insertion, 'n' to keep existing data
+    @param chunk_size: Number of rows sent to the database per statement
+    @param stream: If True, insert through stream_insert() so generation and insertion overlap
+    @param progress: Optional callback called with the number of inserted rows after every chunk (stream only)
+    @return: Insert statistics dictionary (see make_insert_report())
+    @raise ValueError: If the table does not exist
+    @raise SQLAlchemyError: If the delete or an insert fails (jobs store the error, see util.job_queue.execute_job())
     """
     # DB에서 테이블 원형 가져오기
     table = get_table_metadata(engine, table_name)
+    if table is None:
+        raise ValueError(f"Table not found: {table_name}")
 
     with engine.connect() as connection:
         # DELETE
         if mode == 'y' or mode == 'Y':
             delete_current_data(connection, table)
 
-        # INSERT INTO
-        for data in dummy_data:
-            connection.execute(table.insert().values(data))
-        connection.commit()
-
-
-@exception_handler
-def get_column_type_detail(table: Table, column: Column) -> Dict[str, Any]:
-    """
-    Retrieves detailed column type information for a specific column in a table.
-
-    @param table: SQLAlchemy Table object containing the column
-    @param column: SQLAlchemy Column object for which to retrieve detailed information
-    @return: Dictionary containing detailed information about the column. The dictionary keys are:
-             'table_name', 'col_name', 'type', 'size', 'decimal_place', 'enum_values', 'primary', 'unique'.
-             - 'type' is the data type (e.g., VARCHAR, INT)
-             - 'size' is the size of the data type (e.g., 255 for VARCHAR(255))
-             - 'decimal_place' is the number of decimal places (for NUMERIC types)
-             - 'enum_values' is a list of possible values for ENUM types
-             - 'primary' is 'True' if the column is a primary key
-             - 'unique' is 'True' if the column has a unique constraint
-    """
-    column_type = column.type
-    pattern = r"(\w+)\s*(\((\d+)(,\s*(\d+))?\))?(?:\s*CHARACTER SET \w+)?(?:\s*COLLATE \w+)?"  # 정규식 (CHAT-GPT 사용)
-    matches = re.findall(pattern, str(column_type))
-    type_detail = {
-        'table_name': table.name,
-        'col_name': column.name,
-        'type': None,
-        'size': None,
-        'decimal_place': None,
-        'enum_values': None,
-        'primary': None,
-        'unique': None
-    }
-
-    if matches:
-        col_type, col_size, decimal_place = matches[0][0], matches[0][2], matches[0][4]
-        type_detail['type'] = col_type
-        type_detail['size'] = int(col_size) if col_size else None
-        type_detail['decimal_place'] = int(decimal_place) if decimal_place else None
-
-    # primary
-    if column.primary_key:
-        type_detail['primary'] = 'True'
-
-    # 유니크 속성 확인
-    for index in table.indexes:
-        if index.unique and column.name in index.columns:
-            type_detail['unique'] = 'True'
-            break
-
-    # ENUM 값 뽑아오기
-    if str(column_type) == "ENUM":
-        type_detail['enum_values'] = column_type.enums
+        if not stream:
+            # INSERT INTO (chunk 단위 executemany)
+            return bulk_insert(connection, table, dummy_data, chunk_size)
 
-    return type_detail
+    return stream_insert(engine, table, dummy_data, chunk_size, progress=progress)
 
 
-def create_all_dummy_helper(fake: Faker, table: Table, n: int) -> List[Dict]:
+def create_all_dummy_helper(fake: Faker, table: Table, n: int) -> Iterator[Dict]:
     """
-    Generates dummy data for the specified table.
+    Generates dummy data for the specified table by running its compiled RowPlan (see row_plan.compile_row_plan()).
 
     @param fake: Faker object used to generate fake data
     @param table: SQLAlchemy Table object for which to generate dummy data
     @param n: Number of dummy data entries to generate
-    @return: List of dictionaries, each containing dummy data for a table row
+    @return: Generator yielding dictionaries, each containing dummy data for a table row
     """
-    dummy_data = []
-    check_str_duplicate = set()
-    check_num_duplicate = set()
-    for i in range(n):
-        # n개의 더미 데이터 생성
-        data_row = {}
-        for column in table.columns:
-            if str(column.autoincrement) == "True":
-                continue
-            type_detail = get_column_type_detail(table, column)  # 해당 column의 상세정보를 dictionary 형태로 가져와줌
-            data_row[column.name] = generate_data_with_type(fake, type_detail, check_str_duplicate, check_num_duplicate)  # Row 하나씩 더미데이터 생성해줌
-        dummy_data.append(data_row)  # 리스트에 저장
+    return compile_row_plan(fake, table).generate_rows(n)
 
-    return dummy_data
 
-
-def create_all_dummy(engine: Engine, fake: Faker, n: int, mode: str):
+def create_all_dummy(engine: Engine, fake: Faker, n: int, mode: str,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE, stream: bool = False,
+                     progress: Optional[Callable[[int], None]] = None) -> List[Dict[str, Any]]:
     """
-    Retrieves metadata for all tables using get_all_tables_from_database(), generates dummy data for each table,
-    stores the data in a dictionary, and passes it to insert_into_all_tables() for insertion.
+    Retrieves metadata for all tables using get_all_tables_from_database() and generates dummy data for each table.
+    In stream mode every table is generated and inserted through stream_insert(), one table at a time,
+    otherwise the data is stored in a dictionary and passed to insert_into_all_tables() for insertion.
+    Internal tables (INTERNAL_TABLES) are skipped.
 
     @param engine: SQLAlchemy engine object connected to the target database
     @param fake: Faker object used to generate fake data
     @param n: Number of dummy data entries to generate per table
     @param mode: Operation mode; 'y' to delete existing data before insertion, 'n' to keep existing data
+    @param chunk_size: Number of rows sent to the database per statement
+    @param stream: If True, never hold more than a few chunks of generated rows in memory
+    @param progress: Optional callback called with the number of rows inserted so far, over all tables,
+                     after every chunk (stream only)
+    @return: List of insert statistics dictionaries, one per table
     """
-    table_list = get_all_tables_from_database(engine)
+    table_list = [table for table in get_all_tables_from_database(engine) if table not in INTERNAL_TABLES]
     all_dummy_data = {}
 
     if mode == 'y' or mode == 'Y':
@@ -210,12 +443,22 @@ def create_all_dummy(engine: Engine, fake: Faker, n: int, mode: str):
                 delete_current_data(connection, table_metadata)
             connection.commit()
 
+    if stream:
+        reports = []
+        for table in table_list:
+            table_metadata = get_table_metadata(engine, table)
+            done = sum(report['rows'] for report in reports)
+            table_progress = (lambda inserted, done=done: progress(done + inserted)) if progress else None
+            reports.append(stream_insert(engine, table_metadata, create_all_dummy_helper(fake, table_metadata, n),
+                                         chunk_size, progress=table_progress))
+        return reports
+
     for table in table_list:
         table_metadata = get_table_metadata(engine, table)
-        generated_data = create_all_dummy_helper(fake, table_metadata, n)
+        generated_data = list(create_all_dummy_helper(fake, table_metadata, n))
         all_dummy_data[table_metadata.name] = generated_data
 
-    insert_into_all_tables(engine, all_dummy_data)
+    return insert_into_all_tables(engine, all_dummy_data, chunk_size)
 
 
 @exception_handler
@@ -248,22 +491,157 @@ def make_column_details_dictionary(engine: Engine, inspector: Inspector, table_n
     """
     temp_dict = {}
     columns = inspector.get_columns(table_name, db_info.database_name)
-    column_dictionary_list = []
-    for column in columns:
-        column_details = {
-            'name': column['name'],
-            'type': str(column['type']),
-            'primary': is_column_primary_key(engine, table_name, column['name']),
-            'comment': column['comment'],
-            'default': column['default'],
-            'nullable': column['nullable'],
-            'autoincrement': column.get('autoincrement')
-        }
-        column_dictionary_list.append(column_details)
-    temp_dict[table_name] = column_dictionary_list
+    # column마다 전체 reflection을 하지 않도록 primary key는 테이블당 한 번만 조회한다
+    primary_key = inspector.get_pk_constraint(table_name, db_info.database_name)['constrained_columns']
+    temp_dict[table_name] = [make_column_details(column, primary_key) for column in columns]
     return temp_dict
 
 
+def make_column_details(column: Dict[str, Any], primary_key: Iterable[str]) -> Dict[str, Any]:
+    """
+    Converts one column of inspector.get_columns() to the column details returned by the /show endpoints.
+
+    @param column: Column dictionary returned by inspector.get_columns()
+    @param primary_key: Names of the table's primary key columns
+    @return: Dictionary with 'name', 'type', 'primary', 'comment', 'default', 'nullable' and 'autoincrement'
+    """
+    return {
+        'name': column['name'],
+        'type': str(column['type']),
+        'primary': column['name'] in primary_key,
+        'comment': column['comment'],
+        'default': column['default'],
+        'nullable': column['nullable'],
+        'autoincrement': column.get('autoincrement')
+    }
+
+
+SCHEMA_COLUMNS_QUERY = text(
+    "SELECT c.TABLE_NAME, c.COLUMN_NAME, c.DATA_TYPE, c.COLUMN_TYPE, c.IS_NULLABLE, c.COLUMN_DEFAULT, c.EXTRA, "
+    "c.COLUMN_COMMENT, c.CHARACTER_SET_NAME, c.COLLATION_NAME, t.TABLE_COLLATION "
+    "FROM information_schema.COLUMNS c JOIN information_schema.TABLES t "
+    "ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME "
+    "WHERE c.TABLE_SCHEMA = :schema AND t.TABLE_TYPE = 'BASE TABLE' "
+    "ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION"
+)
+
+SCHEMA_PRIMARY_KEYS_QUERY = text(
+    "SELECT TABLE_NAME, COLUMN_NAME FROM information_schema.KEY_COLUMN_USAGE "
+    "WHERE TABLE_SCHEMA = :schema AND CONSTRAINT_NAME = 'PRIMARY'"
+)
+
+_COLUMN_TYPE_PATTERN = re.compile(r"^\w+(?:\((?P<args>.*)\))?(?P<unsigned> unsigned)?(?P<zerofill> zerofill)?", re.I)
+
+
+def make_reflected_type(engine: Engine, column: Dict[str, Any]):
+    """
+    Builds the SQLAlchemy type of an information_schema.COLUMNS row the same way MySQL reflection
+    builds it from SHOW CREATE TABLE, so str() of the result matches inspector.get_columns().
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param column: Row of SCHEMA_COLUMNS_QUERY as a dictionary
+    @return: SQLAlchemy type object
+    """
+    col_type = engine.dialect.ischema_names.get(column['DATA_TYPE'].lower(), NullType)
+    match = _COLUMN_TYPE_PATTERN.match(column['COLUMN_TYPE'])
+    args = match.group('args') if match else None
+
+    if not args:
+        type_args = []
+    elif args[0] == "'" and args[-1] == "'":
+        # ENUM / SET 값: 'a','b' -> ['a', 'b']
+        type_args = [value.replace("''", "'") for value in re.findall(r"'((?:''|[^'])*)'", args)]
+    else:
+        type_args = [int(value) for value in re.findall(r"\d+", args)]
+
+    type_kw = {}
+    if issubclass(col_type, (DATETIME, TIME, TIMESTAMP)) and type_args:
+        type_kw['fsp'] = type_args.pop(0)
+    if match and match.group('unsigned'):
+        type_kw['unsigned'] = True
+    if match and match.group('zerofill'):
+        type_kw['zerofill'] = True
+
+    # SHOW CREATE TABLE은 테이블 기본값과 다른 charset/collation만 보여준다
+    table_collation = column['TABLE_COLLATION'] or ''
+    if column['CHARACTER_SET_NAME'] and column['CHARACTER_SET_NAME'] != table_collation.split('_')[0]:
+        type_kw['charset'] = column['CHARACTER_SET_NAME']
+    if column['COLLATION_NAME'] and column['COLLATION_NAME'] != table_collation:
+        type_kw['collate'] = column['COLLATION_NAME']
+    if issubclass(col_type, SET) and '' in type_args:
+        type_kw['retrieve_as_bitwise'] = True
+
+    return col_type(*type_args, **type_kw)
+
+
+def format_column_default(default: Optional[str], extra: str) -> Optional[str]:
+    """
+    Converts information_schema.COLUMNS.COLUMN_DEFAULT to the text reflection returns
+    (string literals quoted, expressions like CURRENT_TIMESTAMP as they are).
+
+    @param default: COLUMN_DEFAULT value
+    @param extra: EXTRA value (e.g. 'DEFAULT_GENERATED on update CURRENT_TIMESTAMP')
+    @return: Default as reflected by inspector.get_columns(), or None
+    """
+    if default is None:
+        return None
+    extra = extra or ''
+    if 'DEFAULT_GENERATED' not in extra.upper() and not default.upper().startswith('CURRENT_TIMESTAMP'):
+        default = "'" + default.replace("'", "''") + "'"
+    on_update = re.search(r'on update (.+)$', extra, re.I)
+    if on_update:
+        default += f" ON UPDATE {on_update.group(1)}"
+    return default
+
+
+@exception_handler
+def get_schema_column_details(engine: Engine, inspector: Inspector, schema_name: str) -> Dict[str, List[Dict]]:
+    """
+    Retrieves the column details of every table of a schema, in the shape of make_column_details_dictionary().
+
+    On MySQL this runs two information_schema queries (COLUMNS and KEY_COLUMN_USAGE) for the whole schema,
+    so the cost does not grow with one reflection per table or per column. Other dialects fall back to
+    the inspector, one get_columns() / get_pk_constraint() pair per table.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param inspector: SQLAlchemy Inspector object, used by the non-MySQL fallback
+    @param schema_name: Name of the schema
+    @return: Dictionary with table names as keys and lists of column details as values
+    """
+    if engine.dialect.name != 'mysql':
+        result = {}
+        for table_name in inspector.get_table_names(schema_name):
+            primary_key = inspector.get_pk_constraint(table_name, schema_name)['constrained_columns']
+            columns = inspector.get_columns(table_name, schema_name)
+            result[table_name] = [make_column_details(column, primary_key) for column in columns]
+        return result
+
+    with engine.connect() as connection:
+        columns = connection.execute(SCHEMA_COLUMNS_QUERY, {'schema': schema_name}).mappings().all()
+        primary_keys = set(connection.execute(SCHEMA_PRIMARY_KEYS_QUERY, {'schema': schema_name}).all())
+
+    result = {}
+    for column in columns:
+        col_type = make_reflected_type(engine, column)
+        if 'auto_increment' in (column['EXTRA'] or '').lower():
+            autoincrement = True
+        elif isinstance(col_type, Integer):
+            autoincrement = False
+        else:
+            autoincrement = None
+
+        result.setdefault(column['TABLE_NAME'], []).append({
+            'name': column['COLUMN_NAME'],
+            'type': str(col_type),
+            'primary': (column['TABLE_NAME'], column['COLUMN_NAME']) in primary_keys,
+            'comment': column['COLUMN_COMMENT'] or None,
+            'default': format_column_default(column['COLUMN_DEFAULT'], column['EXTRA']),
+            'nullable': column['IS_NULLABLE'] == 'YES',
+            'autoincrement': autoincrement
+        })
+    return result
+
+
 @exception_handler
 def get_ddl_script(engine: Engine, table_name: str):
     """
@@ -274,8 +652,7 @@ def get_ddl_script(engine: Engine, table_name: str):
     @param engine: SQLAlchemy engine object connected to the target database
     @raise ValueError: if table name is not exists in database schema
     """
-    metadata = MetaData()
-    metadata.reflect(bind=engine)
+    metadata = schema_cache.get_metadata(engine)
 
     if table_name in metadata.tables.keys():
         table_metadata = metadata.tables[table_name]
@@ -306,20 +683,12 @@ def get_view_list_details(engine: Engine, inspector: Inspector, db_info: Databas
 
         table_name = re_table_name[0]
         columns = inspector.get_columns(table_name, db_info.database_name)
+        primary_key = inspector.get_pk_constraint(table_name, db_info.database_name)['constrained_columns']
 
         column_dictionary_list = []
         for column in columns:
             if column['name'] in re_aliases:
-                column_details = {
-                    'name': column['name'],
-                    'type': str(column['type']),
-                    'primary': is_column_primary_key(engine, table_name, column['name']),
-                    'comment': column['comment'],
-                    'default': column['default'],
-                    'nullable': column['nullable'],
-                    'autoincrement': column.get('autoincrement')
-                }
-                column_dictionary_list.append(column_details)
+                column_dictionary_list.append(make_column_details(column, primary_key))
         result[view_name] = column_dictionary_list
 
     return result
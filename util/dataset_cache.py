@@ -0,0 +1,249 @@
+import hashlib
+import json
+import os
+import stat
+import struct
+import tempfile
+import zlib
+from datetime import datetime
+from importlib.metadata import version
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional
+
+from faker import VERSION as FAKER_VERSION
+
+from util.parallel_generator import DEFAULT_SHARD_SIZE, generate_parallel
+from util.serializer import decode_typed_column, encode_typed_column
+
+# table_mapper() generator의 출력이 바뀌면 올려서 이전 cache를 쓰지 않도록 한다
+GENERATOR_VERSION = 4
+# seed를 준 생성은 "현재" 대신 이 시각을 기준으로 날짜 범위를 정한다 (see util.vectorized.reference_now())
+SEEDED_REFERENCE_TIME = datetime(2024, 1, 1)
+DATASET_BATCH_SIZE = 10000
+# 공용 임시 디렉토리 안에서는 사용자마다 따로 쓴다 (see ensure_cache_dir())
+DATASET_CACHE_DIR = os.environ.get('DATASET_CACHE_DIR', os.path.join(
+    tempfile.gettempdir(), f"dummy_dataset_cache-{os.getuid()}" if hasattr(os, 'getuid') else 'dummy_dataset_cache'
+))
+# cache 전체 크기 상한, 넘으면 가장 오래 쓰이지 않은 파일부터 지운다
+DATASET_CACHE_MAX_BYTES = int(os.environ.get('DATASET_CACHE_MAX_BYTES', 2 * 1024 ** 3))
+
+DATASET_FILE_MAGIC = b'DDS2'
+DATASET_FILE_SUFFIX = '.dataset'
+_FRAME_HEADER = struct.Struct('>I')
+
+
+def make_generator_version() -> str:
+    """
+    Builds the version string of everything that decides the rows of a seeded run:
+    the generators, Faker and its providers, the shard layout and the reference time.
+
+    @return: Version string, part of the dataset cache key
+    """
+    return (
+        f"{GENERATOR_VERSION}:faker-{FAKER_VERSION}:faker_airtravel-{version('faker_airtravel')}:"
+        f"shard-{DEFAULT_SHARD_SIZE}:{SEEDED_REFERENCE_TIME.isoformat()}:{DATASET_FILE_MAGIC.decode('ascii')}"
+    )
+
+
+def dataset_cache_path(table_name: str, n: int, seed: int, cache_dir: Optional[str] = None) -> str:
+    """
+    Returns the cache file of a (table, n, seed, generator version) combination.
+
+    @param table_name: Name of the table (key of table_mapper())
+    @param n: Number of rows
+    @param seed: Generation seed
+    @param cache_dir: Cache directory (default: DATASET_CACHE_DIR)
+    @return: Path of the cache file (it may not exist yet)
+    """
+    version_hash = hashlib.sha1(make_generator_version().encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir or DATASET_CACHE_DIR,
+                        f"{table_name}-{n}-{seed}-{version_hash}{DATASET_FILE_SUFFIX}")
+
+
+def ensure_cache_dir(cache_dir: str) -> None:
+    """
+    Creates the cache directory (mode 0700) and checks that only the current user can write into it,
+    so nobody else can plant or swap dataset files.
+
+    @param cache_dir: Cache directory
+    @raise PermissionError: If the directory is a symlink, belongs to another user or others can write into it
+    """
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    info = os.lstat(cache_dir)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"Dataset cache directory {cache_dir} is not a directory")
+    if hasattr(os, 'getuid') and info.st_uid != os.getuid():
+        raise PermissionError(f"Dataset cache directory {cache_dir} belongs to another user")
+    if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"Dataset cache directory {cache_dir} is writable by other users")
+
+
+def evict_datasets(cache_dir: str, max_bytes: int = DATASET_CACHE_MAX_BYTES, keep: Optional[str] = None) -> int:
+    """
+    Deletes the least recently used dataset files (oldest mtime, read_dataset() touches the files it reads)
+    until the cache is at most max_bytes.
+
+    @param cache_dir: Cache directory
+    @param max_bytes: Size limit of the cache
+    @param keep: Path that is never deleted (the file just written)
+    @return: Number of deleted files
+    """
+    datasets = []
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(DATASET_FILE_SUFFIX) and entry.is_file(follow_symlinks=False):
+                info = entry.stat(follow_symlinks=False)
+                datasets.append((info.st_mtime, info.st_size, entry.path))
+    total = sum(size for _, size, _ in datasets)
+    deleted = 0
+    for _, size, path in sorted(datasets):
+        if total <= max_bytes:
+            break
+        if keep is not None and os.path.abspath(path) == os.path.abspath(keep):
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # 다른 process가 먼저 지웠다
+            pass
+        total -= size
+        deleted += 1
+    return deleted
+
+
+def is_dataset_cached(table_name: str, n: int, seed: int, cache_dir: Optional[str] = None) -> bool:
+    """
+    Checks if the rows of a seeded run are in the dataset cache.
+
+    @param table_name: Name of the table (key of table_mapper())
+    @param n: Number of rows
+    @param seed: Generation seed
+    @param cache_dir: Cache directory (default: DATASET_CACHE_DIR)
+    @return: True if get_seeded_dataset() would read the rows from disk
+    """
+    return os.path.exists(dataset_cache_path(table_name, n, seed, cache_dir))
+
+
+def generate_seeded_rows(table_name: str, n: int, seed: int, workers: int = 1) -> Iterator[Dict]:
+    """
+    Generates the reproducible rows of a seed: the same (table, n, seed) always yields the same rows,
+    whatever the number of workers and the day it runs.
+
+    @param table_name: Name of the table (key of table_mapper())
+    @param n: Number of rows
+    @param seed: Generation seed (non-negative integer)
+    @param workers: Number of generator processes
+    @return: Generator yielding n row dictionaries
+    @raise ValueError: If the table is unknown or a unique column's domain is smaller than n
+    """
+    return generate_parallel(table_name, n, workers=workers, seed=seed, reference_time=SEEDED_REFERENCE_TIME)
+
+
+def write_frame(file: BinaryIO, obj: Any) -> None:
+    """
+    Appends one length-prefixed, zlib compressed JSON frame to a dataset file.
+    """
+    payload = zlib.compress(json.dumps(obj, separators=(',', ':')).encode('utf-8'))
+    file.write(_FRAME_HEADER.pack(len(payload)))
+    file.write(payload)
+
+
+def read_frames(file: BinaryIO) -> Iterator[Any]:
+    """
+    Reads the frames written by write_frame() until the end of the file.
+    """
+    while True:
+        header = file.read(_FRAME_HEADER.size)
+        if not header:
+            return
+        (length,) = _FRAME_HEADER.unpack(header)
+        yield json.loads(zlib.decompress(file.read(length)))
+
+
+def read_dataset(file: BinaryIO) -> Iterator[Dict]:
+    """
+    Streams the rows of a cached dataset, one batch in memory at a time.
+
+    A dataset file is DATASET_FILE_MAGIC, a header frame with the column names, then one frame per batch
+    holding one typed column per column name (see util.serializer.encode_typed_column()).
+    Nothing in the file is executed when it is read.
+
+    @param file: Open cache file, closed when the generator ends
+    @return: Generator yielding row dictionaries
+    @raise ValueError: If the file is not a dataset file
+    """
+    with file:
+        if file.read(len(DATASET_FILE_MAGIC)) != DATASET_FILE_MAGIC:
+            raise ValueError(f"{file.name} is not a dataset cache file")
+        # 최근에 읽은 파일은 evict_datasets()가 늦게 지운다
+        os.utime(file.fileno())
+        frames = read_frames(file)
+        columns = next(frames)['columns']
+        for batch in frames:
+            for row in zip(*(decode_typed_column(column) for column in batch)):
+                yield dict(zip(columns, row))
+
+
+def write_dataset(path: str, rows: Iterable[Dict], batch_size: int = DATASET_BATCH_SIZE,
+                  max_bytes: int = DATASET_CACHE_MAX_BYTES) -> Iterator[Dict]:
+    """
+    Passes rows through while writing them to a dataset file (see read_dataset()).
+
+    The file is written under a temporary name and renamed once every row was written, so readers
+    never see a partial dataset; if the consumer stops early or generation fails, nothing is cached.
+    Older datasets are then evicted to keep the cache under max_bytes.
+
+    @param path: Path of the cache file
+    @param rows: Rows to cache; every row must have the same keys
+    @param batch_size: Rows per frame
+    @param max_bytes: Size limit of the cache directory (see evict_datasets())
+    @return: Generator yielding the same rows
+    @raise PermissionError: If the cache directory is not private (see ensure_cache_dir())
+    """
+    directory = os.path.dirname(path)
+    ensure_cache_dir(directory)
+    file = tempfile.NamedTemporaryFile(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp',
+                                       delete=False)
+    try:
+        with file:
+            file.write(DATASET_FILE_MAGIC)
+            rows = iter(rows)
+            columns = None
+            while True:
+                batch = list(islice(rows, batch_size))
+                if columns is None:
+                    columns = list(batch[0].keys()) if batch else []
+                    write_frame(file, {'columns': columns})
+                if not batch:
+                    break
+                write_frame(file, [encode_typed_column([row[column] for row in batch]) for column in columns])
+                yield from batch
+        os.replace(file.name, path)
+    except BaseException:
+        os.remove(file.name)
+        raise
+    evict_datasets(directory, max_bytes, keep=path)
+
+
+def get_seeded_dataset(table_name: str, n: int, seed: int, workers: int = 1,
+                       cache_dir: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Returns the rows of a seeded run, read from the dataset cache if the same (table, n, seed) was generated
+    before with the same generator version. Otherwise the rows are generated (see generate_seeded_rows())
+    and cached while they are consumed. A cache hit never touches Faker.
+
+    @param table_name: Name of the table (key of table_mapper())
+    @param n: Number of rows
+    @param seed: Generation seed (non-negative integer)
+    @param workers: Number of generator processes on a cache miss
+    @param cache_dir: Cache directory (default: DATASET_CACHE_DIR)
+    @return: Generator yielding n row dictionaries
+    @raise PermissionError: If the cache directory is not private (see ensure_cache_dir())
+    """
+    path = dataset_cache_path(table_name, n, seed, cache_dir)
+    ensure_cache_dir(os.path.dirname(path))
+    try:
+        # 확인과 읽기 사이에 evict_datasets()가 지울 수 있으므로 바로 연다
+        return read_dataset(open(path, 'rb'))
+    except FileNotFoundError:
+        return write_dataset(path, generate_seeded_rows(table_name, n, seed, workers))
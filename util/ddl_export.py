@@ -0,0 +1,95 @@
+import hashlib
+import io
+import threading
+import zipfile
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateTable, MetaData
+
+from util.schema_cache import schema_cache
+
+DDL_BUNDLE_FORMATS = ('sql', 'zip')
+# zip 내용이 매번 같도록(같은 ETag) 파일 시각을 고정한다
+ZIP_ENTRY_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def render_create_table(engine: Engine, metadata: MetaData, table_name: str) -> str:
+    """
+    Renders the CREATE TABLE statement of a reflected table in the engine's dialect.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param metadata: Reflected MetaData containing the table
+    @param table_name: Name of the table
+    @return: DDL script ending with a semicolon
+    """
+    return f"{str(CreateTable(metadata.tables[table_name]).compile(engine)).strip()};\n"
+
+
+def build_ddl_bundle(engine: Engine, metadata: MetaData, bundle_format: str) -> bytes:
+    """
+    Renders the DDL of every table of a reflected schema, parents before children.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param metadata: Reflected MetaData of the schema
+    @param bundle_format: 'sql' (one script) or 'zip' (one <table>.sql per table)
+    @return: Bundle content
+    """
+    scripts = [(table.name, render_create_table(engine, metadata, table.key)) for table in metadata.sorted_tables]
+    if bundle_format == 'sql':
+        return '\n'.join(script for _, script in scripts).encode('utf-8')
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as bundle:
+        for table_name, script in scripts:
+            bundle.writestr(zipfile.ZipInfo(f"{table_name}.sql", ZIP_ENTRY_DATE_TIME), script)
+    return buffer.getvalue()
+
+
+class DDLBundleCache:
+    def __init__(self):
+        """
+        Process-wide cache of rendered schema DDL bundles.
+
+        An entry belongs to one reflected MetaData object of util.schema_cache, which is replaced whenever
+        the schema fingerprint changes or our own DDL invalidates it; a new MetaData means the bundle is rendered again.
+        """
+        self._entries: Dict[Tuple[str, Optional[str], str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_bundle(self, engine: Engine, bundle_format: str, schema: Optional[str] = None) -> Tuple[bytes, str]:
+        """
+        Returns the DDL bundle of a schema, rendering it only if the reflected schema changed.
+
+        @param engine: SQLAlchemy engine object connected to the target database
+        @param bundle_format: 'sql' or 'zip'
+        @param schema: Schema name; None means the engine's default database
+        @return: Tuple of (bundle content, ETag of the content)
+        @raise ValueError: If the format is not supported
+        """
+        if bundle_format not in DDL_BUNDLE_FORMATS:
+            raise ValueError(f"Unsupported DDL bundle format: {bundle_format}")
+
+        metadata = schema_cache.get_metadata(engine, schema)
+        key = schema_cache.make_key(engine, schema) + (bundle_format,)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry['metadata'] is metadata:
+                return entry['content'], entry['etag']
+
+        content = build_ddl_bundle(engine, metadata, bundle_format)
+        etag = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            self._entries[key] = {'metadata': metadata, 'content': content, 'etag': etag}
+        return content, etag
+
+    def invalidate(self) -> None:
+        """
+        Drops every cached bundle.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+ddl_bundle_cache = DDLBundleCache()
+
@@ -1,614 +1,601 @@
-import random
 import string
-from typing import Dict, Any, Set
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Any, Callable, Optional
 
+import numpy as np
 from faker import Faker
+from faker_airtravel.airports import airport_list
+from faker_airtravel.constants import airlines
 
-from util.error.error_handler import exception_handler
+from util.vectorized import (
+    DEFAULT_BATCH_SIZE,
+    datetime_after_column,
+    date_column,
+    datetime_column,
+    decimal_digits_column,
+    enum_column,
+    integer_column,
+    make_rng,
+    null_mask,
+    reference_now,
+    string_column,
+    time_column,
+    to_db_values,
+    to_time_values
+)
+from util.unique_sampler import make_unique_sampler, sequence_domain, string_domain
+from util.value_pool import pool_column
 
+FLIGHTNO_CHARSET = string.ascii_letters + string.digits + string.punctuation
 
-def generate_airline_data(fake, n):
+# faker_airtravel이 가진 실제 ICAO 코드 (airport.icao의 unique 도메인)
+AIRPORT_ICAO_CODES = sorted({airport['icao'] for airport in airport_list if airport['icao']})
+AIRPORT_NAMES = [airport['airport'] for airport in airport_list]
+
+# username = user_name 앞부분 + 고정 길이 숫자, String(20)에 들어가도록 자른다
+USERNAME_SUFFIX_DIGITS = 7
+USERNAME_PREFIX_LENGTH = 20 - USERNAME_SUFFIX_DIGITS
+# fake.password(special_chars=True, length=32)와 같은 문자 집합
+PASSWORD_CHARSET = string.ascii_letters + string.digits + '!@#$%^&*()_+'
+PASSWORD_LENGTH = 32
+
+# employee.department enum
+DEPARTMENTS = ['Marketing', 'Buchhaltung', 'Management', 'Logistik', 'Flugfeld']
+
+UNIX_EPOCH_DATE = date(1970, 1, 1)
+# fake.passport_gender()와 같은 분포 (passport_gender는 전역 random 모듈을 써서 seed가 적용되지 않는다)
+PASSPORT_GENDERS = ['M', 'F', 'X']
+PASSPORT_GENDER_WEIGHTS = [0.493, 0.493, 0.014]
+
+# booking.seat ('??##', 대문자 2개 + 숫자 2개)의 값 개수
+SEAT_CAPACITY = 26 ** 2 * 10 ** 2
+
+
+def flightno_from_index(index: int) -> str:
+    """
+    Maps an index in range(94 ** 3 * 10 ** 4) to a distinct flight number in the '???-####' format.
+    """
+    letters, digits = divmod(index, 10 ** 4)
+    return f"{string_domain(FLIGHTNO_CHARSET, 3)(letters)}-{digits:04d}"
+
+
+def seat_from_index(index: int) -> str:
+    """
+    Maps an index in range(SEAT_CAPACITY) to a distinct seat in the '??##' format (e.g. 'AB12').
+    """
+    letters, digits = divmod(index, 10 ** 2)
+    return f"{string_domain(string.ascii_uppercase, 2)(letters)}{digits:02d}"
+
+
+def passportno_from_index(index: int) -> str:
+    """
+    Maps an index in range(10 ** 9 + 26 * 10 ** 8) to a distinct passport number
+    in one of Faker's formats, '#########' or '?########'.
+    """
+    if index < 10 ** 9:
+        return f"{index:09d}"
+    letter, digits = divmod(index - 10 ** 9, 10 ** 8)
+    return f"{string.ascii_uppercase[letter]}{digits:08d}"
+
+
+def generate_airline_data(fake, n, unique_key=None, offset=0):
     """
     airportdb의 `airline` 테이블에 들어가는 더미데이터를 생성하는 함수
     :param fake: fake 라이브러리 사용을 위한 객체
     :param n: 더미데이터를 생성할 개수
-    :return: 생성한 더미 데이터를 반환합니다.
+    :param unique_key: unique column의 순열을 정하는 key (병렬 shard끼리 공유, None이면 fake에서 뽑는다)
+    :param offset: 이 shard가 순열에서 시작하는 위치
+    :return: 생성한 더미 데이터를 한 행(dictionary)씩 yield 합니다.
     """
-    charset = string.ascii_letters + string.digits + string.punctuation
-    check_duplicate_iata = set()
-    dummy_data = []
+    iata_domain = string_domain(FLIGHTNO_CHARSET, 2)
+    iata_sampler = make_unique_sampler(fake, 'iata', len(FLIGHTNO_CHARSET) ** 2, unique_key, offset)
+    iata_sampler.ensure_capacity(n)
     for i in range(n):
-        airline_iata = fake.lexify(text='??', letters=charset)
-        while airline_iata in check_duplicate_iata:
-            airline_iata = fake.lexify(text='??', letters=charset)
-        check_duplicate_iata.add(airline_iata)
-        airline_name = fake.airline()
+        airline_iata = iata_domain(iata_sampler.next_index())
+        # AirTravelProvider는 전역 random 모듈을 써서 seed가 적용되지 않으므로 fake.random으로 직접 고른다
+        airline_name = fake.random.choice(airlines)
         base_airport = fake.random_int(min=0, max=32000)
 
-    #    dummy_data.append((airline_iata, airline_name, base_airport))
-        dummy_data.append(
-            {
-                "iata": airline_iata,
-                "airlinename": airline_name,
-                "base_airport": base_airport
-            }
-        )
-    return dummy_data
+        yield {
+            "iata": airline_iata,
+            "airlinename": airline_name,
+            "base_airport": base_airport
+        }
 
 
-def generate_airplane_data(fake, n):
+def generate_airplane_data(fake, n, unique_key=None, offset=0):
     """
     airportdb의 `airplane` 테이블에 들어가는 더미데이터를 생성하는 함수
     :param fake: fake 라이브러리 사용을 위한 객체
     :param n: 더미데이터를 생성할 개수
-    :return: 생성한 더미 데이터를 반환합니다.
+    :param unique_key: unique column의 순열을 정하는 key (병렬 shard끼리 공유, None이면 fake에서 뽑는다)
+    :param offset: 이 shard가 순열에서 시작하는 위치
+    :return: 생성한 더미 데이터를 한 행(dictionary)씩 yield 합니다.
     """
 
-    dummy_data = []
     for i in range(n):
         # mediumint unsigned : 0 ~ 16777215
         capacity = fake.random_int(min=2, max=10000000)
         type_id = fake.random_int(min=1, max=20001)
         airline_id = fake.random_int(min=1, max=32767)
 
-        dummy_data.append(
-            {
-                "iata": capacity,
-                "icao": type_id,
-                "name": airline_id
-            }
-        )
-
-    return dummy_data
+        yield {
+            "capacity": capacity,
+            "type_id": type_id,
+            "airline_id": airline_id
+        }
 
 
-def generate_airplane_type_data(fake, n):
+def generate_airplane_type_data(fake, n, unique_key=None, offset=0):
     """
     airportdb의 `airplane_type` 테이블에 들어가는 더미데이터를 생성하는 함수
     :param fake: fake 라이브러리 사용을 위한 객체
     :param n: 더미데이터를 생성할 개수
-    :return: 생성한 더미 데이터를 반환합니다.
+    :param unique_key: unique column의 순열을 정하는 key (병렬 shard끼리 공유, None이면 fake에서 뽑는다)
+    :param offset: 이 shard가 순열에서 시작하는 위치
+    :return: 생성한 더미 데이터를 한 행(dictionary)씩 yield 합니다.
     """
 
-    dummy_data = []
     for i in range(n):
         identifier = fake.bothify('??##', letters=string.ascii_uppercase)
         description = fake.text(max_nb_chars=100)
 
-        dummy_data.append(
-            {
-                "identifier": identifier,
-                "description": description
-            }
-        )
-
-    return dummy_data
+        yield {
+            "identifier": identifier,
+            "description": description
+        }
 
 
-def generate_airport_data(fake, n):
+def generate_airport_data(fake, n, unique_key=None, offset=0):
     """
     airportdb의 `airport` 테이블에 들어가는 더미데이터를 생성하는 함수
     :param fake: fake 라이브러리 사용을 위한 객체
     :param n: 더미데이터를 생성할 개수
-    :return: 생성한 더미 데이터를 반환합니다.
+    :param unique_key: unique column의 순열을 정하는 key (병렬 shard끼리 공유, None이면 fake에서 뽑는다)
+    :param offset: 이 shard가 순열에서 시작하는 위치
+    :return: 생성한 더미 데이터를 한 행(dictionary)씩 yield 합니다.
     """
 
-    check_duplicate_icao = set()
-    dummy_data = []
+    icao_domain = sequence_domain(AIRPORT_ICAO_CODES)
+    icao_sampler = make_unique_sampler(fake, 'icao', len(AIRPORT_ICAO_CODES), unique_key, offset)
+    icao_sampler.ensure_capacity(n)
     for i in range(n):
-        airport_iata = fake.airport_iata()
-        airport_icao = fake.airport_icao()
-        while airport_icao in check_duplicate_icao:
-            airport_icao = fake.airport_icao()
-        check_duplicate_icao.add(airport_icao)
-        airport_name = fake.airport_name()
-
-        dummy_data.append(
-            {
-                "iata": airport_iata,
-                "icao": airport_icao,
-                "name": airport_name
-            }
-        )
+        airport_iata = fake.random.choice(airport_list)['iata']
+        airport_icao = icao_domain(icao_sampler.next_index())
+        airport_name = fake.random.choice(airport_list)['airport']
 
-    return dummy_data
+        yield {
+            "iata": airport_iata,
+            "icao": airport_icao,
+            "name": airport_name
+        }
 
 
-def generate_airport_geo_data(fake, n):
+def generate_airport_geo_data(fake, n, unique_key=None, offset=0):
     """
     airportdb의 `airport_geo` 테이블에 들어가는 더미데이터를 생성하는 함수
     :param fake: fake 라이브러리 사용을 위한 객체
     :param n: 더미데이터를 생성할 개수
-    :return: 생성한 더미 데이터를 반환합니다.
-    """
-
-    check_duplicate_airport_id = set()
-    dummy_data = []
-    for i in range(n):
-        airport_id = fake.random_int(1, 32767)
-        while airport_id in check_duplicate_airport_id:
-            airport_id = fake.random_int(1, 32767)
-        check_duplicate_airport_id.add(airport_id)
-        name = fake.airport_name()
-        city = fake.city()
-        country = fake.country()
-        latitude = fake.latitude()
-        longitude = fake.longitude()
-
-        dummy_data.append(
-            {
-                "airport_id": airport_id,
-                "name": name,
-                "city": city,
-                "country": country,
-                "latitude": latitude,
-                "longitude": longitude,
+    :param unique_key: unique column의 순열을 정하는 key (병렬 shard끼리 공유, None이면 fake에서 뽑는다)
+    :param offset: 이 shard가 순열에서 시작하는 위치
+    :return: 생성한 더미 데이터를 한 행(dictionary)씩 yield 합니다.
+    """
+
+    airport_id_sampler = make_unique_sampler(fake, 'airport_id', 32767, unique_key, offset)
+    airport_id_sampler.ensure_capacity(n)
+    rng = make_rng(fake)
+    locale = fake.locales[0]
+    for start in range(0, n, DEFAULT_BATCH_SIZE):
+        # 문자열 column은 미리 만든 값 pool에서 index 배열로 뽑는다 (util.value_pool)
+        size = min(DEFAULT_BATCH_SIZE, n - start)
+        airport_ids = [1 + index for index in airport_id_sampler.take(size)]
+        names = to_db_values(enum_column(rng, AIRPORT_NAMES, size))
+        cities = pool_column(rng, 'city', size, locale)
+        countries = pool_column(rng, 'country', size, locale)
+        # fake.latitude() / fake.longitude()와 같은 범위, 소수점 6자리
+        latitudes = to_db_values(np.round(rng.uniform(-90, 90, size=size), 6))
+        longitudes = to_db_values(np.round(rng.uniform(-180, 180, size=size), 6))
+
+        for i in range(size):
+            yield {
+                "airport_id": airport_ids[i],
+                "name": names[i],
+                "city": cities[i],
+                "country": countries[i],
+                "latitude": latitudes[i],
+                "longitude": longitudes[i],
             }
-        )
 
-    return dummy_data
 
-
-def generate_airport_reachable_data(fake, n):
+def generate_airport_reachable_data(fake, n, unique_key=None, offset=0):
     """
     airportdb의 `airport_reachable` 테이블에 들어가는 더미데이터를 생성하는 함수
     :param fake: fake 라이브러리 사용을 위한 객체
     :param n: 더미데이터를 생성할 개수
-    :return: 생성한 더미 데이터를 반환합니다.
+    :param unique_key: unique column의 순열을 정하는 key (병렬 shard끼리 공유, None이면 fake에서 뽑는다)
+    :param offset: 이 shard가 순열에서 시작하는 위치
+    :return: 생성한 더미 데이터를 한 행(dictionary)씩 yield 합니다.
     """
 
-    check_duplicate_airport_id = set()
-    dummy_data = []
+    airport_id_sampler = make_unique_sampler(fake, 'airport_id', 32767, unique_key, offset)
+    airport_id_sampler.ensure_capacity(n)
     for i in range(n):
-        airport_id = fake.random_int(1, 32767)
-        while airport_id in check_duplicate_airport_id:
-            airport_id = fake.random_int(1, 32767)
-        check_duplicate_airport_id.add(airport_id)
-        hops = fake.random_int(1, 100) if random.choice([True, False]) else None
-
-        dummy_data.append(
-            {
-                "airport_id": airport_id,
-                "hops": hops
-            }
-        )
+        airport_id = 1 + airport_id_sampler.next_index()
+        hops = fake.random_int(1, 100) if fake.random.choice([True, False]) else None
 
-    return dummy_data
+        yield {
+            "airport_id": airport_id,
+            "hops": hops
+        }
 
 
-def generate_booking_data(fake, n):
+def generate_booking_data(fake, n, unique_key=None, offset=0):
     """
     airportdb의 `booking` 테이블에 들어가는 더미데이터를 생성하는 함수
     :param fake: fake 라이브러리 사용을 위한 객체
     :param n: 더미데이터를 생성할 개수
-    :return: 생성한 더미 데이터를 반환합니다.
+    :param unique_key: unique column의 순열을 정하는 key (병렬 shard끼리 공유, None이면 fake에서 뽑는다)
+    :param offset: 이 shard가 순열에서 시작하는 위치
+    :return: 생성한 더미 데이터를 한 행(dictionary)씩 yield 합니다.
     """
 
-    check_duplicate_flight_id = set()
-    check_duplicate_seat = set()
-    dummy_data = []
+    # seatplan_unq는 (flight_id, seat) 복합 unique이므로 flight_id만 겹치지 않으면 seat는 자유롭게 뽑아도 된다
+    flight_id_sampler = make_unique_sampler(fake, 'flight_id', 400001, unique_key, offset)
+    flight_id_sampler.ensure_capacity(n)
 
     for i in range(n):
         # 항공기 번호가 아니라, 예약 번호인 것 같다.
-        flight_id = fake.random_int(100000, 500000)
-        while flight_id in check_duplicate_flight_id:
-            flight_id = fake.random_int(100000, 500000)
-        check_duplicate_flight_id.add(flight_id)
-        seat = fake.bothify('??##', letters=string.ascii_uppercase) if random.choice([True, False]) else None
-        while seat in check_duplicate_seat:
-            seat = fake.bothify('??##', letters=string.ascii_uppercase) if random.choice([True, False]) else None
-        check_duplicate_seat.add(seat)
+        flight_id = 100000 + flight_id_sampler.next_index()
+        seat = fake.bothify('??##', letters=string.ascii_uppercase) if fake.random.choice([True, False]) else None
         passenger_id = fake.random_int(min=10000, max=30001)
         price = fake.pydecimal(right_digits=2, left_digits=8, positive=True, min_value=0.99, max_value=10000)
 
-        dummy_data.append(
-            {
-                "flight_id": flight_id,
-                "seat": seat,
-                "passenger_id": passenger_id,
-                "price": float(price),
-            }
-        )
+        yield {
+            "flight_id": flight_id,
+            "seat": seat,
+            "passenger_id": passenger_id,
+            "price": float(price),
+        }
 
-    return dummy_data
 
-
-def generate_employee_data(fake, n):
+def generate_employee_data(fake, n, unique_key=None, offset=0):
     """
     airportdb의 `employee` 테이블에 들어가는 더미데이터를 생성하는 함수
     :param fake: fake 라이브러리 사용을 위한 객체
     :param n: 더미데이터를 생성할 개수
-    :return: 생성한 더미 데이터를 반환합니다.
-    """
-
-    # from faker.generator import random
-    check_duplicate_username = set()
-    dummy_data = []
-    for i in range(n):
-        firstname = fake.first_name()
-        lastname = fake.last_name()
-        birthdate = fake.date_between()
-        sex = fake.passport_gender() if random.choice([True, False]) else None
-        street = fake.street_address()
-        city = fake.city()
-
-        zipcode = int(fake.zipcode())
-        while not 0 <= zipcode <= 32767:
-            zipcode = int(fake.zipcode())
-
-        country = fake.country()
-        emailaddress = fake.company_email() if random.choice([True, False]) else None
-        telephoneno = fake.country_calling_code() + fake.basic_phone_number() if random.choice([True, False]) else None
-        salary = fake.pydecimal(
-            right_digits=2,
-            left_digits=6,
-            positive=True,
-            min_value=2000,
-            max_value=50000
-        ) if random.choice([True, False]) else None
-
-        # enum ('Marketing','Buchhaltung','Management','Logistik','Flugfeld']
-        department_list = ['Marketing', 'Buchhaltung', 'Management', 'Logistik', 'Flugfeld']
-        department = random.choice(department_list) if random.choice([True, False]) else None
-
-        username = fake.user_name() if random.choice([True, False]) else None
-        while username in check_duplicate_username:
-            username = fake.user_name() if random.choice([True, False]) else None
-        check_duplicate_username.add(username)
-
-        password = fake.password(special_chars=True, length=32) if username is not None else None
-
-        dummy_data.append(
-            {
-                "firstname": firstname,
-                "lastname": lastname,
-                "birthdate": birthdate,
-                "sex": sex,
-                "street": street,
-                "city": city,
-                "zip": zipcode,
-                "country": country,
-                "emailaddress": emailaddress,
-                "telephoneno": telephoneno,
-                "salary": salary,
-                "department": department,
-                "username": username,
-                "password": password
+    :param unique_key: unique column의 순열을 정하는 key (병렬 shard끼리 공유, None이면 fake에서 뽑는다)
+    :param offset: 이 shard가 순열에서 시작하는 위치
+    :return: 생성한 더미 데이터를 한 행(dictionary)씩 yield 합니다.
+    """
+
+    username_sampler = make_unique_sampler(fake, 'username', 10 ** USERNAME_SUFFIX_DIGITS, unique_key, offset)
+    username_sampler.ensure_capacity(n)
+    # fake.date_between() 기본 범위 (30년 전 ~ 오늘), 기준 시각은 reference_now()
+    today = reference_now().date()
+    birthdate_start = np.datetime64(today - timedelta(days=30 * 365.25), 's')
+    birthdate_end = np.datetime64(today, 's')
+    rng = make_rng(fake)
+    locale = fake.locales[0]
+    for start in range(0, n, DEFAULT_BATCH_SIZE):
+        # 문자열 column은 미리 만든 값 pool에서, 나머지는 batch 단위로 한 번에 생성한다
+        size = min(DEFAULT_BATCH_SIZE, n - start)
+        firstnames = pool_column(rng, 'first_name', size, locale)
+        lastnames = pool_column(rng, 'last_name', size, locale)
+        birthdates = to_db_values(date_column(rng, size, birthdate_start, birthdate_end))
+        sexes = to_db_values(enum_column(rng, PASSPORT_GENDERS, size, PASSPORT_GENDER_WEIGHTS), null_mask(rng, size))
+        streets = pool_column(rng, 'street_address', size, locale)
+        cities = pool_column(rng, 'city', size, locale)
+        zipcodes = pool_column(rng, 'zipcode', size, locale)
+        countries = pool_column(rng, 'country', size, locale)
+        emailaddresses = pool_column(rng, 'company_email', size, locale, mask=null_mask(rng, size))
+        telephonenos = pool_column(rng, 'telephone', size, locale, mask=null_mask(rng, size))
+        salaries = to_db_values(np.round(rng.uniform(2000, 50000, size=size), 2), null_mask(rng, size))
+        departments = to_db_values(enum_column(rng, DEPARTMENTS, size), null_mask(rng, size))
+
+        # 고정 길이 숫자 suffix가 서로 다르므로 prefix가 같아도 username은 겹치지 않는다
+        # suffix는 username이 있는 행에만 순서대로 나눠준다
+        has_username = ~null_mask(rng, size)
+        username_count = int(has_username.sum())
+        prefixes = pool_column(rng, 'user_name', username_count, locale)
+        suffixes = username_sampler.take(username_count)
+        passwords = string_column(rng, PASSWORD_CHARSET, PASSWORD_LENGTH, username_count).tolist()
+        usernames = [None] * size
+        user_passwords = [None] * size
+        for j, i in enumerate(np.flatnonzero(has_username).tolist()):
+            usernames[i] = f"{prefixes[j][:USERNAME_PREFIX_LENGTH]}{suffixes[j]:0{USERNAME_SUFFIX_DIGITS}d}"
+            user_passwords[i] = passwords[j]
+
+        for i in range(size):
+            yield {
+                "firstname": firstnames[i],
+                "lastname": lastnames[i],
+                "birthdate": birthdates[i],
+                "sex": sexes[i],
+                "street": streets[i],
+                "city": cities[i],
+                "zip": zipcodes[i],
+                "country": countries[i],
+                "emailaddress": emailaddresses[i],
+                "telephoneno": telephonenos[i],
+                "salary": salaries[i],
+                "department": departments[i],
+                "username": usernames[i],
+                "password": user_passwords[i]
             }
-        )
 
-    return dummy_data
 
-
-def generate_flight_data(fake, n):
+def generate_flight_data(fake, n, unique_key=None, offset=0):
     """
     airportdb의 `flight` 테이블에 들어가는 더미데이터를 생성하는 함수
     :param fake: fake 라이브러리 사용을 위한 객체
     :param n: 더미데이터를 생성할 개수
-    :return: 생성한 더미 데이터를 반환합니다.
-    """
-    charset = string.ascii_letters + string.digits + string.punctuation
-    check_duplicate_flightno = set()
-    dummy_data = []
-    for i in range(n):
-        flightno = fake.bothify(text="???-####", letters=charset)
-        while flightno in check_duplicate_flightno:
-            flightno = fake.bothify(text="???-####", letters=charset)
-        check_duplicate_flightno.add(flightno)
-
-        _from = random.randint(1, 20001)
-        _to = random.randint(1, 20001)
-        departure_time = fake.date_time()
-        arrival_time = fake.date_time_between(start_date=departure_time)
-        airline_id = random.randint(1, 20001)
-        airplane_id = random.randint(1, 20001)
-
-        dummy_data.append(
-            {
-                "flightno": flightno,
-                "from_airport": _from,
-                "to_airport": _to,
-                "departure": departure_time,
-                "arrival": arrival_time,
-                "airline_id": airline_id,
-                "airplane_id": airplane_id
+    :param unique_key: unique column의 순열을 정하는 key (병렬 shard끼리 공유, None이면 fake에서 뽑는다)
+    :param offset: 이 shard가 순열에서 시작하는 위치
+    :return: 생성한 더미 데이터를 한 행(dictionary)씩 yield 합니다.
+    """
+    flightno_sampler = make_unique_sampler(fake, 'flightno', len(FLIGHTNO_CHARSET) ** 3 * 10 ** 4, unique_key, offset)
+    flightno_sampler.ensure_capacity(n)
+    rng = make_rng(fake)
+    for start in range(0, n, DEFAULT_BATCH_SIZE):
+        # 숫자/날짜 column은 batch 단위로 한 번에 생성 (util.vectorized)
+        size = min(DEFAULT_BATCH_SIZE, n - start)
+        from_airports = to_db_values(integer_column(rng, 1, 20001, size))
+        to_airports = to_db_values(integer_column(rng, 1, 20001, size))
+        departure_times = datetime_column(rng, size)
+        arrival_times = to_db_values(datetime_after_column(rng, departure_times))
+        departure_times = to_db_values(departure_times)
+        airline_ids = to_db_values(integer_column(rng, 1, 20001, size))
+        flightnos = [flightno_from_index(index) for index in flightno_sampler.take(size)]
+        airplane_ids = to_db_values(integer_column(rng, 1, 20001, size))
+
+        for i in range(size):
+            yield {
+                "flightno": flightnos[i],
+                "from_airport": from_airports[i],
+                "to_airport": to_airports[i],
+                "departure": departure_times[i],
+                "arrival": arrival_times[i],
+                "airline_id": airline_ids[i],
+                "airplane_id": airplane_ids[i]
             }
-        )
-
-    return dummy_data
 
 
-def generate_flight_log_data(fake, n):
+def generate_flight_log_data(fake, n, unique_key=None, offset=0):
     """
     airportdb의 `flight_log` 테이블에 들어가는 더미데이터를 생성하는 함수
 
     :param fake: fake 라이브러리 사용을 위한 객체
     :param n: 더미데이터를 생성할 개수
-    :return: 생성한 더미 데이터를 반환합니다.
+    :param unique_key: unique column의 순열을 정하는 key (병렬 shard끼리 공유, None이면 fake에서 뽑는다)
+    :param offset: 이 shard가 순열에서 시작하는 위치
+    :return: 생성한 더미 데이터를 한 행(dictionary)씩 yield 합니다.
     """
     charset = string.ascii_letters + string.digits + string.punctuation
-    dummy_data = []
+    # date_time_this_decade() / date_time_this_year() 범위를 reference_now() 기준으로 계산한다
+    now = reference_now()
+    decade_start = datetime(now.year // 10 * 10, 1, 1)
+    year_start = datetime(now.year, 1, 1)
+    next_year_start = datetime(now.year + 1, 1, 1)
     for i in range(n):
-        log_date = fake.date_time_this_decade()
+        log_date = fake.date_time_between(start_date=decade_start, end_date=now)
         user = fake.user_name()
 
-        flight_id = random.randint(100000, 500000)
+        flight_id = fake.random.randint(100000, 500000)
 
         flightno_old = fake.bothify(text='???-####', letters=charset)
         flightno_new = fake.bothify(text='???-####', letters=charset)
 
-        from_old = random.randint(1, 100)
-        to_old = random.randint(1, 100)
-        from_new = random.randint(1, 100)
-        to_new = random.randint(1, 100)
-
-        departure_old = fake.date_time_this_year(before_now=True, after_now=False)
-        arrival_old = fake.date_time_this_year(before_now=True, after_now=False)
-        departure_new = fake.date_time_this_year(before_now=False, after_now=True)
-        arrival_new = fake.date_time_this_year(before_now=False, after_now=True)
-
-        airplane_id_old = random.randint(1, 20001)
-        airplane_id_new = random.randint(1, 20001)
-        airline_id_old = random.randint(1, 20001)
-        airline_id_new = random.randint(1, 20001)
-
-        comment = fake.text(max_nb_chars=200) if random.choice([True, False]) else None
-
-        dummy_data.append(
-            {
-                "log_date": log_date,
-                "user": user,
-                "flight_id": flight_id,
-                "flightno_old": flightno_old,
-                "flightno_new": flightno_new,
-                "from_old": from_old,
-                "to_old": to_old,
-                "from_new": from_new,
-                "to_new": to_new,
-                "departure_old": departure_old,
-                "arrival_old": arrival_old,
-                "departure_new": departure_new,
-                "arrival_new": arrival_new,
-                "airplane_id_old": airplane_id_old,
-                "airplane_id_new": airplane_id_new,
-                "airline_id_old": airline_id_old,
-                "airline_id_new": airline_id_new,
-                "comment": comment
-            }
-        )
-
-    return dummy_data
-
-
-def generate_flightschedule_data(fake, n):
+        from_old = fake.random.randint(1, 100)
+        to_old = fake.random.randint(1, 100)
+        from_new = fake.random.randint(1, 100)
+        to_new = fake.random.randint(1, 100)
+
+        departure_old = fake.date_time_between(start_date=year_start, end_date=now)
+        arrival_old = fake.date_time_between(start_date=year_start, end_date=now)
+        departure_new = fake.date_time_between(start_date=now, end_date=next_year_start)
+        arrival_new = fake.date_time_between(start_date=now, end_date=next_year_start)
+
+        airplane_id_old = fake.random.randint(1, 20001)
+        airplane_id_new = fake.random.randint(1, 20001)
+        airline_id_old = fake.random.randint(1, 20001)
+        airline_id_new = fake.random.randint(1, 20001)
+
+        comment = fake.text(max_nb_chars=200) if fake.random.choice([True, False]) else None
+
+        yield {
+            "log_date": log_date,
+            "user": user,
+            "flight_id": flight_id,
+            "flightno_old": flightno_old,
+            "flightno_new": flightno_new,
+            "from_old": from_old,
+            "to_old": to_old,
+            "from_new": from_new,
+            "to_new": to_new,
+            "departure_old": departure_old,
+            "arrival_old": arrival_old,
+            "departure_new": departure_new,
+            "arrival_new": arrival_new,
+            "airplane_id_old": airplane_id_old,
+            "airplane_id_new": airplane_id_new,
+            "airline_id_old": airline_id_old,
+            "airline_id_new": airline_id_new,
+            "comment": comment
+        }
+
+
+def generate_flightschedule_data(fake, n, unique_key=None, offset=0):
     """
     airportdb의 `flight_schedule` 테이블에 들어가는 더미데이터를 생성하는 함수
 
     :param fake: fake 라이브러리 사용을 위한 객체
     :param n: 더미데이터를 생성할 개수
-    :return: 생성한 더미 데이터를 반환합니다.
-    """
-
-    charset = string.ascii_letters + string.digits + string.punctuation
-    check_duplicate_flightno = set()
-    dummy_data = []
-    for i in range(n):
-        flightno = fake.bothify(text="???-####", letters=charset)
-        while flightno in check_duplicate_flightno:
-            flightno = fake.bothify(text="???-####", letters=charset)
-        check_duplicate_flightno.add(flightno)
-
-        _from = random.randint(1, 20001)
-        _to = random.randint(1, 20001)
-
-        departure_time = fake.time()
-        arrival_time = fake.time()
-
-        airline_id = random.randint(1, 20001)
-
-        monday = 1 if random.choice([True, False]) else 0
-        tuesday = 1 if random.choice([True, False]) else 0
-        wednesday = 1 if random.choice([True, False]) else 0
-        thursday = 1 if random.choice([True, False]) else 0
-        friday = 1 if random.choice([True, False]) else 0
-        saturday = 1 if random.choice([True, False]) else 0
-        sunday = 1 if random.choice([True, False]) else 0
-
-        dummy_data.append(
-            {
-                "flightno": flightno,
-                "from": _from,
-                "to": _to,
-                "departure": departure_time,
-                "arrival": arrival_time,
-                "airline_id": airline_id,
-                "monday": monday,
-                "tuesday": tuesday,
-                "wednesday": wednesday,
-                "thursday": thursday,
-                "friday": friday,
-                "saturday": saturday,
-                "sunday": sunday
+    :param unique_key: unique column의 순열을 정하는 key (병렬 shard끼리 공유, None이면 fake에서 뽑는다)
+    :param offset: 이 shard가 순열에서 시작하는 위치
+    :return: 생성한 더미 데이터를 한 행(dictionary)씩 yield 합니다.
+    """
+
+    flightno_sampler = make_unique_sampler(fake, 'flightno', len(FLIGHTNO_CHARSET) ** 3 * 10 ** 4, unique_key, offset)
+    flightno_sampler.ensure_capacity(n)
+    weekdays = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+    rng = make_rng(fake)
+    for start in range(0, n, DEFAULT_BATCH_SIZE):
+        # 숫자/시간 column은 batch 단위로 한 번에 생성 (util.vectorized)
+        size = min(DEFAULT_BATCH_SIZE, n - start)
+        from_airports = to_db_values(integer_column(rng, 1, 20001, size))
+        to_airports = to_db_values(integer_column(rng, 1, 20001, size))
+        departure_times = to_time_values(time_column(rng, size))
+        arrival_times = to_time_values(time_column(rng, size))
+        airline_ids = to_db_values(integer_column(rng, 1, 20001, size))
+        flightnos = [flightno_from_index(index) for index in flightno_sampler.take(size)]
+        weekday_flags = {weekday: to_db_values(integer_column(rng, 0, 1, size)) for weekday in weekdays}
+
+        for i in range(size):
+            row = {
+                "flightno": flightnos[i],
+                "from_airport": from_airports[i],
+                "to_airport": to_airports[i],
+                "departure": departure_times[i],
+                "arrival": arrival_times[i],
+                "airline_id": airline_ids[i]
             }
-        )
-
-    return dummy_data
+            for weekday in weekdays:
+                row[weekday] = weekday_flags[weekday][i]
+            yield row
 
 
-def generate_passenger_data(fake, n):
+def generate_passenger_data(fake, n, unique_key=None, offset=0):
     """
     airportdb의 `passenger` 테이블에 들어가는 더미데이터를 생성하는 함수
 
     :param fake: fake 라이브러리 사용을 위한 객체
     :param n: 더미데이터를 생성할 개수
-    :return: 생성한 더미 데이터를 반환합니다.
-    """
-
-    check_duplicate_passportno = set()
-    dummy_data = []
-    for i in range(n):
-        passportno = fake.passport_number()
-        while passportno in check_duplicate_passportno:
-            passportno = fake.passport_number()
-        check_duplicate_passportno.add(passportno)
-
-        first_name = fake.first_name()
-        last_name = fake.last_name()
-
-        dummy_data.append(
-            {
-                "passportno": passportno,
-                "firstname": first_name,
-                "lastname": last_name
+    :param unique_key: unique column의 순열을 정하는 key (병렬 shard끼리 공유, None이면 fake에서 뽑는다)
+    :param offset: 이 shard가 순열에서 시작하는 위치
+    :return: 생성한 더미 데이터를 한 행(dictionary)씩 yield 합니다.
+    """
+
+    passportno_sampler = make_unique_sampler(fake, 'passportno', 10 ** 9 + 26 * 10 ** 8, unique_key, offset)
+    passportno_sampler.ensure_capacity(n)
+    rng = make_rng(fake)
+    locale = fake.locales[0]
+    for start in range(0, n, DEFAULT_BATCH_SIZE):
+        size = min(DEFAULT_BATCH_SIZE, n - start)
+        passportnos = [passportno_from_index(index) for index in passportno_sampler.take(size)]
+        first_names = pool_column(rng, 'first_name', size, locale)
+        last_names = pool_column(rng, 'last_name', size, locale)
+
+        for i in range(size):
+            yield {
+                "passportno": passportnos[i],
+                "firstname": first_names[i],
+                "lastname": last_names[i]
             }
-        )
-    return dummy_data
 
 
-def generate_passengerdetails_data(fake, n):
+def generate_passengerdetails_data(fake, n, unique_key=None, offset=0):
     """
     airportdb의 `passenger_details` 테이블에 들어가는 더미데이터를 생성하는 함수
 
     :param fake: fake 라이브러리 사용을 위한 객체
     :param n: 더미데이터를 생성할 개수
-    :return: 생성한 더미 데이터를 반환합니다.
-    """
-
-    check_duplicate_passenger_id = set()
-    dummy_data = []
-    for i in range(n):
-        passenger_id = random.randint(1, 20001)
-        while passenger_id in check_duplicate_passenger_id:
-            passenger_id = random.randint(1, 20001)
-        check_duplicate_passenger_id.add(passenger_id)
-
-        birthdate = fake.date()
-        sex = fake.passport_gender() if random.choice([True, False]) else None
-        street = fake.street_address()
-        city = fake.city()
-        zipcode = int(fake.zipcode())
-        while not 0 <= zipcode <= 32767:
-            zipcode = int(fake.zipcode())
-        country = fake.country()
-        emailaddress = fake.company_email() if random.choice([True, False]) else None
-        telephoneno = fake.country_calling_code() + fake.basic_phone_number() if random.choice([True, False]) else None
-
-        dummy_data.append(
-            {
-                "passenger_id": passenger_id,
-                "birthdate": birthdate,
-                "sex": sex,
-                "street": street,
-                "city": city,
-                "zip": zipcode,
-                "country": country,
-                "emailaddress": emailaddress,
-                "telephoneno": telephoneno
+    :param unique_key: unique column의 순열을 정하는 key (병렬 shard끼리 공유, None이면 fake에서 뽑는다)
+    :param offset: 이 shard가 순열에서 시작하는 위치
+    :return: 생성한 더미 데이터를 한 행(dictionary)씩 yield 합니다.
+    """
+
+    passenger_id_sampler = make_unique_sampler(fake, 'passenger_id', 20001, unique_key, offset)
+    passenger_id_sampler.ensure_capacity(n)
+    rng = make_rng(fake)
+    locale = fake.locales[0]
+    for start in range(0, n, DEFAULT_BATCH_SIZE):
+        size = min(DEFAULT_BATCH_SIZE, n - start)
+        passenger_ids = [1 + index for index in passenger_id_sampler.take(size)]
+        # fake.date()와 같은 범위 (1970-01-01 ~ 오늘)
+        birthdates = to_db_values(date_column(rng, size))
+        sexes = to_db_values(enum_column(rng, PASSPORT_GENDERS, size, PASSPORT_GENDER_WEIGHTS), null_mask(rng, size))
+        streets = pool_column(rng, 'street_address', size, locale)
+        cities = pool_column(rng, 'city', size, locale)
+        zipcodes = pool_column(rng, 'zipcode', size, locale)
+        countries = pool_column(rng, 'country', size, locale)
+        emailaddresses = pool_column(rng, 'company_email', size, locale, mask=null_mask(rng, size))
+        telephonenos = pool_column(rng, 'telephone', size, locale, mask=null_mask(rng, size))
+
+        for i in range(size):
+            yield {
+                "passenger_id": passenger_ids[i],
+                "birthdate": birthdates[i],
+                "sex": sexes[i],
+                "street": streets[i],
+                "city": cities[i],
+                "zip": zipcodes[i],
+                "country": countries[i],
+                "emailaddress": emailaddresses[i],
+                "telephoneno": telephonenos[i]
             }
-        )
 
-    return dummy_data
 
-
-@exception_handler
-def generate_weatherdata_data(fake, n):
+def generate_weatherdata_data(fake, n, unique_key=None, offset=0):
     """
     airportdb의 `weatherdata` 테이블에 들어가는 더미데이터를 생성하는 함수
     :param fake: fake 라이브러리 사용을 위한 객체
     :param n: 더미데이터를 생성할 개수
-    :return: 생성한 더미 데이터를 반환합니다.
-    """
-
-    check_duplicate_log_date = set()
-    check_duplicate_time = set()
-    check_duplicate_station = set()
-    dummy_data = []
-    for i in range(n):
-        log_date = fake.date()
-        while log_date in check_duplicate_log_date:
-            log_date = fake.date()
-        check_duplicate_log_date.add(log_date)
-
-        _time = fake.time()
-        while _time in check_duplicate_time:
-            _time = fake.time()
-        check_duplicate_time.add(_time)
-
-        station = random.randint(1, 20001)
-        while station in check_duplicate_station:
-            station = random.randint(1, 20001)
-        check_duplicate_station.add(station)
-
-        temperature = float(fake.pydecimal(left_digits=2, right_digits=1, positive=True))
-        humidity = float(fake.pydecimal(left_digits=3, right_digits=1, positive=True))
-        airpressure = float(fake.pydecimal(left_digits=8, right_digits=2, positive=True))
-        wind = float(fake.pydecimal(left_digits=3, right_digits=2, positive=True))
-        weather_enums = ['Nebel-Schneefall', 'Schneefall', 'Regen', 'Regen-Schneefall', 'Nebel-Regen',
-                         'Nebel-Regen-Gewitter', 'Gewitter', 'Nebel', 'Regen-Gewitter']
-        weather = random.choice(weather_enums) if random.choice([True, False]) else None
-        winddirection = random.randint(0, 360)
-
-        dummy_data.append(
-            {
-                "log_date": log_date,
-                "time": _time,
-                "station": station,
-                "temp": temperature,
-                "humidity": humidity,
-                "airpressure": airpressure,
-                "wind": wind,
-                "weather": weather,
-                "winddirection": winddirection
+    :param unique_key: unique column의 순열을 정하는 key (병렬 shard끼리 공유, None이면 fake에서 뽑는다)
+    :param offset: 이 shard가 순열에서 시작하는 위치
+    :return: 생성한 더미 데이터를 한 행(dictionary)씩 yield 합니다.
+    """
+
+    # log_date, time, station은 각각 unique (1970-01-01 ~ 오늘, 하루의 초, 1 ~ 20001)
+    log_date_sampler = make_unique_sampler(fake, 'log_date', (reference_now().date() - UNIX_EPOCH_DATE).days + 1, unique_key, offset)
+    time_sampler = make_unique_sampler(fake, 'time', 86400, unique_key, offset)
+    station_sampler = make_unique_sampler(fake, 'station', 20001, unique_key, offset)
+    for sampler in (log_date_sampler, time_sampler, station_sampler):
+        sampler.ensure_capacity(n)
+    weather_enums = ['Nebel-Schneefall', 'Schneefall', 'Regen', 'Regen-Schneefall', 'Nebel-Regen',
+                     'Nebel-Regen-Gewitter', 'Gewitter', 'Nebel', 'Regen-Gewitter']
+    rng = make_rng(fake)
+    for start in range(0, n, DEFAULT_BATCH_SIZE):
+        # 측정값 column은 batch 단위로 한 번에 생성 (util.vectorized)
+        size = min(DEFAULT_BATCH_SIZE, n - start)
+        temperatures = to_db_values(decimal_digits_column(rng, 2, 1, size))
+        humidities = to_db_values(decimal_digits_column(rng, 3, 1, size))
+        airpressures = to_db_values(decimal_digits_column(rng, 8, 2, size))
+        winds = to_db_values(decimal_digits_column(rng, 3, 2, size))
+        weathers = to_db_values(enum_column(rng, weather_enums, size), null_mask(rng, size))
+        winddirections = to_db_values(integer_column(rng, 0, 360, size))
+        log_dates = [UNIX_EPOCH_DATE + timedelta(days=index) for index in log_date_sampler.take(size)]
+        times = [time(index // 3600, index // 60 % 60, index % 60) for index in time_sampler.take(size)]
+        stations = [1 + index for index in station_sampler.take(size)]
+
+        for i in range(size):
+            yield {
+                "log_date": log_dates[i],
+                "time": times[i],
+                "station": stations[i],
+                "temp": temperatures[i],
+                "humidity": humidities[i],
+                "airpressure": airpressures[i],
+                "wind": winds[i],
+                "weather": weathers[i],
+                "winddirection": winddirections[i]
             }
-        )
-
-    return dummy_data
-
-
-def generate_distinct_integer(data_type: str, check_num_duplicate: Set[int]) -> int:
-    """
-    Function to generate distinct integer
-
-    @param data_type:
-    @param check_num_duplicate:
-    @return: Returns generated unique integer
-    """
-
-    generated_int = random.randint(1, 20001) if data_type != "TINYINT" else random.randint(0, 2)
-    while generated_int in check_num_duplicate:
-        generated_int = random.randint(1, 20001) if data_type != "TINYINT" else random.randint(0, 2)
-    check_num_duplicate.add(generated_int)
-    return generated_int
 
 
-def generate_distinct_characters(fake: Faker, charset: str, size: int, check_str_duplicate: Set[str]) -> str:
+def make_column_generator(fake: Faker, type_detail: Dict[str, Any], unique_key: Optional[int] = None,
+                          offset: int = 0) -> Callable[[], Any]:
     """
-    Function to generate distinct characters or string type
-
-    @param fake:
-    @param charset:
-    @param size:
-    @param check_str_duplicate:
-    @return: Returns generated unique characters (String)
-    """
-
-    generated_char = fake.lexify('?' * size, letters=charset)
-    while generated_char in check_str_duplicate:
-        generated_char = fake.lexify('?' * size, letters=charset)
-    check_str_duplicate.add(str(generated_char))
-    return generated_char
+    Resolves type_detail once and returns a zero-argument function generating values for that column.
 
+    The type dispatch, charset and size are resolved here, not on every call,
+    so the returned function only does the actual random generation.
+    Primary key and unique INTEGER/CHAR/VARCHAR columns draw from a UniqueSampler (see util.unique_sampler),
+    so every value costs O(1) and the function raises ValueError once the column's domain is exhausted.
 
-@exception_handler
-def generate_data_with_type(fake: Faker, type_detail: Dict[str, Any], check_str_duplicate: Set[str], check_num_duplicate: Set[int]) -> Any:
-    """
-    Generate data using type_detail
-
-    @param fake:
-    @param type_detail:
-    @param check_str_duplicate:
-    @param check_num_duplicate:
-    @return: Returns one specific type of data
+    @param fake: Faker object used to generate fake data
+    @param type_detail: Column type details (see row_plan.get_column_type_detail())
+    @param unique_key: Shared key choosing the permutation of unique columns (None: drawn from fake)
+    @param offset: First permutation position used by unique columns
+    @return: Function returning one generated value per call
     """
 
     data_type = type_detail['type']
@@ -616,48 +603,52 @@ def generate_data_with_type(fake: Faker, type_detail: Dict[str, Any], check_str_
     decimal_place = type_detail.get('decimal_place')
     is_primary = type_detail.get('primary') == 'True'
     is_unique = type_detail.get('unique') == 'True'
+    col_name = type_detail.get('col_name') or 'value'
 
     if data_type in ["INTEGER", "SMALLINT", "MEDIUMINT", "TINYINT"]:
+        # TINYINT가 적용된 column이 0 또는 1만 사용하므로
+        low, high = (1, 20001) if data_type != "TINYINT" else (0, 2)
         if is_primary or is_unique:
-            return generate_distinct_integer(data_type, check_num_duplicate)
-        else:
-            # TINYINT가 적용된 column이 0 또는 1만 사용하므로
-            return random.randint(1, 20001) if data_type != "TINYINT" else random.randint(0, 2)
+            sampler = make_unique_sampler(fake, col_name, high - low + 1, unique_key, offset)
+            return lambda: low + sampler.next_index()
+        return lambda: fake.random.randint(low, high)
 
     elif data_type in ["CHAR", "VARCHAR", "TEXT"]:
         charset = string.ascii_letters + string.digits + string.punctuation
+        if data_type in ["CHAR", "VARCHAR"] and size and (is_primary or is_unique):
+            domain = string_domain(charset, size)
+            sampler = make_unique_sampler(fake, col_name, len(charset) ** size, unique_key, offset)
+            return lambda: domain(sampler.next_index())
         if data_type == "CHAR" and size:  # char
-            if is_primary or is_unique:
-                return generate_distinct_characters(fake, charset, size, check_str_duplicate)
-            return fake.lexify('?' * size, letters=charset)
+            pattern = '?' * size
+            return lambda: fake.lexify(pattern, letters=charset)
         elif data_type == "VARCHAR" and size:  # varchar
-            if is_primary or is_unique:
-                return generate_distinct_characters(fake, charset, size, check_str_duplicate)
-            return fake.text(max_nb_chars=size)
+            return lambda: fake.text(max_nb_chars=size)
         else:  # text
-            return fake.text()
+            return fake.text
 
     elif data_type in ["DECIMAL"]:
         if size and decimal_place:
             max_value = 10 ** (size - decimal_place) - 1
-            return round(random.uniform(0, max_value), decimal_place)
+            return lambda: round(fake.random.uniform(0, max_value), decimal_place)
         else:
-            return round(random.uniform(0, 10000), 2)
+            return lambda: round(fake.random.uniform(0, 10000), 2)
 
+    # 기준 시각은 row마다 읽는다 (plan을 만든 뒤 pinned_reference_time() 안에서 생성할 수 있도록)
     elif data_type in ["DATE"]:
-        return fake.date()
+        return lambda: fake.date(end_datetime=reference_now())
 
     elif data_type in ["TIME"]:
-        return fake.time()
+        return lambda: fake.time(end_datetime=reference_now())
 
     elif data_type in ["DATETIME"]:
-        return fake.date_time()
+        return lambda: fake.date_time(end_datetime=reference_now())
 
     elif data_type in ["ENUM"]:
-        if 'enum_values' in type_detail:
-            return random.choice(type_detail['enum_values'])
-        else:
-            return None
+        enum_values = type_detail.get('enum_values')
+        if enum_values:
+            return lambda: fake.random.choice(enum_values)
+        return lambda: None
 
     else:
-        return None
+        return lambda: None
@@ -3,6 +3,8 @@ import traceback
 
 from sqlalchemy.exc import IntegrityError
 
+from util.metrics import HANDLED_EXCEPTIONS
+
 
 def exception_handler(func):
     @functools.wraps(func)
@@ -10,12 +12,16 @@ def exception_handler(func):
         try:
             return func(*args, **kwargs)
         except IntegrityError as ite:
+            HANDLED_EXCEPTIONS.labels(func.__qualname__, type(ite).__name__).inc()
             print(traceback.format_exc())
         except KeyboardInterrupt as ki:
+            HANDLED_EXCEPTIONS.labels(func.__qualname__, type(ki).__name__).inc()
             print(traceback.format_exc())
         except ValueError as ve:
+            HANDLED_EXCEPTIONS.labels(func.__qualname__, type(ve).__name__).inc()
             print(traceback.format_exc())
         except Exception as e:
+            HANDLED_EXCEPTIONS.labels(func.__qualname__, type(e).__name__).inc()
             print(traceback.format_exc())
 
     return wrapper
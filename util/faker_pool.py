@@ -0,0 +1,142 @@
+import secrets
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from faker import Faker
+from faker_airtravel import AirTravelProvider
+
+DEFAULT_LOCALE = 'en_US'
+# 반환된 인스턴스를 남겨두는 최대 개수
+DEFAULT_MAX_IDLE = 8
+
+
+class FakerPool:
+    def __init__(self, locale: str = DEFAULT_LOCALE, max_idle: int = DEFAULT_MAX_IDLE):
+        """
+        Pool of ready-to-use Faker objects of one locale, with the AirTravelProvider already added.
+
+        Building a Faker and adding its providers takes milliseconds, so requests, jobs and shards check an
+        instance out instead. An instance is used by one thread at a time and has its own random state
+        (Faker objects that were never seeded share one module level Random), so concurrent users never
+        share RNG state. Returned instances wait in a shared idle list of at most max_idle, so they are
+        reused even by servers that start a new thread per request. A thread prefers the instance it
+        returned last if that one is still idle (thread affinity), otherwise it takes any idle instance.
+
+        @param locale: Faker locale of the instances
+        @param max_idle: Maximum number of returned instances kept
+        """
+        self.locale = locale
+        self.max_idle = max_idle
+        self._idle: List[Faker] = []
+        self._lock = threading.Lock()
+        # thread마다 마지막으로 반환한 인스턴스 (weakref라서 idle list에서 버려진 인스턴스를 붙잡지 않는다)
+        self._local = threading.local()
+        self.created = 0
+
+    def _create(self) -> Faker:
+        fake = Faker(self.locale)
+        fake.add_provider(AirTravelProvider)
+        # 전역 Random을 공유하지 않도록 인스턴스마다 따로 seed 한다
+        fake.seed_instance(secrets.randbits(64))
+        with self._lock:
+            self.created += 1
+        return fake
+
+    def checkout(self, seed: Optional[int] = None) -> Faker:
+        """
+        Takes an instance out of the pool, creating one if none is idle.
+
+        @param seed: If given, the instance is re-seeded, so it produces the same values as a new Faker seeded
+                     with seed; otherwise it continues its own random stream
+        @return: Faker object owned by the caller until checkin()
+        """
+        last_ref = getattr(self._local, 'last', None)
+        preferred = last_ref() if last_ref is not None else None
+        fake = None
+        with self._lock:
+            if preferred is not None:
+                for index in range(len(self._idle) - 1, -1, -1):
+                    if self._idle[index] is preferred:
+                        fake = self._idle.pop(index)
+                        break
+            if fake is None and self._idle:
+                fake = self._idle.pop()
+        if fake is None:
+            fake = self._create()
+        if seed is not None:
+            fake.seed_instance(seed)
+        return fake
+
+    def checkin(self, fake: Faker) -> None:
+        """
+        Returns an instance to the pool. Do not use it afterwards.
+
+        @param fake: Faker object from checkout()
+        """
+        fake.unique.clear()
+        # seed를 받아 썼던 인스턴스의 고정된 random 상태를 다음 (unseeded) 사용자가 이어받지 않도록 다시 seed 한다
+        fake.seed_instance(secrets.randbits(64))
+        self._local.last = weakref.ref(fake)
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(fake)
+
+    @contextmanager
+    def faker(self, seed: Optional[int] = None) -> Iterator[Faker]:
+        """
+        Checks an instance out for the duration of a with block.
+
+        @param seed: Optional seed (see checkout())
+        @return: Faker object
+        """
+        fake = self.checkout(seed)
+        try:
+            yield fake
+        finally:
+            self.checkin(fake)
+
+    def warm(self, count: int) -> None:
+        """
+        Creates instances up front so the first requests do not pay for them.
+
+        @param count: Number of idle instances to have (at most max_idle)
+        """
+        with self._lock:
+            missing = min(count, self.max_idle) - len(self._idle)
+        fakes = [self._create() for _ in range(missing)]
+        with self._lock:
+            self._idle.extend(fakes[:self.max_idle - len(self._idle)])
+
+
+_pools: Dict[str, FakerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_faker_pool(locale: str = DEFAULT_LOCALE) -> FakerPool:
+    """
+    Returns the process-wide FakerPool of a locale.
+
+    @param locale: Faker locale
+    @return: FakerPool shared by every caller using the same locale
+    """
+    with _pools_lock:
+        pool = _pools.get(locale)
+        if pool is None:
+            pool = FakerPool(locale)
+            _pools[locale] = pool
+        return pool
+
+
+@contextmanager
+def pooled_faker(seed: Optional[int] = None, locale: str = DEFAULT_LOCALE) -> Iterator[Faker]:
+    """
+    Checks a Faker object out of the process-wide pool of a locale for the duration of a with block.
+
+    @param seed: Optional seed; the same seed always gives the same values
+    @param locale: Faker locale
+    @return: Faker object with the AirTravelProvider
+    """
+    with get_faker_pool(locale).faker(seed) as fake:
+        yield fake
@@ -0,0 +1,176 @@
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Engine
+
+from util.metrics import REFLECTION_SECONDS, install_inspector_cache_metrics
+from util.schema_cache import invalidate_schema_cache
+
+# Inspector method -> 캐시 유지 시간(초)
+DEFAULT_INSPECTOR_TTLS = {
+    'get_schema_names': 300.0,
+    'get_table_names': 60.0,
+    'get_view_names': 60.0,
+    'get_view_definition': 60.0,
+    'get_columns': 60.0,
+    'get_pk_constraint': 60.0
+}
+
+DDL_STATEMENT_PATTERN = re.compile(r'^\s*(CREATE|ALTER|DROP|RENAME)\b', re.I)
+
+
+class CachedInspector:
+    def __init__(self, engine: Engine, ttls: Optional[Dict[str, float]] = None):
+        """
+        Thread-safe, TTL-bounded cache in front of the SQLAlchemy Inspector methods used by the /show endpoints.
+
+        It has the same method names and arguments as Inspector, so it can be passed wherever an Inspector is
+        expected. Every entry expires after the TTL of its method; a miss runs the call on a fresh Inspector,
+        so SQLAlchemy's own never-expiring info_cache is not shared between requests.
+        Returned lists and dictionaries are shared by every caller, do not modify them.
+
+        @param engine: SQLAlchemy engine object connected to the target database
+        @param ttls: Optional TTL overrides in seconds, keyed by Inspector method name
+        """
+        self.engine = engine
+        self._ttls = {**DEFAULT_INSPECTOR_TTLS, **(ttls or {})}
+        self._entries: Dict[Tuple, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _get(self, method: str, *args) -> Any:
+        key = (method,) + args
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            generation = self._generation
+
+        with REFLECTION_SECONDS.labels(method).time():
+            value = getattr(inspect(self.engine), method)(*args)
+
+        with self._lock:
+            # 조회하는 동안 invalidate()가 불렸다면 오래된 값일 수 있으므로 저장하지 않는다
+            if generation == self._generation:
+                self._entries[key] = (value, time.monotonic() + self._ttls[method])
+        return value
+
+    def get_schema_names(self) -> List[str]:
+        return self._get('get_schema_names')
+
+    def get_table_names(self, schema: Optional[str] = None) -> List[str]:
+        return self._get('get_table_names', schema)
+
+    def get_view_names(self, schema: Optional[str] = None) -> List[str]:
+        return self._get('get_view_names', schema)
+
+    def get_view_definition(self, view_name: str, schema: Optional[str] = None) -> str:
+        return self._get('get_view_definition', view_name, schema)
+
+    def get_columns(self, table_name: str, schema: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self._get('get_columns', table_name, schema)
+
+    def get_pk_constraint(self, table_name: str, schema: Optional[str] = None) -> Dict[str, Any]:
+        return self._get('get_pk_constraint', table_name, schema)
+
+    def invalidate(self) -> None:
+        """
+        Drops every cached entry.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cache counters.
+
+        @return: Dictionary with 'hits', 'misses', 'invalidations' and 'entries'
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'entries': len(self._entries)
+            }
+
+
+_cached_inspectors: Dict[Engine, CachedInspector] = {}
+_registry_lock = threading.Lock()
+
+
+def get_cached_inspector(engine: Engine) -> CachedInspector:
+    """
+    Returns the process-wide CachedInspector of an engine and makes sure DDL run on the engine invalidates it.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @return: CachedInspector shared by every caller using the same engine
+    """
+    with _registry_lock:
+        cached_inspector = _cached_inspectors.get(engine)
+        if cached_inspector is None:
+            cached_inspector = CachedInspector(engine)
+            _cached_inspectors[engine] = cached_inspector
+            install_ddl_invalidation(engine)
+        return cached_inspector
+
+
+def registered_inspectors() -> List[CachedInspector]:
+    """
+    Returns the cached inspectors created so far (e.g. for the cache counters of util.metrics).
+
+    @return: List of shared CachedInspector objects
+    """
+    with _registry_lock:
+        return list(_cached_inspectors.values())
+
+
+def invalidate_metadata_caches(engine: Optional[Engine] = None) -> None:
+    """
+    Invalidates the inspector cache and the reflected schema cache (see util.schema_cache). Call this after DDL.
+
+    @param engine: Engine whose caches are dropped; None drops the caches of every engine
+    """
+    with _registry_lock:
+        cached_inspectors = list(_cached_inspectors.values()) if engine is None else \
+            [_cached_inspectors[engine]] if engine in _cached_inspectors else []
+    for cached_inspector in cached_inspectors:
+        cached_inspector.invalidate()
+    invalidate_schema_cache(engine)
+
+
+def clear_cached_inspectors() -> None:
+    """
+    Forgets every CachedInspector, e.g. after the engines they belong to were disposed.
+    """
+    with _registry_lock:
+        _cached_inspectors.clear()
+
+
+def _invalidate_after_ddl(conn, cursor, statement, parameters, context, executemany) -> None:
+    if DDL_STATEMENT_PATTERN.match(statement):
+        invalidate_metadata_caches(conn.engine)
+
+
+def install_ddl_invalidation(engine: Engine) -> None:
+    """
+    Registers an after_cursor_execute listener that invalidates the metadata caches of the engine whenever
+    a CREATE / ALTER / DROP / RENAME statement runs on it (create_all(), migrations, manual DDL).
+
+    @param engine: SQLAlchemy engine object
+    """
+    if not event.contains(engine, 'after_cursor_execute', _invalidate_after_ddl):
+        event.listen(engine, 'after_cursor_execute', _invalidate_after_ddl)
+
+
+install_inspector_cache_metrics(registered_inspectors)
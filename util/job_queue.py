@@ -0,0 +1,309 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.engine import Engine
+
+from models.GenerationJobModel import GenerationJobModel
+from util.database_utils import (
+    DEFAULT_CHUNK_SIZE,
+    INTERNAL_TABLES,
+    create_all_dummy,
+    get_all_tables_from_database,
+    insert_dummy_data
+)
+from util.dataset_cache import SEEDED_REFERENCE_TIME, get_seeded_dataset, is_dataset_cached
+from util.faker_pool import pooled_faker
+from util.load_data import load_dummy_data
+from util.relational_generator import create_relational_dummy
+from util.parallel_generator import generate_parallel
+from util.profiling import profiled
+from util.utils import table_mapper
+from util.vectorized import pinned_reference_time
+
+DEFAULT_POLL_INTERVAL = 1.0
+PROGRESS_UPDATE_INTERVAL = 1.0
+HEARTBEAT_INTERVAL = 10.0
+# heartbeat가 이 시간 이상 끊긴 running job은 worker가 죽은 것으로 보고 failed로 바꾼다
+STALE_JOB_TIMEOUT = 60.0
+
+job_table = GenerationJobModel.__table__
+
+
+def count_job_rows(engine: Engine, kind: str, params: Dict[str, Any]) -> int:
+    """
+    Computes how many rows a job will insert (its rows_total).
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param kind: 'table' or 'all' (see enqueue_job())
+    @param params: Validated job parameters (see enqueue_job())
+    @return: generate_num for 'table' jobs, the sum over every table of the database for 'all' jobs
+    """
+    if kind != 'all':
+        return params['generate_num']
+    tables = [table for table in get_all_tables_from_database(engine) if table not in INTERNAL_TABLES]
+    table_counts = params.get('table_counts') or {}
+    return sum(table_counts.get(table, params['generate_num']) for table in tables)
+
+
+def enqueue_job(engine: Engine, kind: str, params: Dict[str, Any]) -> int:
+    """
+    Stores a generation job in the generation_job table so a worker can pick it up.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param kind: 'table' (one table, like /generate/table) or 'all' (every table, like /generate/all)
+    @param params: Validated request parameters (generate_num, mode, chunk_size, stream, optional seed, profile,
+                   for 'table' jobs table_name, workers, load_strategy, for 'all' jobs relational, table_counts)
+    @return: ID of the queued job
+    """
+    rows_total = count_job_rows(engine, kind, params)
+    with engine.begin() as connection:
+        result = connection.execute(
+            job_table.insert().values(
+                kind=kind,
+                params=params,
+                state='queued',
+                rows_total=rows_total,
+                rows_done=0,
+                created_at=datetime.now()
+            )
+        )
+        return result.inserted_primary_key[0]
+
+
+def get_job(engine: Engine, job_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Reads the current state of a job.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param job_id: ID of the job
+    @return: Dictionary of the job's columns, or None if the job does not exist
+    """
+    with engine.connect() as connection:
+        row = connection.execute(select(job_table).where(job_table.c.job_id == job_id)).mappings().first()
+        return dict(row) if row is not None else None
+
+
+def claim_job(engine: Engine, worker_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Atomically takes the oldest queued job and marks it running.
+
+    SELECT ... FOR UPDATE SKIP LOCKED lets several workers poll the table at the same time
+    without blocking on, or taking, the same job.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param worker_name: Name stored in the job's worker column
+    @return: The claimed job (see get_job()), or None if the queue is empty
+    """
+    now = datetime.now()
+    with engine.begin() as connection:
+        job_id = connection.execute(
+            select(job_table.c.job_id)
+            .where(job_table.c.state == 'queued')
+            .order_by(job_table.c.job_id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        ).scalar()
+        if job_id is None:
+            return None
+        connection.execute(
+            update(job_table).where(job_table.c.job_id == job_id).values(
+                state='running',
+                worker=worker_name,
+                rows_done=0,
+                rows_per_sec=None,
+                error=None,
+                started_at=now,
+                heartbeat_at=now
+            )
+        )
+    return get_job(engine, job_id)
+
+
+def fail_stale_jobs(engine: Engine, timeout: float = STALE_JOB_TIMEOUT) -> int:
+    """
+    Marks running jobs whose worker stopped sending heartbeats as failed.
+
+    Abandoned jobs are not re-run: the chunks they inserted are already committed, so running them again
+    from row 0 would insert more than generate_num rows (or fail on unique columns), and rows_done is only
+    saved about once per PROGRESS_UPDATE_INTERVAL, so it can not tell where to resume. The rows inserted so
+    far stay in the table; rows_done is a lower bound of them. Queue a new job (with mode 'y' to start over)
+    if the data is still needed.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param timeout: Seconds without heartbeat after which a running job is considered abandoned
+    @return: Number of jobs marked failed
+    """
+    with engine.begin() as connection:
+        result = connection.execute(
+            update(job_table)
+            .where(job_table.c.state == 'running')
+            .where(job_table.c.heartbeat_at < datetime.now() - timedelta(seconds=timeout))
+            .values(
+                state='failed',
+                error=f"Abandoned: the worker stopped sending heartbeats for {timeout:.0f}s. "
+                      f"The rows inserted before that (at least rows_done) were kept",
+                finished_at=datetime.now()
+            )
+        )
+        return result.rowcount
+
+
+def update_job(engine: Engine, job_id: int, **values) -> None:
+    """
+    Updates columns of a job.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param job_id: ID of the job
+    @param values: Column values to set
+    """
+    with engine.begin() as connection:
+        connection.execute(update(job_table).where(job_table.c.job_id == job_id).values(**values))
+
+
+def make_progress_callback(engine: Engine, job_id: int, start: float) -> Callable[[int], None]:
+    """
+    Returns a progress callback for stream_insert() and friends that stores rows_done and rows_per_sec,
+    at most once every PROGRESS_UPDATE_INTERVAL seconds.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param job_id: ID of the running job
+    @param start: time.perf_counter() value at the start of the job
+    @return: Function called with the number of rows inserted so far
+    """
+    last_update = [0.0]
+
+    def progress(rows_done: int) -> None:
+        now = time.perf_counter()
+        if now - last_update[0] < PROGRESS_UPDATE_INTERVAL:
+            return
+        last_update[0] = now
+        update_job(engine, job_id, rows_done=rows_done, rows_per_sec=round(rows_done / (now - start), 2))
+
+    return progress
+
+
+def run_job(engine: Engine, job: Dict[str, Any], progress: Optional[Callable[[int], None]] = None) -> Any:
+    """
+    Runs the generation and insertion described by a job, the same way the /generate endpoints used to.
+
+    With a seed the rows are reproducible: 'table' jobs read them from the dataset cache or generate and cache them
+    (see util.dataset_cache), 'all' jobs seed the Faker object and pin the reference time.
+    Relational 'all' jobs generate the tables in foreign key order (see util.relational_generator).
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param job: Claimed job (see claim_job()), or any dictionary with 'kind' and 'params' (see cli.py)
+    @param progress: Optional callback called with the number of rows inserted so far
+    @return: Insert statistics report (a dictionary for 'table' jobs, a list of dictionaries for 'all' jobs)
+    @raise Exception: Whatever the generation or insertion raised, unchanged (execute_job() stores it on the job)
+    """
+    params = job['params']
+    n = params['generate_num']
+    chunk_size = params.get('chunk_size', DEFAULT_CHUNK_SIZE)
+    seed = params.get('seed')
+    dataset_cache = None
+
+    # 'all' job은 seed로 Faker를 seed 한다 ('table' job의 seed는 dataset cache가 처리)
+    with pooled_faker(seed if job['kind'] == 'all' else None) as fake:
+        if job['kind'] == 'table':
+            table_name = params['table_name']
+            if seed is not None:
+                dataset_cache = 'hit' if is_dataset_cached(table_name, n, seed) else 'miss'
+                dummy_data = get_seeded_dataset(table_name, n, seed, workers=params.get('workers', 1))
+            elif params.get('workers', 1) > 1:
+                dummy_data = generate_parallel(table_name, n, workers=params['workers'])
+            else:
+                dummy_data = table_mapper()[table_name](fake, n)
+
+            if params.get('load_strategy') == 'load_data':
+                report = load_dummy_data(engine, table_name, dummy_data, params['mode'],
+                                         fallback_chunk_size=chunk_size, progress=progress)
+            else:
+                report = insert_dummy_data(engine, table_name, dummy_data, params['mode'], chunk_size,
+                                           params.get('stream', True), progress)
+        else:
+            # row는 이 thread에서 생성되므로 (stream_insert의 producer) 호출 전체를 감싸면 된다
+            with pinned_reference_time(SEEDED_REFERENCE_TIME if seed is not None else None):
+                if params.get('relational'):
+                    report = create_relational_dummy(engine=engine, fake=fake, n=n, mode=params['mode'],
+                                                     chunk_size=chunk_size, stream=params.get('stream', True),
+                                                     progress=progress, table_counts=params.get('table_counts'))
+                else:
+                    report = create_all_dummy(engine=engine, fake=fake, n=n, mode=params['mode'],
+                                              chunk_size=chunk_size, stream=params.get('stream', True),
+                                              progress=progress)
+
+    if dataset_cache is not None:
+        report['dataset_cache'] = dataset_cache
+    return report
+
+
+def execute_job(engine: Engine, job: Dict[str, Any]) -> None:
+    """
+    Runs a claimed job and records its result: state, rows done, rows/sec, report or error.
+    A heartbeat thread keeps heartbeat_at fresh while the job runs, so fail_stale_jobs() leaves it alone.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param job: Claimed job (see claim_job())
+    """
+    job_id = job['job_id']
+    finished = threading.Event()
+
+    def heartbeat():
+        while not finished.wait(HEARTBEAT_INTERVAL):
+            update_job(engine, job_id, heartbeat_at=datetime.now())
+
+    heartbeat_thread = threading.Thread(target=heartbeat, name=f"job-heartbeat-{job_id}", daemon=True)
+    heartbeat_thread.start()
+    start = time.perf_counter()
+    try:
+        # /generate 요청에 profile token이 있었으면 job도 profiling 한다 (util.profiling, 이름은 job-<job_id>)
+        with profiled(f"job-{job_id}", enabled=bool(job['params'].get('profile'))):
+            report = run_job(engine, job, make_progress_callback(engine, job_id, start))
+    except Exception as e:
+        update_job(engine, job_id, state='failed', error=f"{type(e).__name__}: {e}", finished_at=datetime.now())
+        return
+    finally:
+        finished.set()
+        heartbeat_thread.join()
+
+    elapsed = time.perf_counter() - start
+    rows_done = sum(r['rows'] for r in report) if isinstance(report, list) else report['rows']
+    update_job(
+        engine, job_id,
+        state='done',
+        rows_done=rows_done,
+        rows_per_sec=round(rows_done / elapsed, 2) if elapsed > 0 else None,
+        report=report,
+        finished_at=datetime.now()
+    )
+
+
+def work(engine: Engine, worker_name: str, poll_interval: float = DEFAULT_POLL_INTERVAL,
+         stop: Optional[threading.Event] = None, max_jobs: Optional[int] = None) -> int:
+    """
+    Worker loop: marks abandoned jobs failed, then claims and executes queued jobs until stopped.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param worker_name: Name stored in the worker column of claimed jobs
+    @param poll_interval: Seconds to wait before polling again when the queue is empty
+    @param stop: Optional event; the loop returns after the current job once it is set
+    @param max_jobs: Optional number of jobs after which the loop returns
+    @return: Number of executed jobs
+    """
+    job_table.create(engine, checkfirst=True)
+    executed = 0
+    while not (stop is not None and stop.is_set()) and (max_jobs is None or executed < max_jobs):
+        fail_stale_jobs(engine)
+        job = claim_job(engine, worker_name)
+        if job is None:
+            if stop is not None:
+                stop.wait(poll_interval)
+            else:
+                time.sleep(poll_interval)
+            continue
+        execute_job(engine, job)
+        executed += 1
+    return executed
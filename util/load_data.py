@@ -0,0 +1,200 @@
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, time as time_type, timedelta
+from decimal import Decimal
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine, Connection
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import Table
+
+from util.database_utils import (
+    DEFAULT_CHUNK_SIZE,
+    bulk_insert,
+    chunked,
+    delete_current_data,
+    get_table_metadata,
+    make_insert_report
+)
+from util.metrics import Stopwatch, record_insert
+
+DEFAULT_LOAD_CHUNK_SIZE = 100000
+
+# 1148: ER_NOT_ALLOWED_COMMAND (MySQL 5.x), 3948: ER_CLIENT_LOCAL_FILES_DISABLED (MySQL 8.0),
+# 2068: CR_LOAD_DATA_LOCAL_INFILE_REJECTED (client)
+LOCAL_INFILE_DISABLED_ERRORS = {1148, 2068, 3948}
+
+_TSV_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\0': '\\0'
+})
+
+
+def escape_tsv_value(value: Any) -> str:
+    """
+    Converts a Python value to a field of a LOAD DATA tab separated file.
+
+    NULL is written as \\N, dates/times in ISO format, Decimal without exponent, and backslash, tab,
+    newline, carriage return and NUL characters in strings are backslash-escaped.
+
+    @param value: Value of one column
+    @return: Escaped field text
+    """
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    if isinstance(value, (date, time_type)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return str(value)
+    if isinstance(value, Decimal):
+        return format(value, 'f')
+    if isinstance(value, float):
+        return repr(value)
+    return str(value).translate(_TSV_ESCAPES)
+
+
+def write_tsv(rows: Iterable[Dict], columns: List[str], file: TextIO) -> int:
+    """
+    Writes rows to a tab separated file in LOAD DATA format.
+
+    @param rows: Iterable of dictionaries containing the row data
+    @param columns: Column names, in the order they are written
+    @param file: Text file object opened for writing
+    @return: Number of written rows
+    """
+    written = 0
+    for row in rows:
+        file.write('\t'.join(escape_tsv_value(row.get(column)) for column in columns))
+        file.write('\n')
+        written += 1
+    return written
+
+
+def is_local_infile_disabled(error: DBAPIError) -> bool:
+    """
+    Checks whether a database error means LOAD DATA LOCAL INFILE is not allowed.
+
+    @param error: SQLAlchemy DBAPIError raised by LOAD DATA
+    @return: True if the client or the server disallows LOCAL INFILE
+    """
+    args = getattr(error.orig, 'args', ())
+    return bool(args) and args[0] in LOCAL_INFILE_DISABLED_ERRORS
+
+
+def load_data_local_infile(connection: Connection, table: Table, rows: List[Dict], columns: List[str]) -> None:
+    """
+    Writes rows to a temporary TSV file and loads it with LOAD DATA LOCAL INFILE.
+
+    @param connection: SQLAlchemy connection object
+    @param table: SQLAlchemy Table object to load into
+    @param rows: Rows to load
+    @param columns: Column names present in the rows
+    @raise DBAPIError: If the server rejects the statement
+    """
+    column_list = ', '.join(f'`{column}`' for column in columns)
+    fd, path = tempfile.mkstemp(prefix=f'{table.name}-', suffix='.tsv')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as tsv_file:
+            write_tsv(rows, columns, tsv_file)
+
+        statement = text(
+            f"LOAD DATA LOCAL INFILE :path INTO TABLE `{table.name}` CHARACTER SET utf8mb4 "
+            f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' ({column_list})"
+        )
+        connection.execute(statement, {'path': path})
+        connection.commit()
+    finally:
+        os.remove(path)
+
+
+@contextmanager
+def local_infile_connection(engine: Engine) -> Iterator[Connection]:
+    """
+    Opens a connection to the engine's database that allows LOAD DATA LOCAL INFILE on the client side.
+
+    The shared engines keep LOCAL INFILE disabled (see DatabaseInfo.local_infile), so a server could not
+    read client files through any other connection; this one comes from a dedicated, unpooled engine
+    that is disposed when the block ends.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @return: Context manager yielding the connection
+    """
+    load_engine = create_engine(engine.url, echo=False, poolclass=NullPool, connect_args={'local_infile': True})
+    try:
+        with load_engine.connect() as connection:
+            yield connection
+    finally:
+        load_engine.dispose()
+
+
+def load_dummy_data(engine: Engine, table_name: str, dummy_data: Iterable[Dict], mode: str,
+                    chunk_size: int = DEFAULT_LOAD_CHUNK_SIZE,
+                    fallback_chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    progress: Optional[Callable[[int], None]] = None) -> Dict[str, Any]:
+    """
+    Inserts generated dummy data with MySQL's LOAD DATA LOCAL INFILE bulk loader.
+
+    Rows are written chunk by chunk to a temporary TSV file which is loaded and removed right away.
+    If the client or the server disallows LOCAL INFILE, the current chunk and the rest of the rows
+    are inserted with bulk_insert() instead, and the report's 'strategy' is 'insert'.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param table_name: Name of the table as a string
+    @param dummy_data: Iterable of dictionaries containing the dummy data to be inserted
+    @param mode: Operation mode; 'y' to delete existing data before insertion, 'n' to keep existing data
+    @param chunk_size: Number of rows per loaded file
+    @param fallback_chunk_size: Number of rows per INSERT statement when falling back
+    @param progress: Optional callback called with the number of loaded rows after every loaded file
+    @return: Insert statistics dictionary (see make_insert_report()), with 'fallback_reason' on fallback
+    @raise ValueError: If the table does not exist
+    @raise SQLAlchemyError: If the delete or a load fails for another reason than LOCAL INFILE being disabled
+    """
+    table = get_table_metadata(engine, table_name)
+    if table is None:
+        raise ValueError(f"Table not found: {table_name}")
+    loaded = 0
+    generation = Stopwatch()
+    insertion = Stopwatch()
+    start = time.perf_counter()
+
+    with local_infile_connection(engine) as connection:
+        if mode == 'y' or mode == 'Y':
+            delete_current_data(connection, table)
+
+        chunks = generation.iterate(chunked(dummy_data, chunk_size))
+        for chunk in chunks:
+            columns = [column.name for column in table.columns if column.name in chunk[0]]
+            try:
+                with insertion:
+                    load_data_local_infile(connection, table, chunk, columns)
+            except DBAPIError as e:
+                if not is_local_infile_disabled(e):
+                    raise
+                connection.rollback()
+                if loaded:
+                    record_insert(table.name, loaded, generation.elapsed, insertion.elapsed, strategy='load_data')
+
+                # LOCAL INFILE이 막혀있으면 남은 row 전부 batched INSERT로 넣는다
+                remaining_rows = chain(chunk, chain.from_iterable(chunks))
+                report = bulk_insert(connection, table, remaining_rows, fallback_chunk_size)
+                report = make_insert_report(table.name, loaded + report['rows'], time.perf_counter() - start)
+                report['fallback_reason'] = str(e.orig)
+                return report
+            loaded += len(chunk)
+            if progress is not None:
+                progress(loaded)
+
+    record_insert(table.name, loaded, generation.elapsed, insertion.elapsed, strategy='load_data')
+    return make_insert_report(table.name, loaded, time.perf_counter() - start, strategy='load_data')
@@ -0,0 +1,263 @@
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from flask import Flask, Response, g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+# 대부분의 insert는 수 ms ~ 수 분 사이
+DURATION_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0)
+ROW_COUNT_BUCKETS = (1, 10, 100, 1000, 10000, 100000, 1000000, 10000000)
+
+GENERATION_SECONDS = Histogram(
+    'dummy_generation_seconds', 'Time spent generating the rows of one insert', ['table'],
+    buckets=DURATION_BUCKETS
+)
+INSERT_SECONDS = Histogram(
+    'dummy_insert_seconds', 'Time spent sending the rows of one insert to the database', ['table', 'strategy'],
+    buckets=DURATION_BUCKETS
+)
+ROWS_PER_REQUEST = Histogram(
+    'dummy_rows_per_request', 'Rows inserted by one insert', ['table'], buckets=ROW_COUNT_BUCKETS
+)
+ROWS_INSERTED = Counter('dummy_rows_inserted', 'Rows inserted', ['table', 'strategy'])
+REFLECTION_SECONDS = Histogram(
+    'dummy_reflection_seconds', 'Time spent reflecting schema metadata (cache misses only)', ['operation']
+)
+HANDLED_EXCEPTIONS = Counter(
+    'dummy_handled_exceptions', 'Exceptions caught and printed by exception_handler', ['function', 'exception']
+)
+REQUEST_SECONDS = Histogram(
+    'dummy_api_request_seconds', 'Latency of the dummy API routes until the response is returned',
+    ['method', 'route', 'status']
+)
+
+_EXHAUSTED = object()
+
+
+class Stopwatch:
+    def __init__(self):
+        """
+        Accumulates the time spent in `with stopwatch:` blocks and in the next() calls of iterate().
+        Only a few perf_counter() calls per chunk, so it can stay on in production.
+        """
+        self.elapsed = 0.0
+        self._start = 0.0
+
+    def __enter__(self) -> 'Stopwatch':
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.elapsed += time.perf_counter() - self._start
+
+    def iterate(self, iterable: Iterable) -> Iterator:
+        """
+        Passes the items of an iterable through, timing how long every item takes to produce.
+
+        @param iterable: Iterable whose production time is measured (e.g. chunked() rows of a generator)
+        @return: Iterator yielding the same items
+        """
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            item = next(iterator, _EXHAUSTED)
+            self.elapsed += time.perf_counter() - start
+            if item is _EXHAUSTED:
+                return
+            yield item
+
+
+def record_insert(table_name: str, rows: int, generation_seconds: float, insert_seconds: float,
+                  strategy: str = 'insert') -> None:
+    """
+    Records one finished insert of a table: generation time, insert time and rows.
+
+    @param table_name: Name of the table the rows were inserted into
+    @param rows: Number of inserted rows
+    @param generation_seconds: Time spent waiting for the row generator
+    @param insert_seconds: Time spent executing and committing the inserts
+    @param strategy: Load strategy that inserted the rows ('insert' or 'load_data')
+    """
+    GENERATION_SECONDS.labels(table_name).observe(generation_seconds)
+    INSERT_SECONDS.labels(table_name, strategy).observe(insert_seconds)
+    ROWS_PER_REQUEST.labels(table_name).observe(rows)
+    ROWS_INSERTED.labels(table_name, strategy).inc(rows)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that counts the threads waiting for a connection and the time they waited.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.waiting = 0
+        self.wait_seconds = 0.0
+        self._wait_lock = threading.Lock()
+
+    def _do_get(self):
+        with self._wait_lock:
+            self.waiting += 1
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            with self._wait_lock:
+                self.waiting -= 1
+                self.wait_seconds += time.perf_counter() - start
+
+
+class PoolCollector:
+    def __init__(self, engines: Callable[[], List[Engine]]):
+        """
+        Reads the pool state of the shared engines when Prometheus scrapes, so checkouts cost nothing extra.
+
+        @param engines: Function returning the engines to report (see config.database_engines.registered_engines())
+        """
+        self._engines = engines
+
+    def collect(self):
+        gauges = {
+            'size': GaugeMetricFamily('dummy_db_pool_size', 'Configured pool size', labels=['database']),
+            'checked_in': GaugeMetricFamily('dummy_db_pool_checked_in', 'Idle pooled connections',
+                                            labels=['database']),
+            'checked_out': GaugeMetricFamily('dummy_db_pool_checked_out', 'Connections in use',
+                                             labels=['database']),
+            'overflow': GaugeMetricFamily('dummy_db_pool_overflow', 'Connections open beyond the pool size',
+                                          labels=['database']),
+            'waiting': GaugeMetricFamily('dummy_db_pool_waiting', 'Threads waiting for a connection',
+                                         labels=['database'])
+        }
+        wait_seconds = CounterMetricFamily('dummy_db_pool_wait_seconds', 'Time spent checking out connections',
+                                           labels=['database'])
+
+        for engine in self._engines():
+            pool = engine.pool
+            if not isinstance(pool, QueuePool):
+                continue
+            database = f"{engine.url.host}:{engine.url.port}/{engine.url.database}"
+            gauges['size'].add_metric([database], pool.size())
+            gauges['checked_in'].add_metric([database], pool.checkedin())
+            gauges['checked_out'].add_metric([database], pool.checkedout())
+            gauges['overflow'].add_metric([database], pool.overflow())
+            if isinstance(pool, InstrumentedQueuePool):
+                gauges['waiting'].add_metric([database], pool.waiting)
+                wait_seconds.add_metric([database], pool.wait_seconds)
+
+        yield from gauges.values()
+        yield wait_seconds
+
+
+class InspectorCacheCollector:
+    def __init__(self, inspectors: Callable[[], List[Any]]):
+        """
+        Reads the counters of the cached inspectors (see util.inspector_cache.CachedInspector.stats()) when
+        Prometheus scrapes, so the cache hit rate can be watched next to the reflection times.
+
+        @param inspectors: Function returning the cached inspectors to report
+                           (see util.inspector_cache.registered_inspectors())
+        """
+        self._inspectors = inspectors
+
+    def collect(self):
+        counters: Dict[str, CounterMetricFamily] = {
+            name: CounterMetricFamily(f'dummy_inspector_cache_{name}', description, labels=['database'])
+            for name, description in (('hits', 'Inspector calls answered from the cache'),
+                                      ('misses', 'Inspector calls that queried the database'),
+                                      ('invalidations', 'Inspector cache invalidations (DDL)'))
+        }
+        entries = GaugeMetricFamily('dummy_inspector_cache_entries', 'Cached inspector results', labels=['database'])
+
+        for inspector in self._inspectors():
+            url = inspector.engine.url
+            database = f"{url.host}:{url.port}/{url.database}"
+            stats = inspector.stats()
+            for name, counter in counters.items():
+                counter.add_metric([database], stats[name])
+            entries.add_metric([database], stats['entries'])
+
+        yield from counters.values()
+        yield entries
+
+
+# 프로세스마다 값이 다른 collector (multiprocess mode에서도 이 프로세스 것만 보낸다)
+_process_collectors: List[Any] = []
+
+
+def install_pool_metrics(engines: Callable[[], List[Engine]]) -> None:
+    """
+    Registers the pool gauges of the given engines, once per process.
+
+    @param engines: Function returning the engines to report
+    """
+    if not any(isinstance(collector, PoolCollector) for collector in _process_collectors):
+        collector = PoolCollector(engines)
+        REGISTRY.register(collector)
+        _process_collectors.append(collector)
+
+
+def install_inspector_cache_metrics(inspectors: Callable[[], List[Any]]) -> None:
+    """
+    Registers the inspector cache counters of the given cached inspectors, once per process.
+
+    @param inspectors: Function returning the cached inspectors to report
+    """
+    if not any(isinstance(collector, InspectorCacheCollector) for collector in _process_collectors):
+        collector = InspectorCacheCollector(inspectors)
+        REGISTRY.register(collector)
+        _process_collectors.append(collector)
+
+
+def install_request_metrics(app: Flask, path_prefix: str) -> None:
+    """
+    Times every request whose path starts with path_prefix (e.g. the dummy_api namespace).
+    Routes are labelled with their URL rule (/home/api/jobs/<int:job_id>), not the path, to keep the label set small.
+    Streaming responses are timed until the response object is returned, not until the body is sent.
+
+    @param app: Flask application
+    @param path_prefix: Path prefix of the measured routes
+    """
+    @app.before_request
+    def start_request_timer():
+        if request.path.startswith(path_prefix):
+            g.metrics_request_start = time.perf_counter()
+
+    @app.after_request
+    def observe_request_latency(response):
+        start = g.pop('metrics_request_start', None)
+        if start is not None:
+            route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+            REQUEST_SECONDS.labels(request.method, route, str(response.status_code)).observe(
+                time.perf_counter() - start
+            )
+        return response
+
+
+def metrics_response() -> Response:
+    """
+    Renders the metrics of this process, or of every process if PROMETHEUS_MULTIPROC_DIR is set
+    (prometheus_client multiprocess mode, e.g. under gunicorn).
+
+    @return: Flask response in the Prometheus text format
+    """
+    registry = REGISTRY
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        # pool 상태와 inspector cache는 프로세스마다 다르므로 이 프로세스 것만 보낸다
+        for collector in _process_collectors:
+            registry.register(collector)
+    return Response(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
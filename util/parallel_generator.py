@@ -0,0 +1,98 @@
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Iterator, Optional
+
+import numpy as np
+
+from util.faker_pool import pooled_faker
+from util.utils import check_generate_num, table_mapper
+from util.vectorized import pinned_reference_time
+
+DEFAULT_SHARD_SIZE = 10000
+
+
+def generate_shard(table_name: str, n: int, seed: int, unique_key: int, offset: int,
+                   reference_time: Optional[datetime] = None) -> List[Dict]:
+    """
+    Generates one shard of dummy data inside a worker process.
+
+    @param table_name: Name of the table (key of table_mapper())
+    @param n: Number of rows in this shard
+    @param seed: Seed for this shard's Faker instance (checked out of the worker process's FakerPool)
+    @param unique_key: Key shared by all shards, choosing the permutation of the unique columns
+    @param offset: Number of rows generated by the shards before this one
+    @param reference_time: Time the generators use as "now" (see util.vectorized.pinned_reference_time());
+                           None uses the clock
+    @return: List of dictionaries containing the generated rows
+    """
+    with pooled_faker(seed) as fake, pinned_reference_time(reference_time):
+        return list(table_mapper()[table_name](fake, n, unique_key, offset))
+
+
+def split_shards(n: int, shard_size: int) -> List[int]:
+    """
+    Splits n rows into shard sizes of at most shard_size rows.
+
+    @param n: Total number of rows
+    @param shard_size: Maximum number of rows per shard
+    @return: List of shard sizes whose sum is n
+    """
+    return [min(shard_size, n - start) for start in range(0, n, shard_size)]
+
+
+def generate_parallel(table_name: str, n: int, workers: Optional[int] = None, seed: Optional[int] = None,
+                      shard_size: int = DEFAULT_SHARD_SIZE,
+                      reference_time: Optional[datetime] = None) -> Iterator[Dict]:
+    """
+    Generates dummy data for a table on a process pool and yields the rows in shard order.
+
+    n rows are split into shards of shard_size rows. Every shard runs in a worker process with its own Faker
+    seeded from a child of one numpy SeedSequence, so shards never share random state and the same seed
+    reproduces the same shards. Unique columns draw from one permutation shared by all shards
+    (see util.unique_sampler) and every shard starts at its own row offset, so rows never collide across
+    shards and no merge step is needed.
+    At most 2 * workers shards are in flight, so memory stays bounded for large n.
+    With workers=1 the shards run in this process; the rows do not depend on the number of workers,
+    so a seed (and a fixed reference_time) reproduces the same rows with any number of workers.
+
+    @param table_name: Name of the table (key of table_mapper())
+    @param n: Number of rows to generate
+    @param workers: Number of worker processes (default: os.cpu_count())
+    @param seed: Root seed for the SeedSequence; None draws fresh entropy from the OS
+    @param shard_size: Maximum number of rows generated by one worker task
+    @param reference_time: Time the generators use as "now"; None uses the clock
+    @return: Generator yielding exactly n row dictionaries
+    @raise ValueError: If the table is unknown or a unique column's domain is smaller than n
+    """
+    check_generate_num(table_name, n)
+
+    workers = workers or os.cpu_count() or 1
+    seed_sequence = np.random.SeedSequence(seed)
+    unique_key = int(seed_sequence.generate_state(1, dtype=np.uint64)[0])
+
+    if workers == 1:
+        offset = 0
+        for size in split_shards(n, shard_size):
+            child_seed = int(seed_sequence.spawn(1)[0].generate_state(1, dtype=np.uint64)[0])
+            yield from generate_shard(table_name, size, child_seed, unique_key, offset, reference_time)
+            offset += size
+        return
+
+    # worker는 spawn으로 띄워서 부모 프로세스의 DB connection pool, thread를 물려받지 않도록 한다
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        pending = deque(split_shards(n, shard_size))
+        in_flight = deque()
+        offset = 0
+        while pending or in_flight:
+            while pending and len(in_flight) < 2 * workers:
+                child_seed = int(seed_sequence.spawn(1)[0].generate_state(1, dtype=np.uint64)[0])
+                size = pending.popleft()
+                in_flight.append(executor.submit(generate_shard, table_name, size, child_seed, unique_key, offset,
+                                                 reference_time))
+                offset += size
+
+            yield from in_flight.popleft().result()
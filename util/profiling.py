@@ -0,0 +1,194 @@
+import cProfile
+import functools
+import hmac
+import io
+import os
+import pstats
+import re
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from flask import make_response, request
+
+# PROFILE_TOKEN이 없으면 profiling은 꺼져있고 view를 감싸지도 않는다
+PROFILE_TOKEN = os.environ.get('PROFILE_TOKEN')
+PROFILE_DIR = os.environ.get('PROFILE_DIR', os.path.join(tempfile.gettempdir(), 'dummy_profiles'))
+PROFILE_RING_SIZE = int(os.environ.get('PROFILE_RING_SIZE', 20))
+PROFILE_HEADER = 'X-Profile'
+PROFILE_SKIPPED_HEADER = 'X-Profile-Skipped'
+PROFILE_SORT_KEYS = ('cumulative', 'tottime', 'ncalls')
+
+PROFILE_NAME_PATTERN = re.compile(r'^[\w.-]+\.pstats$')
+_ring_lock = threading.Lock()
+# 한 process에서 cProfile은 하나만 켤 수 있다 (Python 3.12+는 두 번째 enable()이 ValueError)
+_profile_lock = threading.Lock()
+
+
+def is_profile_requested() -> bool:
+    """
+    Checks if the current request asked to be profiled with the right token in the X-Profile header.
+    There is no query parameter form: the token would end up in access logs and proxy logs.
+
+    @return: True if profiling is enabled (PROFILE_TOKEN is set) and the request carries the token
+    """
+    if not PROFILE_TOKEN:
+        return False
+    token = request.headers.get(PROFILE_HEADER)
+    return token is not None and hmac.compare_digest(token.encode('utf-8'), PROFILE_TOKEN.encode('utf-8'))
+
+
+def save_profile(profile: cProfile.Profile, label: str) -> str:
+    """
+    Writes a profile to the ring directory and drops the oldest profiles beyond PROFILE_RING_SIZE.
+
+    @param profile: Finished cProfile.Profile
+    @param label: Short description of what was profiled, part of the file name (e.g. the route or job ID)
+    @return: Name of the profile file (see list_profiles())
+    """
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    safe_label = re.sub(r'[^\w.-]+', '_', label).strip('_')
+    name = f"{datetime.now():%Y%m%dT%H%M%S%f}-{os.getpid()}-{safe_label}.pstats"
+    path = os.path.join(PROFILE_DIR, name)
+    # 목록에 반쯤 쓰인 파일이 보이지 않도록 다른 이름으로 쓴 뒤 바꾼다
+    profile.dump_stats(path + '.tmp')
+    os.replace(path + '.tmp', path)
+
+    with _ring_lock:
+        for old_name in sorted(_profile_names())[:-PROFILE_RING_SIZE]:
+            try:
+                os.remove(os.path.join(PROFILE_DIR, old_name))
+            except FileNotFoundError:
+                pass
+    return name
+
+
+@contextmanager
+def profiled(label: str, enabled: bool = True) -> Iterator[Dict[str, Optional[str]]]:
+    """
+    Runs the block under cProfile and saves the result to the profile ring.
+    cProfile only sees the calling thread, e.g. the row generation of stream_insert() but not its writer thread.
+
+    Only one block is profiled at a time per process: if another one is already profiled, the block runs
+    unprofiled and 'skipped' says why instead of waiting.
+
+    @param label: Short description of what is profiled (see save_profile())
+    @param enabled: If False, the block runs unprofiled
+    @return: Dictionary whose 'name' is the saved profile file once the block finished
+             (None if disabled or skipped) and 'skipped' the reason it was not profiled (None otherwise)
+    """
+    result = {'name': None, 'skipped': None}
+    if not enabled:
+        yield result
+        return
+    if not _profile_lock.acquire(blocking=False):
+        result['skipped'] = 'busy'
+        yield result
+        return
+
+    try:
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # 이 module 밖의 profiler (debugger, coverage, ...) 가 이미 켜져 있다
+            result['skipped'] = 'profiler in use'
+        if result['skipped']:
+            yield result
+            return
+        try:
+            yield result
+        finally:
+            profile.disable()
+            result['name'] = save_profile(profile, label)
+    finally:
+        _profile_lock.release()
+
+
+def profile_request(view: Callable) -> Callable:
+    """
+    View decorator that profiles the requests asking for it (see is_profile_requested()) and returns the
+    profile name in the X-Profile-Name response header, or the reason in X-Profile-Skipped if another
+    request was being profiled (see profiled()). Streaming responses are profiled until the
+    response object is returned, not while the body is sent.
+
+    Without PROFILE_TOKEN the view is returned as is, so unprofiled requests pay nothing.
+
+    @param view: Flask view function (a flask_restx Namespace decorator)
+    @return: Wrapped view function
+    """
+    if not PROFILE_TOKEN:
+        return view
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if not is_profile_requested():
+            return view(*args, **kwargs)
+
+        with profiled(f"{request.method}-{request.url_rule.rule}") as result:
+            response = make_response(view(*args, **kwargs))
+        if result['name'] is not None:
+            response.headers['X-Profile-Name'] = result['name']
+        else:
+            response.headers[PROFILE_SKIPPED_HEADER] = result['skipped']
+        return response
+
+    return wrapper
+
+
+def _profile_names() -> List[str]:
+    if not os.path.isdir(PROFILE_DIR):
+        return []
+    return [name for name in os.listdir(PROFILE_DIR) if PROFILE_NAME_PATTERN.match(name)]
+
+
+def list_profiles() -> List[Dict[str, Any]]:
+    """
+    Lists the profiles in the ring, newest first.
+
+    @return: List of dictionaries with 'name', 'size' (bytes) and 'created_at'
+    """
+    profiles = []
+    for name in sorted(_profile_names(), reverse=True):
+        try:
+            stat = os.stat(os.path.join(PROFILE_DIR, name))
+        except FileNotFoundError:
+            continue
+        profiles.append({
+            'name': name,
+            'size': stat.st_size,
+            'created_at': datetime.fromtimestamp(stat.st_mtime).isoformat(timespec='seconds')
+        })
+    return profiles
+
+
+def get_profile_path(name: str) -> str:
+    """
+    Returns the path of a profile of the ring.
+
+    @param name: Profile name from list_profiles()
+    @return: Path of the pstats file
+    @raise ValueError: If there is no such profile (also for names that are not plain file names)
+    """
+    if not PROFILE_NAME_PATTERN.match(name) or name not in _profile_names():
+        raise ValueError(f"Invalid profile name: {name}")
+    return os.path.join(PROFILE_DIR, name)
+
+
+def render_profile(name: str, sort: str = 'cumulative', limit: int = 50) -> str:
+    """
+    Renders a profile as pstats text: the limit most expensive functions by the sort key.
+
+    @param name: Profile name from list_profiles()
+    @param sort: 'cumulative', 'tottime' or 'ncalls'
+    @param limit: Number of functions to print
+    @return: pstats report
+    @raise ValueError: If the profile or the sort key is invalid
+    """
+    if sort not in PROFILE_SORT_KEYS:
+        raise ValueError(f"Invalid sort key: {sort}")
+    stream = io.StringIO()
+    pstats.Stats(get_profile_path(name), stream=stream).sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
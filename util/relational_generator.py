@@ -0,0 +1,237 @@
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+from faker import Faker
+from sqlalchemy import func, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import Table
+
+from util.database_utils import (
+    DEFAULT_CHUNK_SIZE,
+    bulk_insert,
+    delete_current_data,
+    get_all_tables_from_database,
+    get_table_metadata,
+    stream_insert
+)
+from util.dummy_generators import SEAT_CAPACITY, seat_from_index
+from util.unique_sampler import make_unique_sampler
+from util.utils import check_generate_num, table_mapper
+from util.vectorized import DEFAULT_BATCH_SIZE, make_rng
+
+
+class ForeignKey(NamedTuple):
+    """
+    A column of a generated table that refers to the primary key of a parent table.
+
+    unique: the column is (part of) a unique key, so parent keys are drawn without replacement.
+    paired_column / paired_capacity / paired_value: the unique key is (column, paired_column); every parent key
+    is paired with paired_capacity distinct values, so one parent key can appear paired_capacity times.
+    """
+    column: str
+    parent: str
+    unique: bool = False
+    paired_column: Optional[str] = None
+    paired_capacity: int = 1
+    paired_value: Optional[Callable[[int], Any]] = None
+
+
+# airportdb의 foreign key (models에는 선언되어 있지 않다)
+FOREIGN_KEYS: Dict[str, List[ForeignKey]] = {
+    'airline': [ForeignKey('base_airport', 'airport')],
+    'airplane': [ForeignKey('type_id', 'airplane_type'), ForeignKey('airline_id', 'airline')],
+    'airport_geo': [ForeignKey('airport_id', 'airport', unique=True)],
+    'airport_reachable': [ForeignKey('airport_id', 'airport', unique=True)],
+    'booking': [
+        ForeignKey('flight_id', 'flight', unique=True,
+                   paired_column='seat', paired_capacity=SEAT_CAPACITY, paired_value=seat_from_index),
+        ForeignKey('passenger_id', 'passenger')
+    ],
+    'flight': [
+        ForeignKey('from_airport', 'airport'),
+        ForeignKey('to_airport', 'airport'),
+        ForeignKey('airline_id', 'airline'),
+        ForeignKey('airplane_id', 'airplane')
+    ],
+    'flightschedule': [
+        ForeignKey('from_airport', 'airport'),
+        ForeignKey('to_airport', 'airport'),
+        ForeignKey('airline_id', 'airline')
+    ],
+    'passengerdetails': [ForeignKey('passenger_id', 'passenger', unique=True)]
+}
+
+PARENT_TABLES = {foreign_key.parent for foreign_keys in FOREIGN_KEYS.values() for foreign_key in foreign_keys}
+
+
+def dependency_order(table_names: Iterable[str]) -> List[str]:
+    """
+    Orders tables so every parent comes before its children (e.g. airline -> airplane -> flight -> booking).
+    Tables without dependencies keep their given order.
+
+    @param table_names: Names of the tables to generate
+    @return: Table names in dependency order
+    @raise ValueError: If a child table is requested without one of its parents
+    """
+    remaining = list(table_names)
+    for table_name in remaining:
+        missing = {fk.parent for fk in FOREIGN_KEYS.get(table_name, [])} - set(remaining)
+        if missing:
+            raise ValueError(f"Table {table_name} needs the parent table(s) {', '.join(sorted(missing))}")
+
+    ordered = []
+    while remaining:
+        ready = [table_name for table_name in remaining
+                 if all(fk.parent in ordered for fk in FOREIGN_KEYS.get(table_name, []))]
+        if not ready:
+            raise ValueError(f"Foreign keys of {', '.join(remaining)} form a cycle")
+        ordered.extend(ready)
+        remaining = [table_name for table_name in remaining if table_name not in ready]
+    return ordered
+
+
+def check_relational_generate_num(counts: Dict[str, int]) -> None:
+    """
+    Fails fast if the requested rows can not be generated: a table's own unique domains are too small
+    (see check_generate_num()), or a unique foreign key needs more distinct parent keys than the parent gets.
+
+    @param counts: Table name -> number of rows to generate
+    @raise ValueError: If the rows of one of the tables can not be generated
+    """
+    for table_name, n in counts.items():
+        check_generate_num(table_name, n)
+        for fk in FOREIGN_KEYS.get(table_name, []):
+            if n > 0 and counts[fk.parent] == 0:
+                raise ValueError(f"Cannot generate {table_name}.{fk.column} values: {fk.parent} gets no rows")
+            if fk.unique and n > counts[fk.parent] * fk.paired_capacity:
+                raise ValueError(f"Cannot generate {n} unique {table_name}.{fk.column} values: "
+                                 f"{fk.parent} only gets {counts[fk.parent]} rows")
+
+
+def read_next_key(connection: Connection, table: Table) -> int:
+    """
+    Reads the first primary key value after the existing rows (MAX(pk) + 1), once per table.
+
+    @param connection: SQLAlchemy connection
+    @param table: Parent table with a single integer primary key
+    @return: First key to assign to generated rows
+    """
+    primary_key = list(table.primary_key.columns)[0]
+    return connection.execute(select(func.coalesce(func.max(primary_key), 0))).scalar() + 1
+
+
+def assign_keys(fake: Faker, table: Table, rows: Iterable[Dict], pools: Dict[str, np.ndarray],
+                first_key: Optional[int] = None, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict]:
+    """
+    Replaces the primary and foreign keys of generated rows, batch by batch.
+
+    Foreign keys are drawn from the parents' key pools with NumPy index sampling, unique foreign keys from a
+    UniqueSampler over the pool (see util.unique_sampler), so no row needs a database lookup.
+    Parent tables get explicit primary keys first_key, first_key + 1, ... which become their pool.
+
+    @param fake: Faker object seeding the samplers
+    @param table: Table the rows are generated for
+    @param rows: Rows of the table's generator
+    @param pools: Parent table name -> array of the parent's inserted primary keys
+    @param first_key: First primary key to assign, or None to keep the generated / autoincrement key
+    @param batch_size: Rows whose keys are drawn at once
+    @return: Generator yielding the rows with their keys replaced
+    """
+    foreign_keys = FOREIGN_KEYS.get(table.name, [])
+    rng = make_rng(fake)
+    samplers = {
+        fk.column: make_unique_sampler(fake, f"{table.name}.{fk.column}", len(pools[fk.parent]) * fk.paired_capacity)
+        for fk in foreign_keys if fk.unique
+    }
+    primary_key = list(table.primary_key.columns)[0].name if first_key is not None else None
+
+    rows = iter(rows)
+    position = 0
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        size = len(batch)
+        for fk in foreign_keys:
+            pool = pools[fk.parent]
+            if fk.unique:
+                indexes = np.asarray(samplers[fk.column].take(size), dtype=np.int64)
+                keys = pool[indexes // fk.paired_capacity].tolist()
+                if fk.paired_column is not None:
+                    for row, index in zip(batch, (indexes % fk.paired_capacity).tolist()):
+                        # NULL은 unique 비교 대상이 아니므로 생성기가 NULL로 둔 값은 그대로 둔다
+                        if row.get(fk.paired_column) is not None:
+                            row[fk.paired_column] = fk.paired_value(index)
+            else:
+                keys = pool[rng.integers(0, len(pool), size=size)].tolist()
+            for row, key in zip(batch, keys):
+                row[fk.column] = key
+        if primary_key is not None:
+            for i, row in enumerate(batch):
+                row[primary_key] = first_key + position + i
+        position += size
+        yield from batch
+
+
+def create_relational_dummy(engine: Engine, fake: Faker, n: int, mode: str,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE, stream: bool = False,
+                            progress: Optional[Callable[[int], None]] = None,
+                            table_counts: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+    """
+    Generates rows for every table of table_mapper() in the database, in dependency order,
+    so every foreign key refers to a row that was inserted before it (see FOREIGN_KEYS).
+
+    Every parent table's generated primary keys are kept as a NumPy array pool in memory; child foreign keys are
+    sampled from the pools. The only extra queries are one MAX(pk) per parent table.
+
+    @param engine: SQLAlchemy engine object connected to the target database
+    @param fake: Faker object used to generate fake data
+    @param n: Number of dummy data entries to generate per table
+    @param mode: Operation mode; 'y' to delete existing data before insertion, 'n' to keep existing data
+    @param chunk_size: Number of rows sent to the database per statement
+    @param stream: If True, insert through stream_insert() so generation and insertion overlap
+    @param progress: Optional callback called with the number of rows inserted so far, over all tables (stream only)
+    @param table_counts: Optional table name -> number of rows overriding n for that table
+                         (e.g. a few hundred airports and many bookings)
+    @return: List of insert statistics dictionaries, one per table, in insertion order
+    @raise ValueError: If a child table exists without its parents, or the rows can not be generated
+    """
+    database_tables = set(get_all_tables_from_database(engine))
+    table_names = dependency_order(table_name for table_name in table_mapper() if table_name in database_tables)
+    unknown_tables = set(table_counts or {}) - set(table_names)
+    if unknown_tables:
+        raise ValueError(f"Unknown table(s) in table_counts: {', '.join(sorted(unknown_tables))}")
+    counts = {table_name: (table_counts or {}).get(table_name, n) for table_name in table_names}
+    check_relational_generate_num(counts)
+    tables = {table_name: get_table_metadata(engine, table_name) for table_name in table_names}
+
+    if mode == 'y' or mode == 'Y':
+        with engine.connect() as connection:
+            # 자식 테이블부터 지운다
+            for table_name in reversed(table_names):
+                delete_current_data(connection, tables[table_name])
+            connection.commit()
+
+    pools: Dict[str, np.ndarray] = {}
+    reports = []
+    for table_name in table_names:
+        table = tables[table_name]
+        first_key = None
+        if table_name in PARENT_TABLES:
+            with engine.connect() as connection:
+                first_key = read_next_key(connection, table)
+
+        rows = assign_keys(fake, table, table_mapper()[table_name](fake, counts[table_name]), pools, first_key)
+        if stream:
+            done = sum(report['rows'] for report in reports)
+            table_progress = (lambda inserted, done=done: progress(done + inserted)) if progress else None
+            report = stream_insert(engine, table, rows, chunk_size, progress=table_progress)
+        else:
+            with engine.connect() as connection:
+                report = bulk_insert(connection, table, rows, chunk_size)
+        reports.append(report)
+
+        if first_key is not None:
+            pools[table_name] = np.arange(first_key, first_key + report['rows'], dtype=np.int64)
+    return reports
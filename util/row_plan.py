@@ -0,0 +1,189 @@
+import re
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+from faker import Faker
+from sqlalchemy.schema import Table, Column
+
+from util.dummy_generators import make_column_generator
+from util.error.error_handler import exception_handler
+from util.vectorized import DEFAULT_BATCH_SIZE, make_column_kernel, make_rng
+
+
+@exception_handler
+def get_column_type_detail(table: Table, column: Column) -> Dict[str, Any]:
+    """
+    Retrieves detailed column type information for a specific column in a table.
+
+    @param table: SQLAlchemy Table object containing the column
+    @param column: SQLAlchemy Column object for which to retrieve detailed information
+    @return: Dictionary containing detailed information about the column. The dictionary keys are:
+             'table_name', 'col_name', 'type', 'size', 'decimal_place', 'enum_values', 'primary', 'unique'.
+             - 'type' is the data type (e.g., VARCHAR, INT)
+             - 'size' is the size of the data type (e.g., 255 for VARCHAR(255))
+             - 'decimal_place' is the number of decimal places (for NUMERIC types)
+             - 'enum_values' is a list of possible values for ENUM types
+             - 'primary' is 'True' if the column is a primary key
+             - 'unique' is 'True' if the column has a unique constraint
+    """
+    column_type = column.type
+    pattern = r"(\w+)\s*(\((\d+)(,\s*(\d+))?\))?(?:\s*CHARACTER SET \w+)?(?:\s*COLLATE \w+)?"  # 정규식 (CHAT-GPT 사용)
+    matches = re.findall(pattern, str(column_type))
+    type_detail = {
+        'table_name': table.name,
+        'col_name': column.name,
+        'type': None,
+        'size': None,
+        'decimal_place': None,
+        'enum_values': None,
+        'primary': None,
+        'unique': None
+    }
+
+    if matches:
+        col_type, col_size, decimal_place = matches[0][0], matches[0][2], matches[0][4]
+        type_detail['type'] = col_type
+        type_detail['size'] = int(col_size) if col_size else None
+        type_detail['decimal_place'] = int(decimal_place) if decimal_place else None
+
+    # primary
+    if column.primary_key:
+        type_detail['primary'] = 'True'
+
+    # 유니크 속성 확인
+    for index in table.indexes:
+        if index.unique and column.name in index.columns:
+            type_detail['unique'] = 'True'
+            break
+
+    # ENUM 값 뽑아오기
+    if str(column_type) == "ENUM":
+        type_detail['enum_values'] = column_type.enums
+
+    return type_detail
+
+
+class ColumnPlan(NamedTuple):
+    """
+    One column of a compiled RowPlan: resolved type details and the bound value generator.
+    """
+    name: str
+    type: Optional[str]
+    size: Optional[int]
+    decimal_place: Optional[int]
+    primary: bool
+    unique: bool
+    enum_values: Optional[List[str]]
+    generate: Callable[[], Any]
+    generate_batch: Optional[Callable[[np.random.Generator, int], List[Any]]]
+
+
+class RowPlan:
+    def __init__(self, table_name: str, columns: List[ColumnPlan], rng: np.random.Generator,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Compiled row generation plan for one table (see compile_row_plan()).
+
+        @param table_name: Name of the table the plan was compiled from
+        @param columns: Column plans in table column order (autoincrement columns are not included)
+        @param rng: NumPy Generator used by the vectorized column kernels
+        @param batch_size: Number of rows generated per column batch
+        """
+        self.table_name = table_name
+        self.columns = columns
+        self.rng = rng
+        self.batch_size = batch_size
+        self._generators = [(column.name, column.generate) for column in columns]
+
+    def generate_row(self) -> Dict[str, Any]:
+        """
+        Generates one row by running every scalar column generator of the plan.
+
+        @return: Dictionary of column name -> generated value
+        """
+        return {name: generate() for name, generate in self._generators}
+
+    def generate_batch(self, n: int) -> List[Dict[str, Any]]:
+        """
+        Generates n rows column by column. Columns with a vectorized kernel produce the whole batch at once,
+        the other columns call their scalar generator n times.
+
+        @param n: Number of rows in the batch
+        @return: List of row dictionaries
+        """
+        names = [column.name for column in self.columns]
+        values = [
+            column.generate_batch(self.rng, n) if column.generate_batch is not None
+            else [column.generate() for _ in range(n)]
+            for column in self.columns
+        ]
+        return [dict(zip(names, row)) for row in zip(*values)] if names else [{} for _ in range(n)]
+
+    def generate_rows(self, n: int) -> Iterator[Dict[str, Any]]:
+        """
+        Generates n rows in batches of batch_size rows.
+
+        @param n: Number of rows to generate
+        @return: Generator yielding row dictionaries
+        """
+        for start in range(0, n, self.batch_size):
+            yield from self.generate_batch(min(self.batch_size, n - start))
+
+    def describe(self) -> List[Dict[str, Any]]:
+        """
+        Returns the plan in a JSON serializable form for inspection.
+
+        @return: List of dictionaries with the resolved details of each column
+        """
+        return [
+            {
+                'name': column.name,
+                'type': column.type,
+                'size': column.size,
+                'decimal_place': column.decimal_place,
+                'primary': column.primary,
+                'unique': column.unique,
+                'enum_values': column.enum_values,
+                'generator': getattr(column.generate, '__qualname__', repr(column.generate)),
+                'vectorized': column.generate_batch is not None
+            }
+            for column in self.columns
+        ]
+
+
+def compile_row_plan(fake: Faker, table: Table, unique_key: Optional[int] = None, offset: int = 0) -> RowPlan:
+    """
+    Compiles a Table object into a RowPlan.
+
+    Column type details are parsed once per column (instead of once per column per row) and every column
+    gets a generator closure bound to the Faker object; unique and primary key columns get their own
+    UniqueSampler (see util.unique_sampler).
+    Columns supported by util.vectorized also get a batch kernel drawing from a NumPy Generator
+    seeded from the Faker object.
+    A plan keeps its sampler positions, so compile a new plan for every generation run.
+
+    @param fake: Faker object used to generate fake data
+    @param table: SQLAlchemy Table object to compile
+    @param unique_key: Shared key choosing the permutation of unique columns (None: drawn from fake)
+    @param offset: First permutation position used by unique columns
+    @return: Compiled RowPlan
+    """
+    columns = []
+    for column in table.columns:
+        if str(column.autoincrement) == "True":
+            continue
+        type_detail = get_column_type_detail(table, column)
+        columns.append(
+            ColumnPlan(
+                name=column.name,
+                type=type_detail['type'],
+                size=type_detail['size'],
+                decimal_place=type_detail['decimal_place'],
+                primary=type_detail['primary'] == 'True',
+                unique=type_detail['unique'] == 'True',
+                enum_values=list(type_detail['enum_values']) if type_detail['enum_values'] else None,
+                generate=make_column_generator(fake, type_detail, unique_key, offset),
+                generate_batch=make_column_kernel(type_detail)
+            )
+        )
+    return RowPlan(table.name, columns, make_rng(fake))
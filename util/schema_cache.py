@@ -0,0 +1,143 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple, Any
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import MetaData, Table
+
+from util.metrics import REFLECTION_SECONDS
+
+DEFAULT_VERSION_CHECK_INTERVAL = 5.0
+
+# UPDATE_TIME은 InnoDB에서 DML마다 바뀌기 때문에 schema 버전에는 CREATE_TIME과 테이블/컬럼 수만 사용한다
+SCHEMA_VERSION_QUERY = text(
+    "SELECT COUNT(*), MAX(CREATE_TIME), "
+    "(SELECT COUNT(*) FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = :schema) "
+    "FROM information_schema.TABLES WHERE TABLE_SCHEMA = :schema"
+)
+
+
+class SchemaCache:
+    def __init__(self, version_check_interval: float = DEFAULT_VERSION_CHECK_INTERVAL):
+        """
+        Process-wide cache of reflected MetaData objects, keyed by engine URL and schema name.
+
+        An entry is reflected once and reused until invalidate() is called (after our own DDL) or,
+        on MySQL, until the schema version read from information_schema changes. The version is
+        checked at most once every version_check_interval seconds per entry.
+        Version checks and reflection hold a lock of their own entry only, so a slow reflection of one
+        schema never blocks the cache hits of another.
+
+        @param version_check_interval: Seconds between two schema version checks of the same entry
+        """
+        self._version_check_interval = version_check_interval
+        self._entries: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+        self._entry_locks: Dict[Tuple[str, Optional[str]], threading.Lock] = {}
+        # invalidate() 마다 증가: 그 전에 시작한 reflection의 결과는 cache에 넣지 않는다
+        self._invalidations = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(engine: Engine, schema: Optional[str] = None) -> Tuple[str, Optional[str]]:
+        """
+        Builds the cache key for an engine and schema.
+
+        @param engine: SQLAlchemy engine object
+        @param schema: Schema name; None means the engine's default database
+        @return: Tuple of (engine URL without password, schema name)
+        """
+        return str(engine.url), schema or engine.url.database
+
+    @staticmethod
+    def read_schema_version(engine: Engine, schema: Optional[str]) -> Optional[Tuple]:
+        """
+        Reads a cheap fingerprint of the schema from information_schema.
+
+        @param engine: SQLAlchemy engine object
+        @param schema: Schema name
+        @return: Tuple of (table count, latest CREATE_TIME, column count), or None if the dialect is not MySQL
+        """
+        if engine.dialect.name != 'mysql' or not schema:
+            return None
+        with engine.connect() as connection:
+            return tuple(connection.execute(SCHEMA_VERSION_QUERY, {'schema': schema}).one())
+
+    def get_metadata(self, engine: Engine, schema: Optional[str] = None) -> MetaData:
+        """
+        Returns the reflected MetaData for the engine and schema, reflecting it on the first call.
+
+        @param engine: SQLAlchemy engine object connected to the target database
+        @param schema: Schema name; None means the engine's default database
+        @return: Reflected SQLAlchemy MetaData object (shared, do not modify)
+        """
+        key = self.make_key(engine, schema)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry['checked_at'] < self._version_check_interval:
+                return entry['metadata']
+            entry_lock = self._entry_locks.setdefault(key, threading.Lock())
+
+        # 같은 entry를 확인/reflect 하려는 thread만 기다린다 (한 번만 reflect 하도록)
+        with entry_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                invalidations = self._invalidations
+            now = time.monotonic()
+            if entry is not None and now - entry['checked_at'] < self._version_check_interval:
+                # 기다리는 동안 다른 thread가 확인했다
+                return entry['metadata']
+
+            version = self.read_schema_version(engine, key[1])
+            if entry is not None and version == entry['version']:
+                entry['checked_at'] = now
+                return entry['metadata']
+
+            metadata = MetaData(schema=schema)
+            with REFLECTION_SECONDS.labels('reflect').time():
+                metadata.reflect(bind=engine)
+            with self._lock:
+                # reflect 하는 동안 invalidate() 되었으면 (DDL 직후) DDL 이전 결과일 수 있으므로 넣지 않는다
+                if self._invalidations == invalidations:
+                    self._entries[key] = {'metadata': metadata, 'version': version, 'checked_at': time.monotonic()}
+            return metadata
+
+    def get_table(self, engine: Engine, table_name: str, schema: Optional[str] = None) -> Table:
+        """
+        Returns a reflected Table object from the cache.
+
+        @param engine: SQLAlchemy engine object connected to the target database
+        @param table_name: Name of the table
+        @param schema: Schema name; None means the engine's default database
+        @return: SQLAlchemy Table object
+        @raise KeyError: If the table does not exist in the schema
+        """
+        metadata = self.get_metadata(engine, schema)
+        return metadata.tables[f'{schema}.{table_name}' if schema else table_name]
+
+    def invalidate(self, engine: Optional[Engine] = None, schema: Optional[str] = None) -> None:
+        """
+        Drops cached entries so the next call reflects again.
+
+        @param engine: Engine whose entry is dropped; None drops every entry
+        @param schema: Schema of the entry to drop; None means the engine's default database
+        """
+        with self._lock:
+            self._invalidations += 1
+            if engine is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self.make_key(engine, schema), None)
+
+
+schema_cache = SchemaCache()
+
+
+def invalidate_schema_cache(engine: Optional[Engine] = None, schema: Optional[str] = None) -> None:
+    """
+    Invalidates the process-wide schema cache. Call this after running DDL.
+
+    @param engine: Engine whose entry is dropped; None drops every entry
+    @param schema: Schema of the entry to drop; None means the engine's default database
+    """
+    schema_cache.invalidate(engine, schema)
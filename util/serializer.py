@@ -0,0 +1,172 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from util.CustomJSONEncoder import CustomJSONEncoder
+
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성, 없으면 표준 json으로 동작
+    orjson = None
+
+DEFAULT_SERIALIZE_CHUNK_SIZE = 500
+
+SERIALIZER_BACKEND = 'orjson' if orjson is not None else 'json'
+
+
+def default(obj: Any) -> Any:
+    """
+    Converts the values the JSON encoders do not know, exactly like util.CustomJSONEncoder:
+    date/datetime/timedelta -> str(), Decimal -> float.
+
+    @param obj: Value that could not be serialized
+    @return: JSON serializable replacement
+    @raise TypeError: If the value is not supported
+    """
+    if isinstance(obj, (date, timedelta)):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    def dumps(obj: Any) -> bytes:
+        """
+        Serializes obj to UTF-8 JSON bytes in a single pass.
+
+        @param obj: Object to serialize
+        @return: JSON document as bytes
+        """
+        # datetime도 default()로 넘겨서 ISO 'T' 구분자 대신 str()과 같은 형식이 나오게 한다
+        return orjson.dumps(obj, default=default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+else:
+    _encoder = CustomJSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+    def dumps(obj: Any) -> bytes:
+        """
+        Serializes obj to UTF-8 JSON bytes in a single pass.
+
+        @param obj: Object to serialize
+        @return: JSON document as bytes
+        """
+        return _encoder.encode(obj).encode('utf-8')
+
+
+def iter_ndjson(rows: Iterable[Dict], chunk_size: int = DEFAULT_SERIALIZE_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Serializes rows as newline delimited JSON, chunk_size rows per yielded chunk.
+
+    @param rows: Iterable of row dictionaries
+    @param chunk_size: Number of rows per yielded bytes chunk
+    @return: Generator yielding bytes chunks
+    """
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield b''.join(dumps(row) + b'\n' for row in chunk)
+
+
+def iter_json_array(rows: Iterable[Dict], chunk_size: int = DEFAULT_SERIALIZE_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Serializes rows as one JSON array, chunk_size rows per yielded chunk, without holding the whole array.
+
+    @param rows: Iterable of row dictionaries
+    @param chunk_size: Number of rows per yielded bytes chunk
+    @return: Generator yielding bytes chunks whose concatenation is a JSON array
+    """
+    rows = iter(rows)
+    separator = b'['
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        yield separator + b','.join(dumps(row) for row in chunk)
+        separator = b','
+    yield b']' if separator == b',' else b'[]'
+
+
+# 값 종류 -> (값 -> JSON 값, JSON 값 -> 값). 표준 JSON에 없는 타입도 손실 없이 되돌릴 수 있다
+TYPED_VALUE_CODECS: Dict[str, Tuple[Callable[[Any], Any], Callable[[Any], Any]]] = {
+    'bool': (bool, bool),
+    'int': (int, int),
+    'float': (float, float),
+    'str': (str, str),
+    'decimal': (str, Decimal),
+    'datetime': (datetime.isoformat, datetime.fromisoformat),
+    'date': (date.isoformat, date.fromisoformat),
+    'time': (time.isoformat, time.fromisoformat),
+    'timedelta': (timedelta.total_seconds, lambda seconds: timedelta(seconds=seconds))
+}
+# isinstance 검사 순서: bool은 int, datetime은 date의 subclass
+_TYPED_VALUE_TYPES = (('bool', bool), ('datetime', datetime), ('date', date), ('time', time),
+                      ('timedelta', timedelta), ('decimal', Decimal), ('float', float), ('int', int), ('str', str))
+# JSON이 그대로 담을 수 있는 종류
+_PLAIN_KINDS = ('bool', 'int', 'float', 'str')
+
+
+def typed_value_kind(value: Any) -> str:
+    """
+    Returns the TYPED_VALUE_CODECS kind of a value.
+
+    @raise ValueError: If the value has no codec
+    """
+    for kind, value_type in _TYPED_VALUE_TYPES:
+        if isinstance(value, value_type):
+            return kind
+    raise ValueError(f"Unsupported value type: {type(value).__name__}")
+
+
+def encode_typed_value(value: Any) -> List:
+    """
+    Converts a value into a JSON serializable [kind, value] pair (see decode_typed_value()).
+    """
+    kind = typed_value_kind(value)
+    return [kind, TYPED_VALUE_CODECS[kind][0](value)]
+
+
+def decode_typed_value(pair: Sequence) -> Any:
+    """
+    Converts a [kind, value] pair from encode_typed_value() back into the value.
+
+    @raise ValueError: If the pair is malformed
+    """
+    try:
+        kind, encoded = pair
+        return TYPED_VALUE_CODECS[kind][1](encoded)
+    except (TypeError, ValueError, KeyError, ArithmeticError):
+        raise ValueError(f"Invalid typed value: {pair!r}")
+
+
+def encode_typed_column(values: Sequence[Any]) -> List:
+    """
+    Converts a column of values (None allowed) into a JSON serializable [kind, values] pair.
+    A column with one kind stores its values once; mixed columns store a [kind, value] pair per value.
+    """
+    kinds = {typed_value_kind(value) for value in values if value is not None}
+    if len(kinds) > 1:
+        return ['mixed', [None if value is None else encode_typed_value(value) for value in values]]
+    kind = kinds.pop() if kinds else 'str'
+    if kind in _PLAIN_KINDS:
+        return [kind, list(values)]
+    encode = TYPED_VALUE_CODECS[kind][0]
+    return [kind, [None if value is None else encode(value) for value in values]]
+
+
+def decode_typed_column(pair: Sequence) -> List[Any]:
+    """
+    Converts a [kind, values] pair from encode_typed_column() back into the column values.
+
+    @raise ValueError: If the pair is malformed
+    """
+    try:
+        kind, values = pair
+        if kind == 'mixed':
+            return [None if value is None else decode_typed_value(value) for value in values]
+        decode = TYPED_VALUE_CODECS[kind][1]
+        return [None if value is None else decode(value) for value in values]
+    except (TypeError, ValueError, KeyError, ArithmeticError):
+        raise ValueError("Invalid typed column")
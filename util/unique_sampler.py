@@ -0,0 +1,206 @@
+import hashlib
+import random
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+from faker import Faker
+
+FEISTEL_ROUNDS = 4
+# 곱셈 hash의 상수 (2^64 / golden ratio, 홀수)
+_MIX_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+# 이보다 적게 뽑을 때는 numpy 배열을 만드는 비용이 더 크다
+_VECTOR_TAKE_MIN = 16
+# next_index()가 한 번에 미리 섞어두는 위치 수
+_NEXT_INDEX_BLOCK = 256
+
+
+class UniqueSampler:
+    def __init__(self, capacity: int, seed: int, offset: int = 0, name: str = 'value'):
+        """
+        Draws distinct indexes from range(capacity) without replacement and without retries.
+
+        The k-th drawn index is permute(offset + k), where permute is a keyed Feistel network over the smallest
+        power of two domain holding capacity values, cycle-walked back into range(capacity). That is a
+        permutation of the domain, so every draw is O(1) (a few rounds on average) and never collides, and
+        consecutive draws show no arithmetic pattern. Two samplers with the same seed and capacity but
+        disjoint [offset, offset + n) ranges never return the same index, which lets parallel shards stay
+        unique without merging.
+
+        @param capacity: Number of distinct values in the domain
+        @param seed: Seed choosing the permutation
+        @param offset: Position in the permutation to start drawing from
+        @param name: Name of the sampled column, used in error messages
+        @raise ValueError: If capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError(f"Domain of {name} is empty")
+
+        rng = random.Random(seed)
+        self.capacity = capacity
+        self.name = name
+        # index = (left << right_bits) | right, 도메인은 capacity의 2배 미만이라 cycle walking은 평균 2번 이하
+        bits = max(2, (capacity - 1).bit_length())
+        self._left_bits = bits // 2
+        self._right_bits = bits - self._left_bits
+        self._round_keys = [rng.getrandbits(64) for _ in range(FEISTEL_ROUNDS)]
+        self._position = offset
+        # next_index()가 미리 섞어둔 다음 위치들의 index (뒤에서부터 꺼낸다)
+        self._pending: List[int] = []
+
+    def ensure_capacity(self, n: int) -> None:
+        """
+        Fails fast if n more values can not be drawn.
+
+        @param n: Number of values the caller is going to draw
+        @raise ValueError: If the domain has fewer than n values left
+        """
+        if self._position + n > self.capacity:
+            raise ValueError(
+                f"Cannot generate {self._position + n} unique {self.name} values: "
+                f"the domain only has {self.capacity} values"
+            )
+
+    def permute(self, position: int) -> int:
+        """
+        Maps a permutation position to its index (see permute_range() for the vectorized version).
+
+        @param position: Position in range(capacity)
+        @return: Index in range(capacity)
+        """
+        right_bits, capacity = self._right_bits, self.capacity
+        right_mask, left_shift, right_shift = (1 << right_bits) - 1, 64 - self._left_bits, 64 - right_bits
+        even_keys, odd_keys = self._round_keys[0::2], self._round_keys[1::2]
+        index = position
+        while True:
+            left, right = index >> right_bits, index & right_mask
+            # 반씩 번갈아 섞는다: 양쪽 폭이 달라도 각 round가 가역이라 전체가 permutation이다
+            for even_key, odd_key in zip(even_keys, odd_keys):
+                left ^= (((right ^ even_key) * _MIX_MULTIPLIER) & _MASK64) >> left_shift
+                right ^= (((left ^ odd_key) * _MIX_MULTIPLIER) & _MASK64) >> right_shift
+            index = (left << right_bits) | right
+            # Feistel 도메인은 capacity보다 클 수 있으므로 범위 안에 들어올 때까지 다시 섞는다 (cycle walking)
+            if index < capacity:
+                return index
+
+    def next_index(self) -> int:
+        """
+        Draws the next distinct index.
+
+        @return: Index in range(capacity)
+        @raise ValueError: If the domain is exhausted
+        """
+        if not self._pending:
+            self.ensure_capacity(1)
+            count = min(_NEXT_INDEX_BLOCK, self.capacity - self._position)
+            self._pending = self.permute_range(self._position, count)[::-1]
+        self._position += 1
+        return self._pending.pop()
+
+    def take(self, n: int) -> List[int]:
+        """
+        Draws the next n distinct indexes, the same ones n next_index() calls would return.
+
+        @param n: Number of indexes to draw
+        @return: List of indexes in range(capacity)
+        @raise ValueError: If the domain has fewer than n values left
+        """
+        self.ensure_capacity(n)
+        start = self._position
+        self._position += n
+        # next_index()가 미리 섞어둔 위치부터 쓴다
+        pending = min(n, len(self._pending))
+        head = [self._pending.pop() for _ in range(pending)]
+        return head + self.permute_range(start + pending, n - pending)
+
+    def permute_range(self, start: int, n: int) -> List[int]:
+        """
+        Maps the positions [start, start + n) to their indexes, vectorized with numpy.
+
+        @param start: First position
+        @param n: Number of positions; start + n must not exceed capacity
+        @return: List of indexes in range(capacity)
+        """
+        if n < _VECTOR_TAKE_MIN:
+            return [self.permute(position) for position in range(start, start + n)]
+
+        right_bits = np.uint64(self._right_bits)
+        right_mask = np.uint64((1 << self._right_bits) - 1)
+        left_shift, right_shift = np.uint64(64 - self._left_bits), np.uint64(64 - self._right_bits)
+        multiplier = np.uint64(_MIX_MULTIPLIER)
+        keys = [np.uint64(key) for key in self._round_keys]
+
+        def feistel(index: np.ndarray) -> np.ndarray:
+            left, right = index >> right_bits, index & right_mask
+            for even_key, odd_key in zip(keys[0::2], keys[1::2]):
+                # uint64 곱셈은 2^64로 wrap 되므로 permute()의 & _MASK64와 같다
+                left ^= ((right ^ even_key) * multiplier) >> left_shift
+                right ^= ((left ^ odd_key) * multiplier) >> right_shift
+            return (left << right_bits) | right
+
+        indexes = feistel(np.arange(start, start + n, dtype=np.uint64))
+        outside = indexes >= self.capacity
+        while outside.any():
+            indexes[outside] = feistel(indexes[outside])
+            outside = indexes >= self.capacity
+        return indexes.tolist()
+
+
+def derive_seed(unique_key: int, name: str) -> int:
+    """
+    Derives a per-column permutation seed that is stable across processes (unlike hash()).
+
+    @param unique_key: Shared key of a generation run
+    @param name: Column name
+    @return: 64-bit seed
+    """
+    digest = hashlib.blake2b(f"{unique_key}:{name}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+def make_unique_sampler(fake: Faker, name: str, capacity: int, unique_key: Optional[int] = None,
+                        offset: int = 0) -> UniqueSampler:
+    """
+    Creates the UniqueSampler for one unique column of a generator.
+
+    @param fake: Faker object; its random state seeds the permutation when unique_key is None
+    @param name: Column name
+    @param capacity: Number of distinct values in the column's domain
+    @param unique_key: Shared key of a sharded generation run (see parallel_generator); None for a single run
+    @param offset: First permutation position of this shard
+    @return: UniqueSampler for the column
+    """
+    seed = fake.random.getrandbits(64) if unique_key is None else derive_seed(unique_key, name)
+    return UniqueSampler(capacity, seed, offset, name)
+
+
+def index_to_string(index: int, charset: str, length: int) -> str:
+    """
+    Maps an index in range(len(charset) ** length) to a distinct fixed-length string.
+
+    @param index: Index to map
+    @param charset: Characters that may appear in the string
+    @param length: Length of the string
+    @return: String of length characters
+    """
+    base = len(charset)
+    characters = []
+    for _ in range(length):
+        index, digit = divmod(index, base)
+        characters.append(charset[digit])
+    return ''.join(characters)
+
+
+def string_domain(charset: str, length: int) -> Callable[[int], str]:
+    """
+    Returns the index -> value mapping of the domain of all charset strings with the given length.
+    The capacity of the domain is len(charset) ** length.
+    """
+    return lambda index: index_to_string(index, charset, length)
+
+
+def sequence_domain(values: Sequence) -> Callable[[int], object]:
+    """
+    Returns the index -> value mapping of a fixed list of distinct values. The capacity is len(values).
+    """
+    return values.__getitem__
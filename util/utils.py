@@ -16,6 +16,7 @@ from util.dummy_generators import (
     generate_airplane_type_data,
     generate_airport_reachable_data
 )
+from util.faker_pool import pooled_faker
 
 
 def table_mapper() -> Dict[str, Callable]:
@@ -45,3 +46,21 @@ def table_mapper() -> Dict[str, Callable]:
         'passengerdetails': generate_passengerdetails_data,
         'weatherdata': generate_weatherdata_data
     }
+
+
+
+def check_generate_num(table_name: str, n: int) -> None:
+    """
+    Fails fast if the generator of a table can not produce n rows, before any row is generated or inserted.
+
+    Runs the generator for 0 rows at permutation offset n: its unique column samplers then raise
+    the same ValueError they would raise after n rows (see util.unique_sampler.UniqueSampler.ensure_capacity()).
+
+    @param table_name: Name of the table (key of table_mapper())
+    @param n: Number of rows that will be generated
+    @raise ValueError: If the table is unknown or one of its unique columns has fewer than n distinct values
+    """
+    if table_name not in table_mapper():
+        raise ValueError(f"Invalid table_name: {table_name}")
+    with pooled_faker() as fake:
+        list(table_mapper()[table_name](fake, 0, None, n))
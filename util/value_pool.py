@@ -0,0 +1,115 @@
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from faker import Faker
+
+from util.faker_pool import DEFAULT_LOCALE
+from util.vectorized import to_db_values
+
+# 값 하나에 Faker 호출 하나가 들어가므로 pool을 만드는 데 field마다 수백 ms가 걸린다 (process마다 한 번)
+VALUE_POOL_SIZE = int(os.environ.get('VALUE_POOL_SIZE', 5000))
+# pool 내용은 항상 같은 seed로 만든다. 행마다 어떤 값을 뽑을지는 generator의 rng가 정하므로 seed 재현성은 유지된다
+VALUE_POOL_SEED = 0
+
+
+def make_zipcode(fake: Faker) -> int:
+    """
+    Draws a zip code that fits the SMALLINT zip columns (0 ~ 32767).
+    """
+    zipcode = int(fake.zipcode())
+    while not 0 <= zipcode <= 32767:
+        zipcode = int(fake.zipcode())
+    return zipcode
+
+
+# pool 이름 -> 값 하나를 만드는 함수
+VALUE_POOL_FIELDS: Dict[str, Callable[[Faker], Any]] = {
+    'first_name': lambda fake: fake.first_name(),
+    'last_name': lambda fake: fake.last_name(),
+    'user_name': lambda fake: fake.user_name(),
+    'street_address': lambda fake: fake.street_address(),
+    'city': lambda fake: fake.city(),
+    'country': lambda fake: fake.country(),
+    'zipcode': make_zipcode,
+    'company_email': lambda fake: fake.company_email(),
+    'telephone': lambda fake: fake.country_calling_code() + fake.basic_phone_number()
+}
+
+_pools: Dict[Tuple[str, str, int, int], np.ndarray] = {}
+_pools_lock = threading.Lock()
+
+
+def get_value_pool(field: str, locale: str = DEFAULT_LOCALE, seed: int = VALUE_POOL_SEED,
+                   size: int = VALUE_POOL_SIZE) -> np.ndarray:
+    """
+    Returns the pool of a Faker field: size values drawn once per process through Faker's provider machinery.
+    Sampling the pool keeps Faker's value distribution (including its weighted names) at the cost of
+    at most size distinct values.
+
+    @param field: Name of the pool (key of VALUE_POOL_FIELDS)
+    @param locale: Faker locale the values are drawn with
+    @param seed: Seed of the Faker object drawing the values, so every process builds the same pool
+    @param size: Number of values in the pool
+    @return: Object array of the values (shared, do not modify)
+    @raise ValueError: If the field has no pool
+    """
+    if field not in VALUE_POOL_FIELDS:
+        raise ValueError(f"No value pool for {field}")
+
+    key = (field, locale, seed, size)
+    with _pools_lock:
+        pool = _pools.get(key)
+    if pool is not None:
+        return pool
+
+    make_value = VALUE_POOL_FIELDS[field]
+    # FakerPool의 인스턴스를 seed 하면 다른 unseeded 사용자가 그 고정된 random 상태를 이어받으므로 따로 만든다
+    fake = Faker(locale)
+    fake.seed_instance(seed)
+    pool = np.empty(size, dtype=object)
+    pool[:] = [make_value(fake) for _ in range(size)]
+
+    with _pools_lock:
+        # 동시에 만든 경우 먼저 저장된 pool을 쓴다 (같은 seed라 내용도 같다)
+        return _pools.setdefault(key, pool)
+
+
+def pool_column(rng: np.random.Generator, field: str, n: int, locale: str = DEFAULT_LOCALE,
+                weights: Optional[np.ndarray] = None, mask: Optional[np.ndarray] = None) -> List[Any]:
+    """
+    Draws n values of a Faker field at once by sampling an index array into its pool.
+
+    @param rng: NumPy random Generator (see util.vectorized.make_rng())
+    @param field: Name of the pool (key of VALUE_POOL_FIELDS)
+    @param n: Number of values
+    @param locale: Faker locale of the pool
+    @param weights: Optional probability of every pool entry (length VALUE_POOL_SIZE, summing to 1)
+    @param mask: Optional NULL mask (see util.vectorized.null_mask())
+    @return: List of n values (None where mask is True)
+    """
+    pool = get_value_pool(field, locale)
+    if weights is None:
+        indexes = rng.integers(0, len(pool), size=n)
+    else:
+        indexes = rng.choice(len(pool), size=n, p=weights)
+    return to_db_values(pool[indexes], mask)
+
+
+def warm_value_pools(locale: str = DEFAULT_LOCALE) -> None:
+    """
+    Builds every pool of a locale up front, so the first generation does not pay for them.
+
+    @param locale: Faker locale of the pools
+    """
+    for field in VALUE_POOL_FIELDS:
+        get_value_pool(field, locale)
+
+
+def clear_value_pools() -> None:
+    """
+    Drops every materialized pool, e.g. after VALUE_POOL_FIELDS changed.
+    """
+    with _pools_lock:
+        _pools.clear()
@@ -0,0 +1,207 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+from faker import Faker
+
+DEFAULT_BATCH_SIZE = 1000
+
+# fake.date() / fake.date_time() 와 같은 범위 (1970-01-01 ~ 현재)
+EPOCH = np.datetime64('1970-01-01', 's')
+
+# generator가 "현재"로 사용하는 시각. seed로 재현 가능한 생성을 할 때는 고정된다 (see pinned_reference_time())
+_reference_time: ContextVar[Optional[datetime]] = ContextVar('reference_time', default=None)
+
+
+def reference_now() -> datetime:
+    """
+    Returns the time the generators treat as "now": the pinned reference time, or datetime.now() if none is pinned.
+    """
+    moment = _reference_time.get()
+    return datetime.now() if moment is None else moment
+
+
+@contextmanager
+def pinned_reference_time(moment: Optional[datetime]) -> Iterator[None]:
+    """
+    Pins reference_now() to a fixed time in the current thread, so ranges like "1970-01-01 ~ now" do not
+    move between two runs. Rows must be generated inside the block; None leaves the clock unpinned.
+
+    @param moment: Time to use as "now", or None
+    """
+    token = _reference_time.set(moment)
+    try:
+        yield
+    finally:
+        _reference_time.reset(token)
+
+
+def make_rng(fake: Faker) -> np.random.Generator:
+    """
+    Creates a NumPy Generator seeded from the Faker object's random state,
+    so seeding the Faker instance also makes the vectorized columns reproducible.
+
+    @param fake: Faker object used to generate fake data
+    @return: NumPy random Generator
+    """
+    return np.random.default_rng(fake.random.getrandbits(64))
+
+
+def integer_column(rng: np.random.Generator, low: int, high: int, n: int) -> np.ndarray:
+    """
+    Generates n integers in [low, high] (both inclusive, like random.randint).
+    """
+    return rng.integers(low, high, size=n, endpoint=True)
+
+
+def decimal_column(rng: np.random.Generator, max_value: float, decimal_place: int, n: int) -> np.ndarray:
+    """
+    Generates n non-negative decimals up to max_value, rounded to decimal_place digits.
+    """
+    return np.round(rng.uniform(0, max_value, size=n), decimal_place)
+
+
+def decimal_digits_column(rng: np.random.Generator, left_digits: int, right_digits: int, n: int) -> np.ndarray:
+    """
+    Generates n positive decimals that fit DECIMAL(left_digits + right_digits, right_digits),
+    the vectorized counterpart of fake.pydecimal(left_digits=..., right_digits=..., positive=True).
+    """
+    return decimal_column(rng, 10 ** left_digits - 10 ** -right_digits, right_digits, n)
+
+
+def datetime_column(rng: np.random.Generator, n: int, start: Optional[np.datetime64] = None,
+                    end: Optional[np.datetime64] = None) -> np.ndarray:
+    """
+    Generates n datetime64[s] values uniformly in [start, end] (default: 1970-01-01 ~ now).
+    """
+    start = EPOCH if start is None else np.datetime64(start, 's')
+    end = np.datetime64(reference_now(), 's') if end is None else np.datetime64(end, 's')
+    span = (end - start).astype(np.int64)
+    return start + rng.integers(0, span, size=n, endpoint=True).astype('timedelta64[s]')
+
+
+def datetime_after_column(rng: np.random.Generator, start: np.ndarray,
+                          end: Optional[np.datetime64] = None) -> np.ndarray:
+    """
+    Generates one datetime64[s] value in [start[i], end] for every start value,
+    the vectorized counterpart of fake.date_time_between(start_date=start[i]).
+    """
+    end = np.datetime64(reference_now(), 's') if end is None else np.datetime64(end, 's')
+    span = np.maximum((end - start).astype(np.int64), 0)
+    return start + (rng.random(size=len(start)) * span).astype('timedelta64[s]')
+
+
+def date_column(rng: np.random.Generator, n: int, start: Optional[np.datetime64] = None,
+                end: Optional[np.datetime64] = None) -> np.ndarray:
+    """
+    Generates n datetime64[D] values uniformly in [start, end] (default: 1970-01-01 ~ today).
+    """
+    return datetime_column(rng, n, start, end).astype('datetime64[D]')
+
+
+def time_column(rng: np.random.Generator, n: int) -> np.ndarray:
+    """
+    Generates n times of day as seconds since midnight.
+    """
+    return rng.integers(0, 86400, size=n)
+
+
+def enum_column(rng: np.random.Generator, values: Sequence[Any], n: int,
+                weights: Optional[Sequence[float]] = None) -> np.ndarray:
+    """
+    Samples n values from the enum values by drawing an index array, uniformly or with the given weights
+    (the vectorized counterpart of random.choices(values, weights)).
+    """
+    if weights is None:
+        indexes = rng.integers(0, len(values), size=n)
+    else:
+        probabilities = np.asarray(weights, dtype=np.float64)
+        indexes = rng.choice(len(values), size=n, p=probabilities / probabilities.sum())
+    return np.asarray(values, dtype=object)[indexes]
+
+
+def string_column(rng: np.random.Generator, charset: str, length: int, n: int) -> np.ndarray:
+    """
+    Generates n random strings of length characters from charset, one index matrix for the whole batch.
+    """
+    characters = np.array(list(charset), dtype='<U1')
+    return characters[rng.integers(0, len(characters), size=(n, length))].view(f'<U{length}').ravel()
+
+
+def null_mask(rng: np.random.Generator, n: int, probability: float = 0.5) -> np.ndarray:
+    """
+    Returns a boolean mask that is True (-> NULL) with the given probability,
+    the vectorized counterpart of `value if random.choice([True, False]) else None`.
+    """
+    return rng.random(size=n) < probability
+
+
+def to_db_values(column: np.ndarray, mask: Optional[np.ndarray] = None) -> List[Any]:
+    """
+    Converts a column batch to DB-ready Python values at the insert boundary.
+
+    int64 -> int, float64 -> float, datetime64[D] -> date, datetime64[s] -> datetime.
+    Where mask is True the value becomes None.
+
+    @param column: NumPy array produced by one of the column kernels
+    @param mask: Optional NULL mask (see null_mask())
+    @return: List of Python values
+    """
+    values = column.tolist()
+    if mask is not None:
+        values = [None if is_null else value for value, is_null in zip(values, mask.tolist())]
+    return values
+
+
+def to_time_values(seconds: np.ndarray) -> List[time]:
+    """
+    Converts seconds since midnight (see time_column()) to datetime.time values.
+    """
+    return [time(second // 3600, second // 60 % 60, second % 60) for second in seconds.tolist()]
+
+
+def make_column_kernel(type_detail: Dict[str, Any]) -> Optional[Callable[[np.random.Generator, int], List[Any]]]:
+    """
+    Returns a batch generator for a column, the vectorized counterpart of dummy_generators.make_column_generator().
+
+    Only non-unique INTEGER/SMALLINT/MEDIUMINT/TINYINT, DECIMAL, DATE, TIME, DATETIME and ENUM columns
+    have a kernel; for every other column (strings, unique or primary key columns) None is returned and
+    the caller keeps the scalar generator.
+
+    @param type_detail: Column type details (see row_plan.get_column_type_detail())
+    @return: Function (rng, n) -> list of n DB-ready values, or None
+    """
+    data_type = type_detail['type']
+    size = type_detail['size']
+    decimal_place = type_detail.get('decimal_place')
+    if type_detail.get('primary') == 'True' or type_detail.get('unique') == 'True':
+        return None
+
+    if data_type in ["INTEGER", "SMALLINT", "MEDIUMINT", "TINYINT"]:
+        low, high = (1, 20001) if data_type != "TINYINT" else (0, 2)
+        return lambda rng, n: to_db_values(integer_column(rng, low, high, n))
+
+    elif data_type in ["DECIMAL"]:
+        if size and decimal_place:
+            max_value = 10 ** (size - decimal_place) - 1
+            return lambda rng, n: to_db_values(decimal_column(rng, max_value, decimal_place, n))
+        return lambda rng, n: to_db_values(decimal_column(rng, 10000, 2, n))
+
+    elif data_type in ["DATE"]:
+        return lambda rng, n: to_db_values(date_column(rng, n))
+
+    elif data_type in ["TIME"]:
+        return lambda rng, n: to_time_values(time_column(rng, n))
+
+    elif data_type in ["DATETIME"]:
+        return lambda rng, n: to_db_values(datetime_column(rng, n))
+
+    elif data_type in ["ENUM"]:
+        enum_values = type_detail.get('enum_values')
+        if enum_values:
+            return lambda rng, n: to_db_values(enum_column(rng, enum_values, n))
+        return lambda rng, n: [None] * n
+
+    return None
@@ -0,0 +1,74 @@
+"""
+Generation job worker: claims jobs queued by /generate/table and /generate/all and runs them.
+
+usage: python worker.py [--processes 1] [--poll-interval 1.0] [--metrics-port 9100]
+
+With --metrics-port every worker process serves its Prometheus metrics (generation, insert, pool)
+on its own port: metrics-port + worker number.
+"""
+import argparse
+import multiprocessing
+import os
+import socket
+from typing import Optional
+
+from prometheus_client import start_http_server
+
+from config.DatabaseInfo import DatabaseInfo
+from config.database_engines import dispose_engines, get_engine
+from util.job_queue import DEFAULT_POLL_INTERVAL, work
+from util.value_pool import warm_value_pools
+
+
+def run_worker(index: int, poll_interval: float, metrics_port: Optional[int] = None) -> None:
+    """
+    Runs one worker loop with this process's shared engine (engines must not be shared between processes).
+
+    @param index: Worker number, part of the worker name stored in claimed jobs
+    @param poll_interval: Seconds to wait before polling again when the queue is empty
+    @param metrics_port: Optional base port; the worker serves its metrics on metrics_port + index
+    """
+    if metrics_port is not None:
+        start_http_server(metrics_port + index)
+    warm_value_pools()
+    engine = get_engine(DatabaseInfo())
+    worker_name = f"{socket.gethostname()}:{os.getpid()}:{index}"
+    try:
+        work(engine, worker_name, poll_interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        dispose_engines()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--processes', type=int, default=1, help='number of worker processes')
+    parser.add_argument('--poll-interval', type=float, default=DEFAULT_POLL_INTERVAL,
+                        help='seconds between polls when the queue is empty')
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help='serve Prometheus metrics on this port (+ worker number)')
+    args = parser.parse_args()
+
+    if args.processes == 1:
+        run_worker(0, args.poll_interval, args.metrics_port)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=run_worker, args=(index, args.poll_interval, args.metrics_port),
+                        name=f"generation-worker-{index}")
+        for index in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join()
+
+
+if __name__ == '__main__':
+    main()